@@ -25,6 +25,10 @@ def pytest_runtest_setup(item):
         elif item.get_closest_marker("lxml_required"):
             if not LXML:
                 pytest.skip("LXML is required for some features such as schema validation")
+        elif item.get_closest_marker("lxml_iterparse_required"):
+            from openpyxl.xml import LXML_ITERPARSE
+            if not LXML_ITERPARSE:
+                pytest.skip("LXML iterparse must be enabled")
         elif item.get_closest_marker("lxml_buffering"):
             from lxml.etree import LIBXML_VERSION
             if LIBXML_VERSION < (3, 4, 0, 0):
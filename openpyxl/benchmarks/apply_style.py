@@ -0,0 +1,50 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Time styling a range of cells with ws.apply_style(), compared with setting
+the styles of each cell.
+
+    python openpyxl/benchmarks/apply_style.py [rows] [columns]
+"""
+
+import sys
+import time
+
+from openpyxl import Workbook
+from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+
+FONT = Font(bold=True)
+FILL = PatternFill("solid", fgColor="DDDDDD")
+NUMBER_FORMAT = "#,##0.00"
+
+
+def per_cell(ws, cell_range):
+    for row in ws[cell_range]:
+        for cell in row:
+            cell.font = FONT
+            cell.fill = FILL
+            cell.number_format = NUMBER_FORMAT
+
+
+def apply_style(ws, cell_range):
+    ws.apply_style(cell_range, font=FONT, fill=FILL, number_format=NUMBER_FORMAT)
+
+
+def timed(func, rows, cols):
+    ws = Workbook().active
+    for idx in range(rows):
+        ws.append(range(cols))
+    cell_range = f"A1:{get_column_letter(cols)}{rows}"
+    start = time.perf_counter()
+    func(ws, cell_range)
+    taken = time.perf_counter() - start
+    print(f"{func.__name__:<12} {taken:6.2f}s {rows * cols / taken:12,.0f} cells/s")
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    cols = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    for func in (apply_style, per_cell):
+        timed(func, rows, cols)
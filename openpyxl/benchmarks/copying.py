@@ -0,0 +1,52 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Time copying objects with copy(), compared with the previous round trip
+through XML, for a stylesheet and a chart plot area.
+
+    python openpyxl/benchmarks/copying.py [repeat]
+"""
+
+import os
+import sys
+import time
+from copy import copy
+
+from openpyxl.xml.functions import fromstring
+from openpyxl.styles.stylesheet import Stylesheet
+from openpyxl.chart.plotarea import PlotArea
+
+
+HERE = os.path.dirname(os.path.dirname(__file__))
+
+SOURCES = [
+    (Stylesheet, "styles/tests/data/complex-styles.xml"),
+    (PlotArea, "chart/tests/data/3D_plotarea.xml"),
+]
+
+
+def round_trip(obj):
+    xml = obj.to_tree()
+    cp = obj.__class__.from_tree(xml)
+    for k in obj.__dict__:
+        if k not in obj.__attrs__ and k not in obj.__elements__:
+            setattr(cp, k, copy(getattr(obj, k)))
+    return cp
+
+
+def timed(func, obj, path, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(obj)
+    taken = time.perf_counter() - start
+    name = os.path.basename(path)
+    print(f"{name:<28} {func.__name__:<12} {taken:6.2f}s {repeat / taken:10,.0f} /s")
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for cls, path in SOURCES:
+        with open(os.path.join(HERE, path), "rb") as src:
+            obj = cls.from_tree(fromstring(src.read()))
+        for func in (copy, round_trip):
+            timed(func, obj, path, repeat)
@@ -0,0 +1,74 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Time calculating the formulae of a worksheet and calculating them again
+after a cell has been changed.
+
+    python openpyxl/benchmarks/evaluate.py [rows]
+"""
+
+import sys
+import time
+
+from openpyxl import Workbook
+from openpyxl.formula.evaluator import Evaluator
+
+
+def make_workbook(rows):
+    wb = Workbook()
+    ws = wb.active
+    for row in range(1, rows + 1):
+        ws.append([
+            row,
+            row % 7,
+            f"=A{row}*B{row}",
+            f'=IF(C{row}>500,"high","low")',
+            f"=VLOOKUP(MOD(A{row},100),$G$1:$H$100,2,FALSE)",
+            f"=C{row}/SUM($C$1:$C${rows})",
+        ])
+    for row in range(1, 101):
+        ws.cell(row, 7, row - 1)
+        ws.cell(row, 8, f"code{row - 1}")
+    return wb
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    wb = make_workbook(rows)
+    ws = wb.active
+    formulae = rows * 4
+
+    ev, taken = timed(Evaluator, wb)
+    print(f"compile    {formulae:>9,} formulae {taken:8.3f}s")
+    _, taken = timed(ev.calculate)
+    print(f"calculate  {formulae:>9,} formulae {taken:8.3f}s")
+
+    ws["H10"] = "changed"
+    start = time.perf_counter()
+    ev.changed(ws["H10"])
+    dirty = len(ev._dirty)
+    ev.calculate()
+    taken = time.perf_counter() - start
+    print(f"lookup     {dirty:>9,} formulae {taken:8.3f}s")
+
+    ws["B5"] = 3
+    start = time.perf_counter()
+    ev.changed(ws["B5"])
+    dirty = len(ev._dirty)
+    ev.calculate()
+    taken = time.perf_counter() - start
+    print(f"input      {dirty:>9,} formulae {taken:8.3f}s")
+
+    ws["J1"] = 1
+    start = time.perf_counter()
+    ev.changed("J1")
+    dirty = len(ev._dirty)
+    ev.calculate()
+    taken = time.perf_counter() - start
+    print(f"unrelated  {dirty:>9,} formulae {taken:8.3f}s")
@@ -0,0 +1,43 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Time creating objects from XML with Serialisable.from_tree for a stylesheet
+and pivot table definitions.
+
+    python openpyxl/benchmarks/from_tree.py [repeat]
+"""
+
+import os
+import sys
+import time
+
+from openpyxl.xml.functions import fromstring
+from openpyxl.styles.stylesheet import Stylesheet
+from openpyxl.pivot.cache import CacheDefinition
+from openpyxl.pivot.table import TableDefinition
+
+
+HERE = os.path.dirname(os.path.dirname(__file__))
+
+SOURCES = [
+    (Stylesheet, "styles/tests/data/complex-styles.xml"),
+    (Stylesheet, "styles/tests/data/dxf_style.xml"),
+    (CacheDefinition, "pivot/tests/data/pivotCacheDefinition.xml"),
+    (TableDefinition, "pivot/tests/data/pivotTable.xml"),
+]
+
+
+def timed(cls, path, repeat):
+    with open(os.path.join(HERE, path), "rb") as src:
+        tree = fromstring(src.read())
+    start = time.perf_counter()
+    for _ in range(repeat):
+        cls.from_tree(tree)
+    taken = time.perf_counter() - start
+    print(f"{os.path.basename(path):<28} {taken:6.2f}s {repeat / taken:10,.0f} /s")
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    for cls, path in SOURCES:
+        timed(cls, path, repeat)
@@ -0,0 +1,54 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Time inserting and deleting rows and columns at the top of large worksheets
+with both ways of storing cells, and with a column of formulae which have to
+be updated.
+
+    python openpyxl/benchmarks/insert_rows.py [rows]
+"""
+
+import sys
+import time
+
+from openpyxl import Workbook
+
+
+COLUMNS = 10
+
+
+def make_worksheet(rows, columnar_cells, formulae=False):
+    wb = Workbook(columnar_cells=columnar_cells)
+    ws = wb.active
+    for idx in range(1, rows + 1):
+        row = [idx] * COLUMNS
+        if formulae:
+            row.append(f"=SUM(A{idx}:J{idx})*$A$1")
+        ws.append(row)
+    ws.merge_cells(start_row=rows // 2, start_column=1, end_row=rows // 2 + 1, end_column=2)
+    return ws
+
+
+def timed(ws, method, *args, **kw):
+    start = time.perf_counter()
+    getattr(ws, method)(*args, **kw)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for columnar_cells in (False, True):
+        for formulae in (False, True):
+            ws = make_worksheet(rows, columnar_cells, formulae)
+            name = "columnar" if columnar_cells else "cells"
+            if formulae:
+                name += "+formulae"
+            for method, args, kw in [
+                ("insert_rows", (2,), {}),
+                ("delete_rows", (2,), {}),
+                ("insert_cols", (2,), {}),
+                ("delete_cols", (2,), {}),
+                ("move_range", (f"A1:K{rows}", 1, 1), {"translate": formulae}),
+            ]:
+                taken = timed(ws, method, *args, **kw)
+                print(f"{name:<18} {method:<12} {rows:>9,} rows {taken:8.3f}s")
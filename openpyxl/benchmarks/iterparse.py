@@ -0,0 +1,107 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Time parsing worksheets and shared strings with the standard library and the
+lxml iterparse backends. The backend is chosen when openpyxl is imported so
+each one is timed in a separate process.
+
+    python openpyxl/benchmarks/iterparse.py [rows]
+"""
+
+import os
+import subprocess
+import sys
+import time
+from glob import glob
+from io import BytesIO
+from tempfile import NamedTemporaryFile
+from zipfile import ZipFile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+
+BACKENDS = {
+    "etree": {"OPENPYXL_LXML_ITERPARSE": "False"},
+    "lxml": {"OPENPYXL_LXML_ITERPARSE": "True"},
+}
+
+STRINGS = "xl/sharedStrings.xml"
+
+
+def make_workbook(filename, rows):
+    """
+    Workbook with a large worksheet and shared strings table. Strings in the
+    worksheet are written inline so the table is added separately.
+    """
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True, share_strings=False)
+    ws = wb.create_sheet()
+    for idx in range(rows):
+        ws.append([idx, idx * 1.5, f"row {idx % 1000}", "text", idx % 7 == 0])
+    wb.save(filename)
+
+    items = "".join(f"<si><t>string {idx}</t></si>" for idx in range(rows))
+    xml = f"""<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">{items}</sst>"""
+    with ZipFile(filename, "a") as archive:
+        archive.writestr(STRINGS, xml)
+
+
+def parts(filename):
+    """
+    Worksheets and shared strings in a workbook
+    """
+    with ZipFile(filename) as archive:
+        for name in archive.namelist():
+            if name.startswith("xl/worksheets/sheet") or name == STRINGS:
+                yield name, archive.read(name)
+
+
+def parse(filenames):
+    from openpyxl.reader.strings import read_string_table
+    from openpyxl.worksheet._reader import WorkSheetParser
+
+    workbooks = [dict(parts(f)) for f in filenames]
+    strings = worksheets = 0
+    for sources in workbooks:
+        start = time.perf_counter()
+        shared_strings = []
+        if STRINGS in sources:
+            shared_strings = read_string_table(BytesIO(sources.pop(STRINGS)))
+        strings += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for data in sources.values():
+            parser = WorkSheetParser(BytesIO(data), shared_strings)
+            for row in parser.parse():
+                pass
+        worksheets += time.perf_counter() - start
+    return strings, worksheets
+
+
+def run(backend, filenames):
+    env = dict(os.environ, **BACKENDS[backend])
+    result = subprocess.run(
+        [sys.executable, __file__, "--parse"] + filenames,
+        env=env, capture_output=True, text=True, check=True
+    )
+    return [float(v) for v in result.stdout.split()]
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--parse"]:
+        print(*parse(sys.argv[2:]))
+        sys.exit()
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    test_data = sorted(glob(os.path.join(ROOT, "**", "tests", "data", "*.xlsx"), recursive=True))
+    test_data = [f for f in test_data if os.path.getsize(f)]
+    with NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+        filename = tmp.name
+    try:
+        make_workbook(filename, rows)
+        for label, filenames in [("test data", test_data), (f"{rows} rows", [filename])]:
+            for backend in BACKENDS:
+                strings, worksheets = run(backend, filenames)
+                print(f"{label:<12} {backend:<6} strings {strings:6.2f}s worksheets {worksheets:6.2f}s")
+    finally:
+        os.remove(filename)
@@ -0,0 +1,40 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Time appending rows to a worksheet while reading its dimensions, compared
+with finding the largest row by looking at every cell as was done before
+the bounds were kept up to date.
+
+    python openpyxl/benchmarks/max_row.py [rows] [columns]
+"""
+
+import sys
+import time
+
+from openpyxl import Workbook
+
+
+def max_row(ws):
+    return ws.max_row
+
+
+def scan_cells(ws):
+    return max(ws._cells)[0]
+
+
+def timed(func, rows, cols):
+    ws = Workbook().active
+    start = time.perf_counter()
+    for idx in range(rows):
+        ws.append(range(cols))
+        if func(ws) != idx + 1:
+            raise ValueError(f"{func.__name__} is wrong")
+    taken = time.perf_counter() - start
+    print(f"{func.__name__:<12} {taken:6.2f}s {rows / taken:10,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    cols = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    for func in (max_row, scan_cells):
+        timed(func, rows, cols)
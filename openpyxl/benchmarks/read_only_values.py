@@ -0,0 +1,55 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Rows per second when reading values from a worksheet in read-only mode,
+compared with reading the values from the cells.
+
+    python openpyxl/benchmarks/read_only_values.py [rows] [columns]
+"""
+
+import os
+import sys
+import time
+from tempfile import NamedTemporaryFile
+
+from openpyxl import Workbook, load_workbook
+
+
+def make_workbook(filename, rows, cols):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for idx in range(rows):
+        ws.append([idx * col if col % 2 else f"row {idx}" for col in range(cols)])
+    wb.save(filename)
+
+
+def read_cells(ws):
+    for row in ws.iter_rows():
+        tuple(c.value for c in row)
+
+
+def read_values(ws):
+    for row in ws.iter_rows(values_only=True):
+        pass
+
+
+def timed(func, filename, rows):
+    wb = load_workbook(filename, read_only=True)
+    start = time.perf_counter()
+    func(wb.active)
+    taken = time.perf_counter() - start
+    wb.close()
+    print(f"{func.__name__:<12} {taken:6.2f}s {rows / taken:10,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cols = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    with NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+        filename = tmp.name
+    try:
+        make_workbook(filename, rows, cols)
+        for func in (read_cells, read_values):
+            timed(func, filename, rows)
+    finally:
+        os.remove(filename)
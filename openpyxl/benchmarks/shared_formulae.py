@@ -0,0 +1,70 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Time parsing a worksheet in which columns of cells share formulae, as Excel
+writes formulae which have been filled down, and saving such a worksheet with
+and without sharing the formulae.
+
+    python openpyxl/benchmarks/shared_formulae.py [rows]
+"""
+
+import sys
+import time
+from io import BytesIO
+
+from openpyxl import Workbook
+from openpyxl.worksheet._reader import WorkSheetParser
+
+
+FORMULAE = [
+    "A{row}*2",
+    "SUM(A{row}:B{row})*$A$1",
+    "IF(A{row}>B{row},VLOOKUP(A{row},Lookup!$A$1:$D$100,2,FALSE),C{row}&\" \"&D{row})",
+]
+
+
+def make_worksheet(rows):
+    xml = [
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<sheetData>'
+    ]
+    for row in range(1, rows + 1):
+        cells = [f'<c r="A{row}"><v>{row}</v></c><c r="B{row}"><v>{row}</v></c>']
+        for idx, formula in enumerate(FORMULAE):
+            coord = f'{"CDE"[idx]}{row}'
+            if row == 1:
+                text = formula.format(row=row).replace("&", "&amp;").replace('"', "&quot;")
+                ref = f'{"CDE"[idx]}1:{"CDE"[idx]}{rows}'
+                cells.append(f'<c r="{coord}"><f t="shared" ref="{ref}" si="{idx}">{text}</f><v>0</v></c>')
+            else:
+                cells.append(f'<c r="{coord}"><f t="shared" si="{idx}"/><v>0</v></c>')
+        xml.append(f'<row r="{row}">{"".join(cells)}</row>')
+    xml.append('</sheetData></worksheet>')
+    return "".join(xml).encode("utf-8")
+
+
+def save(rows, share_formulae):
+    wb = Workbook(share_formulae=share_formulae)
+    ws = wb.active
+    for row in range(1, rows + 1):
+        ws.append([row, row] + [f"={formula.format(row=row)}" for formula in FORMULAE])
+    out = BytesIO()
+    start = time.perf_counter()
+    wb.save(out)
+    return time.perf_counter() - start, len(out.getvalue())
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    src = make_worksheet(rows)
+    start = time.perf_counter()
+    parser = WorkSheetParser(BytesIO(src), [])
+    for row in parser.parse():
+        pass
+    taken = time.perf_counter() - start
+    cells = rows * len(FORMULAE)
+    print(f"{cells:,} shared formulae {taken:6.2f}s {cells / taken:10,.0f} cells/s")
+
+    for share_formulae in (False, True):
+        taken, size = save(rows, share_formulae)
+        print(f"save share_formulae={share_formulae!s:<5} {taken:6.2f}s {size:12,} bytes")
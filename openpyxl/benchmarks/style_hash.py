@@ -0,0 +1,49 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Time looking up the styles of a stylesheet in the lists of a workbook, which
+hashes and compares them, as happens whenever a cell is styled. Lookups of
+frozen styles, which keep their hashes, are timed as well.
+
+    python openpyxl/benchmarks/style_hash.py [repeat]
+"""
+
+import os
+import sys
+import time
+from copy import copy
+
+from openpyxl.xml.functions import fromstring
+from openpyxl.styles.stylesheet import Stylesheet
+from openpyxl.utils.indexed_list import IndexedList
+
+
+HERE = os.path.dirname(os.path.dirname(__file__))
+SOURCE = "styles/tests/data/complex-styles.xml"
+
+
+def timed(name, styles, repeat, frozen=False):
+    table = IndexedList(copy(s) for s in styles)
+    if frozen:
+        name = f"{name} (frozen)"
+        for style in table:
+            style.freeze()
+        for style in styles:
+            style.freeze()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for style in styles:
+            table.add(style)
+    taken = time.perf_counter() - start
+    count = repeat * len(styles)
+    print(f"{name:<24} {taken:6.2f}s {count / taken:12,.0f} lookups/s")
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    with open(os.path.join(HERE, SOURCE), "rb") as src:
+        stylesheet = Stylesheet.from_tree(fromstring(src.read()))
+    for name in ("fonts", "fills", "borders", "alignments", "protections"):
+        styles = list(getattr(stylesheet, name))
+        timed(name, styles, repeat)
+        timed(name, styles, repeat, frozen=True)
@@ -18,13 +18,19 @@ def _set_attributes(cell, styled=None):
     if styled:
         attrs['s'] = f"{cell.style_id}"
 
+    value = cell._value
+
     if cell.data_type == "s":
         attrs['t'] = "inlineStr"
+        strings = cell.parent.parent._string_table
+        if strings is not None and isinstance(value, str) and value:
+            idx = strings.add(value)
+            if idx is not None:
+                attrs['t'] = "s"
+                value = idx
     elif cell.data_type != 'f':
         attrs['t'] = cell.data_type
 
-    value = cell._value
-
     if cell.data_type == "d":
         if hasattr(value, "tzinfo") and value.tzinfo is not None:
             raise TypeError("Excel does not support timezones in datetimes. "
@@ -42,7 +48,7 @@ def _set_attributes(cell, styled=None):
     return value, attrs
 
 
-def etree_write_cell(xf, worksheet, cell, styled=None):
+def etree_write_cell(xf, worksheet, cell, styled=None, shared=None):
 
     value, attributes = _set_attributes(cell, styled)
 
@@ -62,12 +68,17 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
             attrib = dict(value)
             value = None
 
+        elif shared is not None:
+            attrib = shared
+            if "ref" not in shared:
+                value = None # only the master cell has the formula
+
         formula = SubElement(el, 'f', attrib)
         if value is not None and not attrib.get('t') == "dataTable":
             formula.text = value[1:]
             value = None
 
-    if cell.data_type == 's':
+    if attributes.get('t') == "inlineStr":
         if isinstance(value, CellRichText):
             el.append(value.to_tree())
         else:
@@ -86,7 +97,7 @@ def etree_write_cell(xf, worksheet, cell, styled=None):
     xf.write(el)
 
 
-def lxml_write_cell(xf, worksheet, cell, styled=False):
+def lxml_write_cell(xf, worksheet, cell, styled=False, shared=None):
     value, attributes = _set_attributes(cell, styled)
 
     if value == '' or value is None:
@@ -105,12 +116,17 @@ def lxml_write_cell(xf, worksheet, cell, styled=False):
                 attrib = dict(value)
                 value = None
 
+            elif shared is not None:
+                attrib = shared
+                if "ref" not in shared:
+                    value = None # only the master cell has the formula
+
             with xf.element('f', attrib):
                 if value is not None and not attrib.get('t') == "dataTable":
                     xf.write(value[1:])
                     value = None
 
-        if cell.data_type == 's':
+        if attributes.get('t') == "inlineStr":
             if isinstance(value, CellRichText):
                 el = value.to_tree()
                 xf.write(el)
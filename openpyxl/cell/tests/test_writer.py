@@ -239,6 +239,28 @@ def test_array_formula(worksheet, write_cell_implementation):
     assert diff is None, diff
 
 
+@pytest.mark.parametrize("shared, expected",
+                         [
+                             ({"t": "shared", "ref": "C2:C9", "si": "0"},
+                              """<c r="C2"><f t="shared" ref="C2:C9" si="0">A2*2</f><v/></c>"""),
+                             ({"t": "shared", "si": "0"},
+                              """<c r="C2"><f t="shared" si="0"/><v/></c>"""),
+                         ])
+def test_shared_formula(worksheet, write_cell_implementation, shared, expected):
+    write_cell = write_cell_implementation
+    ws = worksheet
+    cell = ws["C2"]
+    cell.value = "=A2*2"
+
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        write_cell(xf, ws, cell, shared=shared)
+
+    xml = out.getvalue()
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
 def test_rich_text(worksheet, write_cell_implementation):
     write_cell = write_cell_implementation
     ws = worksheet
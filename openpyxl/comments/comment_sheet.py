@@ -170,6 +170,10 @@ class CommentSheet(Serialisable):
         return tree
 
 
+    def write_xml(self, xf):
+        self._write_xml(xf, xmlns=SHEET_MAIN_NS)
+
+
     @property
     def comments(self):
         """
@@ -55,4 +55,5 @@ class MetaSerialisable(type):
             methods['__nested__'] = tuple(sorted(nested))
         if methods.get('__elements__') is None:
             methods['__elements__'] = tuple(sorted(elements))
+        methods['__parser__'] = None # created when first needed
         return MetaStrict.__new__(cls, clsname, bases, methods)
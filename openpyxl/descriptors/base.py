@@ -8,12 +8,38 @@ http://chimera.labs.oreilly.com/books/1230000000393/ch08.html#_discussiuncion_13
 
 import datetime
 import re
+import threading
+from contextlib import contextmanager
 
 from openpyxl import DEBUG
 from openpyxl.utils.datetime import from_ISO8601
 
 from .namespace import namespaced
 
+
+class _Validation(threading.local):
+
+    enabled = True
+
+_validation = _Validation()
+
+
+@contextmanager
+def unvalidated():
+    """
+    Skip checking that values are valid, for instance whether numbers are
+    within range or strings match patterns, while objects are created from a
+    trusted source in this thread. Values are still converted to the
+    expected types.
+    """
+    enabled = _validation.enabled
+    _validation.enabled = False
+    try:
+        yield
+    finally:
+        _validation.enabled = enabled
+
+
 class Descriptor:
 
     def __init__(self, name=None, **kw):
@@ -37,7 +63,7 @@ class Typed(Descriptor):
         self.__doc__ = f"Values must be of type {self.expected_type}"
 
     def __set__(self, instance, value):
-        if not isinstance(value, self.expected_type):
+        if not isinstance(value, self.expected_type) and _validation.enabled:
             if (not self.allow_none
                 or (self.allow_none and value is not None)):
                 msg = f"{instance.__class__}.{self.name} should be {self.expected_type} but value is {type(value)}"
@@ -69,7 +95,11 @@ class Convertible(Typed):
         if ((self.allow_none and value is not None)
             or not self.allow_none):
             value = _convert(self.expected_type, value)
-        super().__set__(instance, value)
+        if _validation.enabled:
+            super().__set__(instance, value)
+        else:
+            # the type has already been checked
+            Descriptor.__set__(self, instance, value)
 
 
 class Max(Convertible):
@@ -84,8 +114,8 @@ class Max(Convertible):
         super().__init__(**kw)
 
     def __set__(self, instance, value):
-        if ((self.allow_none and value is not None)
-            or not self.allow_none):
+        if _validation.enabled and (
+            (self.allow_none and value is not None) or not self.allow_none):
             value = _convert(self.expected_type, value)
             if value > self.max:
                 raise ValueError('Max value is {0}'.format(self.max))
@@ -104,8 +134,8 @@ class Min(Convertible):
         super().__init__(**kw)
 
     def __set__(self, instance, value):
-        if ((self.allow_none and value is not None)
-            or not self.allow_none):
+        if _validation.enabled and (
+            (self.allow_none and value is not None) or not self.allow_none):
             value = _convert(self.expected_type, value)
             if value < self.min:
                 raise ValueError('Min value is {0}'.format(self.min))
@@ -128,7 +158,7 @@ class Set(Descriptor):
         self.__doc__ = "Value must be one of {0}".format(self.values)
 
     def __set__(self, instance, value):
-        if value not in self.values:
+        if _validation.enabled and value not in self.values:
             raise ValueError(self.__doc__)
         super().__set__(instance, value)
 
@@ -197,7 +227,7 @@ class Length(Descriptor):
 
 
     def __set__(self, instance, value):
-        if len(value) != self.length:
+        if _validation.enabled and len(value) != self.length:
             raise ValueError("Value must be length {0}".format(self.length))
         super().__set__(instance, value)
 
@@ -247,14 +277,15 @@ class MatchPattern(Descriptor):
 
 
     def __set__(self, instance, value):
+        if _validation.enabled:
 
-        if value is None and not self.allow_none:
-            raise ValueError("Value must not be none")
+            if value is None and not self.allow_none:
+                raise ValueError("Value must not be none")
 
-        if ((self.allow_none and value is not None)
-            or not self.allow_none):
-            if not self.test_pattern.match(value):
-                raise ValueError('Value does not match pattern {0}'.format(self.pattern))
+            if ((self.allow_none and value is not None)
+                or not self.allow_none):
+                if not self.test_pattern.match(value):
+                    raise ValueError('Value does not match pattern {0}'.format(self.pattern))
 
         super().__set__(instance, value)
 
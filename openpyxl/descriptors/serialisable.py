@@ -9,11 +9,14 @@ from . import MetaSerialisable
 from .sequence import (
     Sequence,
     NestedSequence,
+    MultiSequence,
     MultiSequencePart,
 )
 from .namespace import namespaced
 
 from openpyxl.compat import safe_string
+from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.xml.constants import REL_NS
 from openpyxl.xml.functions import (
     Element,
     localname,
@@ -21,6 +24,185 @@ from openpyxl.xml.functions import (
 
 seq_types = (list, tuple)
 
+_immutable = frozenset([str, int, float, bool, type(None)])
+_containers = frozenset([list, tuple, set, IndexedList])
+
+
+def _copy_value(value, memo):
+    """
+    Copy of an attribute or child element without any mutable parts in
+    common with the original
+    """
+    cls = type(value)
+    if cls in _immutable:
+        return value
+    elif cls in _containers:
+        return cls(_copy_value(v, memo) for v in value)
+    return _copy_extra(value, memo)
+
+
+def _copy_extra(value, memo):
+    """
+    Copy of a non-persisted value. Serialisable objects share the memo so
+    that any references back to the object being copied are kept.
+    """
+    if getattr(type(value), "__copy__", None) is Serialisable.__copy__:
+        return value._copy(memo)
+    return copy(value)
+
+# prefixes registered for namespaced attributes, which elements being
+# streamed must declare themselves
+_PREFIXES = {REL_NS: "r"}
+
+
+def _node_text(node):
+    return node.text
+
+
+def _attribute_name(key):
+    """
+    Name of the argument for an attribute or None for attributes with
+    unknown namespaces
+    """
+    if key.startswith('{'):
+        return
+    elif key in KEYWORDS:
+        return "_" + key
+    elif "-" in key:
+        return key.replace("-", "_")
+    return key
+
+
+class _Parser:
+
+    """
+    Arguments for creating objects of a class from XML.
+
+    How each attribute and child element is converted is worked out the first
+    time it is seen and kept for the class.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.text = "attr_text" in cls.__attrs__
+        self.namespaced = {ns: _attribute_name(key) for key, ns in cls.__namespaced__}
+        self.attributes = dict(self.namespaced)
+        self.children = {}
+
+
+    def _child(self, node):
+        """
+        Conversion of a child element, the argument it is stored in and
+        whether there can be several of them. None if it is ignored.
+        """
+        tag = localname(node)
+        if tag in KEYWORDS:
+            tag = "_" + tag
+        desc = getattr(self.cls, tag, None)
+        if desc is None or isinstance(desc, property):
+            return
+
+        if hasattr(desc, 'from_tree'):
+            #descriptor manages conversion
+            convert = desc.from_tree
+        elif hasattr(desc.expected_type, "from_tree"):
+            #complex type
+            convert = desc.expected_type.from_tree
+        else:
+            #primitive
+            convert = _node_text
+
+        if isinstance(desc, NestedSequence):
+            return convert, tag, False
+        elif isinstance(desc, Sequence):
+            return convert, tag, True
+        elif isinstance(desc, MultiSequencePart):
+            return convert, desc.store, True
+        return convert, tag, False
+
+
+    def parse(self, node):
+        attributes = self.attributes
+        attrib = {}
+        for key, value in node.attrib.items():
+            try:
+                name = attributes[key]
+            except KeyError:
+                name = attributes[key] = _attribute_name(key)
+            if name is not None:
+                attrib[name] = value
+
+        # known namespaces take precedence
+        if self.namespaced:
+            values = node.attrib
+            for ns, name in self.namespaced.items():
+                if ns in values:
+                    attrib[name] = values[ns]
+
+        if self.text and node.text:
+            attrib["attr_text"] = node.text
+
+        children = self.children
+        for el in node:
+            try:
+                child = children[el.tag]
+            except KeyError:
+                child = children[el.tag] = self._child(el)
+            if child is None:
+                continue
+
+            convert, name, many = child
+            obj = convert(el)
+            if many:
+                if name in attrib:
+                    attrib[name].append(obj)
+                else:
+                    attrib[name] = [obj]
+            else:
+                attrib[name] = obj
+
+        return attrib
+
+def _write_node(xf, node):
+    xf.write(node)
+
+
+_customised = {}
+
+
+def _is_customised(cls):
+    """
+    Whether objects of the class change the elements they are serialised to
+    without also changing how they are written
+    """
+    result = _customised.get(cls)
+    if result is None:
+        write_xml = getattr(cls, "write_xml", None)
+        result = _customised[cls] = write_xml is None or (
+            cls.to_tree is not Serialisable.to_tree
+            and write_xml is Serialisable.write_xml
+        )
+    return result
+
+
+def _write_object(xf, obj, args=(), kw={}):
+    """
+    Write an object that is a child of another, with the same arguments that
+    to_tree() would be called with. Customised objects are converted to
+    elements first.
+    """
+    if _is_customised(type(obj)):
+        xf.write(obj.to_tree(*args, **kw))
+    else:
+        obj.write_xml(xf, *args, **kw)
+
+
+def _write_container(xf, tagname, attrs, objects):
+    with xf.element(tagname, attrs):
+        for obj in objects:
+            _write_object(xf, obj)
+
+
 class Serialisable(metaclass=MetaSerialisable):
     """
     Objects can serialise to XML their attributes and child objects.
@@ -48,59 +230,10 @@ class Serialisable(metaclass=MetaSerialisable):
         """
         Create object from XML
         """
-        # strip known namespaces from attributes
-        attrib = dict(node.attrib)
-        for key, ns in cls.__namespaced__:
-            if ns in attrib:
-                attrib[key] = attrib[ns]
-                del attrib[ns]
-
-        # strip attributes with unknown namespaces
-        for key in list(attrib):
-            if key.startswith('{'):
-                del attrib[key]
-            elif key in KEYWORDS:
-                attrib["_" + key] = attrib[key]
-                del attrib[key]
-            elif "-" in key:
-                n = key.replace("-", "_")
-                attrib[n] = attrib[key]
-                del attrib[key]
-
-        if node.text and "attr_text" in cls.__attrs__:
-            attrib["attr_text"] = node.text
-
-        for el in node:
-            tag = localname(el)
-            if tag in KEYWORDS:
-                tag = "_" + tag
-            desc = getattr(cls, tag, None)
-            if desc is None or isinstance(desc, property):
-                continue
-
-            if hasattr(desc, 'from_tree'):
-                #descriptor manages conversion
-                obj = desc.from_tree(el)
-            else:
-                if hasattr(desc.expected_type, "from_tree"):
-                    #complex type
-                    obj = desc.expected_type.from_tree(el)
-                else:
-                    #primitive
-                    obj = el.text
-
-            if isinstance(desc, NestedSequence):
-                attrib[tag] = obj
-            elif isinstance(desc, Sequence):
-                attrib.setdefault(tag, [])
-                attrib[tag].append(obj)
-            elif isinstance(desc, MultiSequencePart):
-                attrib.setdefault(desc.store, [])
-                attrib[desc.store].append(obj)
-            else:
-                attrib[tag] = obj
-
-        return cls(**attrib)
+        parser = cls.__parser__
+        if parser is None:
+            parser = cls.__parser__ = _Parser(cls)
+        return cls(**parser.parse(node))
 
 
     def to_tree(self, tagname=None, idx=None, namespace=None):
@@ -157,6 +290,116 @@ class Serialisable(metaclass=MetaSerialisable):
         return el
 
 
+    def write_xml(self, xf, tagname=None, idx=None, namespace=None):
+        """
+        Write the object to an xmlfile. This produces the same XML as
+        to_tree() but child objects are written as they are reached instead
+        of building a tree of elements first.
+        """
+        if (
+            _is_customised(self.__class__)
+            or getattr(self, "namespace", None) or namespace is not None
+        ):
+            # the subclass changes the element or the element needs the
+            # prefixes that only serialising a tree provides
+            kw = {"tagname":tagname, "idx":idx, "namespace":namespace}
+            xf.write(self.to_tree(**{k:v for k, v in kw.items() if v is not None}))
+            return
+        self._write_xml(xf, tagname, namespace)
+
+
+    def _write_xml(self, xf, tagname=None, namespace=None, **extra):
+        if tagname is None:
+            tagname = self.tagname
+
+        # keywords have to be masked
+        if tagname.startswith("_"):
+            tagname = tagname[1:]
+
+        tagname = namespaced(self, tagname, namespace)
+        namespace = getattr(self, "namespace", namespace)
+
+        attrs = dict(self)
+        nsmap = {}
+        for key, ns in self.__namespaced__:
+            if key in attrs:
+                attrs[ns] = attrs[key]
+                del attrs[key]
+                uri = ns[1:ns.index("}")]
+                if uri in _PREFIXES:
+                    nsmap[_PREFIXES[uri]] = uri
+        attrs.update(extra)
+
+        text = None
+        if "attr_text" in self.__attrs__:
+            text = safe_string(getattr(self, "attr_text"))
+
+        children = ()
+        if self.__elements__:
+            children = list(self._children(namespace))
+        if not children:
+            el = Element(tagname, attrs)
+            if text is not None:
+                el.text = text
+            xf.write(el)
+            return
+
+        with xf.element(tagname, attrs, nsmap=nsmap or None):
+            if text:
+                xf.write(text)
+            for write, args in children:
+                write(xf, *args)
+
+
+    def _children(self, namespace):
+        """
+        How each child element is written: either as an element or by
+        writing the object itself
+        """
+        for child_tag in self.__elements__:
+            desc = getattr(self.__class__, child_tag, None)
+            obj = getattr(self, child_tag)
+            if hasattr(desc, "namespace") and hasattr(obj, 'namespace'):
+                obj.namespace = desc.namespace
+
+            if isinstance(obj, seq_types):
+                if isinstance(desc, NestedSequence):
+                    # wrap sequence in container
+                    if not obj:
+                        continue
+                    if type(desc).to_tree is NestedSequence.to_tree:
+                        attrs = {}
+                        if desc.count:
+                            attrs['count'] = str(len(obj))
+                        tagname = namespaced(desc, child_tag, namespace)
+                        yield _write_container, (tagname, attrs, obj)
+                    else:
+                        yield _write_node, (desc.to_tree(child_tag, obj, namespace),)
+                elif isinstance(desc, Sequence):
+                    # sequence
+                    desc.idx_base = self.idx_base
+                    if (type(desc).to_tree is Sequence.to_tree
+                        and all(hasattr(v, "to_tree") for v in obj)):
+                        for idx, v in enumerate(obj, desc.idx_base):
+                            yield _write_object, (v, (child_tag, idx))
+                    elif type(desc).to_tree is MultiSequence.to_tree:
+                        for v in obj:
+                            yield _write_object, (v, (), {"namespace":namespace})
+                    else:
+                        for node in desc.to_tree(child_tag, obj, namespace):
+                            yield _write_node, (node,)
+                else: # property
+                    for v in obj:
+                        yield _write_object, (v, (child_tag, namespace))
+            else:
+                if child_tag in self.__nested__:
+                    node = desc.to_tree(child_tag, obj, namespace)
+                    if node is not None:
+                        yield _write_node, (node,)
+                elif obj is not None:
+                    yield _write_object, (obj, (child_tag,))
+
+
     def __iter__(self):
         for attr in self.__attrs__:
             value = getattr(self, attr)
@@ -229,12 +472,147 @@ class Serialisable(metaclass=MetaSerialisable):
 
 
     def __copy__(self):
-        # serialise to xml and back to avoid shallow copies
-        xml = self.to_tree(tagname="dummy")
-        cp = self.__class__.from_tree(xml)
+        return self._copy({})
+
+
+    def _copy(self, memo):
+        """
+        Copy the values of attributes and child elements so that nothing is
+        shared. The values are already valid so they are copied directly.
+        Objects that are reached more than once, such as parents referred to
+        by their children, are only copied once.
+        """
+        cp = memo.get(id(self))
+        if cp is not None:
+            return cp
+        cls = self.__class__
+        cp = memo[id(self)] = cls.__new__(cls)
+        attrs = self.__attrs__
+        elements = self.__elements__
+        values = cp.__dict__
+        extra = []
+        for k, v in self.__dict__.items():
+            if k in attrs or k in elements:
+                values[k] = _copy_value(v, memo)
+            else:
+                extra.append(k)
         # copy any non-persisted attributed
-        for k in self.__dict__:
-            if k not in self.__attrs__ + self.__elements__:
-                v = copy(getattr(self, k))
-                setattr(cp, k, v)
+        for k in extra:
+            setattr(cp, k, _copy_extra(getattr(self, k), memo))
+        return cp
+
+
+class Frozen:
+
+    """
+    Mixin for Serialisable classes, such as styles, whose objects are mostly
+    hashed and compared. Objects that have been frozen keep their hash and the
+    values it is based on until a value is set, so that objects equal to each
+    other can be matched without converting them. Objects are not frozen
+    unless freeze() is called.
+
+    The Frozen objects contained in a frozen object are also frozen. The kept
+    values are checked against theirs and those of the lists it contains so
+    that changing them, for example font.color.rgb, is noticed. Values are not
+    kept for objects containing other Serialisables.
+    """
+
+    def freeze(self):
+        """
+        Keep the hash of the object until its values change. Returns the
+        object.
+        """
+        self.__dict__.setdefault("_frozen", None)
+        return self
+
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        values = self.__dict__
+        if values.get("_frozen") is not None:
+            values["_frozen"] = None
+
+
+    def _copy(self, memo):
+        cp = super()._copy(memo)
+        cp.__dict__.pop("_frozen", None)
         return cp
+
+
+    def _freeze(self):
+        """
+        Work out the hash and values of the object, and keep them if they can
+        be checked
+        """
+        values = []
+        children = []
+        lists = []
+        frozen = True
+        for names in (self.__attrs__, self.__elements__):
+            for name in names:
+                value = getattr(self, name)
+                if isinstance(value, list):
+                    lists.append((value, tuple(value)))
+                    items = value
+                    value = tuple(value)
+                else:
+                    items = (value,)
+                for item in items:
+                    if isinstance(item, Frozen):
+                        children.append((item, item.freeze()._state()))
+                    elif isinstance(item, Serialisable):
+                        frozen = False # changes could not be noticed
+                values.append(value)
+        values = tuple(values)
+        state = (hash(values), values, children, lists)
+        if frozen:
+            self.__dict__["_frozen"] = state
+        return state
+
+
+    def _state(self):
+        """
+        The kept hash and values, worked out again if they or those of the
+        objects contained have changed. None if the object is not frozen.
+        """
+        values = self.__dict__
+        if "_frozen" not in values:
+            return
+        state = values["_frozen"]
+        if state is None:
+            return self._freeze()
+        for child, child_state in state[2]:
+            if child._state() is not child_state:
+                return self._freeze()
+        for items, kept in state[3]:
+            if tuple(items) != kept:
+                return self._freeze()
+        return state
+
+
+    def __hash__(self):
+        state = self._state()
+        if state is None:
+            return super().__hash__()
+        return state[0]
+
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        elif self.__class__ is other.__class__:
+            state = self._state()
+            if state is not None:
+                other_state = other._state()
+                if other_state is not None and state[1] == other_state[1]:
+                    return True
+        # values may differ but still be serialised in the same way
+        return super().__eq__(other)
+
+
+    def __getstate__(self):
+        # hashes of strings differ between processes
+        state = self.__dict__.copy()
+        if "_frozen" in state:
+            state["_frozen"] = None
+        return state
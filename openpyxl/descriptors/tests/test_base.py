@@ -253,6 +253,33 @@ class TestMinMax:
             min_max.value = 2
 
 
+    def test_unvalidated(self, min_max):
+        from ..base import unvalidated
+        with unvalidated():
+            min_max.value = "2"
+        assert min_max.value == 2.0
+        with pytest.raises(ValueError):
+            min_max.value = 2
+
+
+    def test_unvalidated_thread(self, min_max):
+        from threading import Thread
+        from ..base import unvalidated
+
+        errors = []
+        def assign():
+            try:
+                min_max.value = 2
+            except ValueError as e:
+                errors.append(e)
+
+        with unvalidated():
+            t = Thread(target=assign)
+            t.start()
+            t.join()
+        assert errors
+
+
 @pytest.fixture
 def set():
     from ..base import Set
@@ -1,5 +1,7 @@
 # Copyright (c) 2010-2024 openpyxl
 
+import os
+
 import pytest
 
 from openpyxl.xml.functions import fromstring, tostring
@@ -71,6 +73,83 @@ value='hello'"""
         assert d1.value is not d2.value
 
 
+    def test_copy_children(self, Parent, Node):
+        from copy import copy
+        p1 = Parent(count=2, node=[Node(True), Node(False)])
+        p2 = copy(p1)
+        assert p2 == p1
+        assert p2.node is not p1.node
+        assert all(n2 is not n1 for n1, n2 in zip(p1.node, p2.node))
+
+
+    def test_copy_extra(self, Parent, Node):
+        from copy import copy
+        n1 = Node(True)
+        p1 = Parent(node=[n1])
+        p1.cache = [1]
+        n1.parent = p1
+        p2 = copy(p1)
+        assert p2.cache == [1]
+        assert p2.cache is not p1.cache
+        assert p2.node[0].parent is p2
+
+
+def _load_test_data(package, filename, cls):
+    here = os.path.split(__file__)[0]
+    path = os.path.join(here, "..", "..", package, "tests", "data", filename)
+    with open(path, "rb") as src:
+        return cls.from_tree(fromstring(src.read()))
+
+
+@pytest.mark.parametrize("package, filename, cls",
+                         [
+                             ("styles", "complex-styles.xml", "openpyxl.styles.stylesheet.Stylesheet"),
+                             ("styles", "dxf_style.xml", "openpyxl.styles.stylesheet.Stylesheet"),
+                             ("styles", "rgb_colors.xml", "openpyxl.styles.stylesheet.Stylesheet"),
+                             ("chart", "chart1.xml", "openpyxl.chart.chartspace.ChartSpace"),
+                             ("chart", "chart_no_border.xml", "openpyxl.chart.chartspace.ChartSpace"),
+                             ("chart", "3D_plotarea.xml", "openpyxl.chart.plotarea.PlotArea"),
+                             ("chart", "bubblechart_plot_area.xml", "openpyxl.chart.plotarea.PlotArea"),
+                             ("chart", "scatterchart_plot_area.xml", "openpyxl.chart.plotarea.PlotArea"),
+                             ("drawing", "spreadsheet_drawing_with_chart.xml", "openpyxl.drawing.spreadsheet_drawing.SpreadsheetDrawing"),
+                             ("drawing", "spreadsheet_drawing_with_blip.xml", "openpyxl.drawing.spreadsheet_drawing.SpreadsheetDrawing"),
+                             ("drawing", "two_cell_anchor_group.xml", "openpyxl.drawing.spreadsheet_drawing.TwoCellAnchor"),
+                             ("comments", "comments1.xml", "openpyxl.comments.comment_sheet.CommentSheet"),
+                             ("pivot", "pivotTable.xml", "openpyxl.pivot.table.TableDefinition"),
+                             ("pivot", "pivotCacheDefinition.xml", "openpyxl.pivot.cache.CacheDefinition"),
+                             ("pivot", "pivotCacheRecords.xml", "openpyxl.pivot.record.RecordList"),
+                             ("workbook", "workbook.xml", "openpyxl.packaging.workbook.WorkbookPackage"),
+                             ("workbook", "defined_names.xml", "openpyxl.workbook.defined_name.DefinedNameList"),
+                             ("packaging", "core.xml", "openpyxl.packaging.core.DocumentProperties"),
+                             ("packaging", "manifest.xml", "openpyxl.packaging.manifest.Manifest"),
+                             ("worksheet", "sheetPr2.xml", "openpyxl.worksheet.properties.WorksheetProperties"),
+                         ]
+                         )
+def test_copy_test_data(package, filename, cls):
+    from copy import copy
+    from importlib import import_module
+    module, name = cls.rsplit(".", 1)
+    obj = _load_test_data(package, filename, getattr(import_module(module), name))
+    cp = copy(obj)
+    assert cp is not obj
+    assert tostring(cp.to_tree()) == tostring(obj.to_tree())
+
+
+@pytest.mark.parametrize("attr",
+                         ["page_setup", "page_margins", "print_options", "HeaderFooter",
+                          "sheet_properties", "sheet_format", "views"]
+                         )
+def test_copy_worksheet_objects(attr):
+    from copy import copy
+    from openpyxl.reader.excel import load_workbook
+    here = os.path.split(__file__)[0]
+    path = os.path.join(here, "..", "..", "reader", "tests", "data", "print_settings.xlsx")
+    obj = getattr(load_workbook(path).active, attr)
+    cp = copy(obj)
+    assert cp is not obj
+    assert tostring(cp.to_tree()) == tostring(obj.to_tree())
+
+
 @pytest.fixture
 def Relation(Serialisable):
     from ..excel import Relation
@@ -291,3 +370,246 @@ class TestExpectedTypes:
         node = fromstring(xml)
         obj = ExpectedTypes.from_tree(node)
         assert obj.value == "1"
+
+
+@pytest.fixture
+def Parent(Serialisable, Node):
+    from ..base import Integer
+    from ..sequence import Sequence
+
+    class Parent(Serialisable):
+
+        tagname = "parent"
+
+        count = Integer(allow_none=True)
+        node = Sequence(expected_type=Node)
+
+        def __init__(self, count=None, node=()):
+            self.count = count
+            self.node = node
+
+    return Parent
+
+
+class TestParser:
+
+
+    def test_sequence(self, Parent):
+        xml = """
+        <parent xmlns:x="http://example.com" count="2" x:count="5">
+          <node val="1"/><unknown /><node val="0"/>
+        </parent>
+        """
+        obj = Parent.from_tree(fromstring(xml))
+        assert obj.count == 2
+        assert len(obj.node) == 2
+
+
+    def test_cached(self, Parent):
+        Parent.from_tree(fromstring("<parent><node val='1'/></parent>"))
+        parser = Parent.__parser__
+        assert parser.cls is Parent
+
+        obj = Parent.from_tree(fromstring("<parent count='1'/>"))
+        assert Parent.__parser__ is parser
+        assert obj.count == 1
+        assert obj.node == []
+
+
+    def test_subclass(self, Parent):
+        Parent.from_tree(fromstring("<parent />"))
+
+        class Child(Parent):
+            pass
+
+        assert Child.__parser__ is None
+        obj = Child.from_tree(fromstring("<parent><node val='1'/></parent>"))
+        assert Child.__parser__.cls is Child
+        assert type(obj) is Child
+
+
+    def test_namespaced_precedence(self, Relation):
+        xml = """
+        <dummy xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+          r:rId="rId1" rId="rId2"/>
+        """
+        obj = Relation.from_tree(fromstring(xml))
+        assert obj.rId == "rId1"
+
+
+def write_xml(obj):
+    from io import BytesIO
+    from openpyxl.xml.functions import xmlfile
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        obj.write_xml(xf)
+    return out.getvalue()
+
+
+class TestWriteXML:
+
+
+    def test_sequence(self, Parent, Node):
+        obj = Parent(count=2, node=[Node(True), Node(False)])
+        xml = write_xml(obj)
+        assert xml == tostring(obj.to_tree())
+        expected = """<parent count="2"><node val="1"/><node val="0"/></parent>"""
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+
+
+    def test_empty(self, Parent):
+        obj = Parent()
+        xml = write_xml(obj)
+        assert xml == tostring(obj.to_tree())
+        assert b"</parent>" not in xml
+
+
+    def test_keyword_node(self, KeywordNode, Node):
+        obj = KeywordNode(_from=Node(True))
+        assert write_xml(obj) == tostring(obj.to_tree())
+
+
+    def test_namespaced_attribute(self, Serialisable, Node):
+        from ..base import Typed
+        from ..excel import Relation
+
+        class Container(Serialisable):
+
+            tagname = "container"
+
+            id = Relation()
+            node = Typed(expected_type=Node)
+
+            def __init__(self, id=None, node=None):
+                self.id = id
+                self.node = node
+
+        obj = Container(id="rId1", node=Node(True))
+        xml = write_xml(obj)
+        assert xml == tostring(obj.to_tree())
+        assert b'r:id="rId1"' in xml
+
+
+    def test_custom_to_tree(self, Parent, Node):
+
+        class Custom(Node):
+
+            def to_tree(self, tagname=None, idx=None, namespace=None):
+                tree = super().to_tree(tagname, idx, namespace)
+                tree.set("custom", "1")
+                return tree
+
+        obj = Parent(node=[Custom(True)])
+        xml = write_xml(obj)
+        assert xml == tostring(obj.to_tree())
+        assert b'custom="1"' in xml
+
+
+@pytest.fixture
+def Frozen(Serialisable, Node):
+    from ..base import Integer, Typed
+    from ..serialisable import Frozen
+
+    class Style(Frozen, Serialisable):
+
+        tagname = "style"
+
+        count = Integer(allow_none=True)
+        node = Typed(expected_type=Node, allow_none=True)
+
+        def __init__(self, count=None, node=None):
+            self.count = count
+            self.node = node
+
+    return Style
+
+
+class TestFrozen:
+
+
+    def test_not_frozen(self, Frozen):
+        s1 = Frozen(count=1)
+        h = hash(s1)
+        assert "_frozen" not in s1.__dict__
+        assert s1._state() is None
+        s1.count = 2
+        assert hash(s1) != h
+        assert s1 == Frozen(count=2)
+
+
+    def test_hash(self, Frozen, Node):
+        s1 = Frozen(count=1, node=Node(True)).freeze()
+        s2 = Frozen(count=1, node=Node(True))
+        assert hash(s1) == hash(s2)
+        # changes to the node could not be noticed
+        assert s1._frozen is None
+        s3 = Frozen(count=1).freeze()
+        h = hash(s3)
+        assert s3._frozen[0] == h
+        assert hash(Frozen(count=1)) == h
+
+
+    def test_set(self, Frozen):
+        s1 = Frozen(count=1).freeze()
+        h = hash(s1)
+        s1.count = 2
+        assert s1._frozen is None
+        assert hash(s1) != h
+        assert s1._frozen[0] == hash(s1)
+        assert s1 == Frozen(count=2)
+
+
+    def test_eq(self, Frozen, Node):
+        s1 = Frozen(count=1, node=Node(True)).freeze()
+        s2 = Frozen(count=1, node=Node(True)).freeze()
+        assert s1 == s2
+        s2.node.val = False
+        assert s1 != s2
+        assert Frozen(count=1) == Frozen(count=1).freeze()
+
+
+    def test_nested(self):
+        from openpyxl.styles import Font, Border, Side, GradientFill
+        from openpyxl.utils.indexed_list import IndexedList
+        font = Font(bold=True, color="FF0000").freeze()
+        fonts = IndexedList([font])
+        assert font.color._frozen is not None
+        font.color.rgb = "FF00FF00"
+        assert hash(font) == hash(Font(bold=True, color="FF00FF00"))
+        assert fonts.index(Font(bold=True, color="FF00FF00")) == 0
+        assert font != Font(bold=True, color="FF0000")
+
+        border = Border(left=Side(style="thin", color="FF0000")).freeze()
+        h = hash(border)
+        border.left.color.rgb = "FF00FF00"
+        assert hash(border) != h
+        assert border == Border(left=Side(style="thin", color="FF00FF00"))
+
+        fill = GradientFill(stop=["FF0000", "0000FF"]).freeze()
+        h = hash(fill)
+        fill.stop.append(fill.stop[0])
+        assert hash(fill) != h
+        h = hash(fill)
+        fill.stop[1].color.rgb = "FFFFFFFF"
+        assert hash(fill) != h
+
+
+    def test_copy(self, Frozen, Node):
+        from copy import copy
+        s1 = Frozen(count=1, node=Node(True)).freeze()
+        hash(s1)
+        s2 = copy(s1)
+        assert "_frozen" not in s2.__dict__
+        s2.node.val = False
+        assert s1 != s2
+
+
+    def test_pickle(self):
+        import pickle
+        from openpyxl.styles import Font
+        s1 = Font(bold=True).freeze()
+        hash(s1)
+        s2 = pickle.loads(pickle.dumps(s1))
+        assert s2._frozen is None
+        assert hash(s2) == hash(s1)
@@ -0,0 +1,764 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Calculate the values of the formulae of a workbook.
+
+Formulae are parsed with the tokenizer and compiled into Python functions.
+The cells and ranges each formula refers to are kept in a dependency graph,
+so that after cells have been edited only the formulae which depend upon
+them are calculated again.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from functools import partial
+
+from openpyxl.styles.numbers import is_date_format
+from openpyxl.utils.cell import coordinate_to_tuple, range_boundaries
+from openpyxl.utils.datetime import from_excel, to_excel
+from openpyxl.worksheet.formula import ArrayFormula
+
+from .functions import (
+    FUNCTIONS,
+    OPERATORS,
+    FormulaError,
+    Range,
+    NAME,
+    REF,
+    VALUE,
+    check,
+    scalar,
+    to_number,
+)
+from .references import CELL_RE, _template, split_sheet
+from .tokenizer import Tokenizer, Token, TokenizerError
+
+MAX_ROW = 1048576
+MAX_COLUMN = 16384
+
+# ranges at least this wide are not indexed by column
+WIDE = 64
+
+PRECEDENCE = {
+    "=": 1, "<>": 1, "<": 1, ">": 1, "<=": 1, ">=": 1,
+    "&": 2,
+    "+": 3, "-": 3,
+    "*": 4, "/": 4,
+    "^": 5,
+}
+
+
+class Parser:
+
+    """
+    Parse the tokens of a formula into a tree of tuples. References are
+    numbered in the order in which they appear rather than kept, so that
+    formulae which only differ in their references have the same tree.
+    """
+
+    def __init__(self, formula):
+        try:
+            tokens = Tokenizer(formula).items
+        except (TokenizerError, IndexError):
+            raise FormulaError(NAME)
+        self.tokens = [t for t in tokens if t.type != Token.WSPACE]
+        self.pos = 0
+        self.refs = 0
+
+
+    def parse(self):
+        if not self.tokens or self.tokens[0].type == Token.LITERAL:
+            raise FormulaError(NAME)
+        tree = self.expression(0)
+        if self.pos != len(self.tokens):
+            raise FormulaError(NAME) # e.g. unions and intersections
+        return tree
+
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+
+
+    def next(self):
+        token = self.peek()
+        if token is None:
+            raise FormulaError(NAME)
+        self.pos += 1
+        return token
+
+
+    def expression(self, precedence):
+        tree = self.unary()
+        while True:
+            token = self.peek()
+            if token is None or token.type != Token.OP_IN:
+                return tree
+            op_precedence = PRECEDENCE.get(token.value)
+            if op_precedence is None:
+                raise FormulaError(NAME)
+            if op_precedence < precedence:
+                return tree
+            self.pos += 1
+            tree = ("op", token.value, tree, self.expression(op_precedence + 1))
+
+
+    def unary(self):
+        token = self.next()
+        if token.type == Token.OP_PRE:
+            # negation is applied before any other operator, so -2^2 is 4
+            tree = self.unary()
+            if token.value == "-":
+                tree = ("neg", tree)
+            return tree
+        tree = self.operand(token)
+        while self.peek() is not None and self.peek().type == Token.OP_POST:
+            self.pos += 1
+            tree = ("percent", tree)
+        return tree
+
+
+    def operand(self, token):
+        if token.type == Token.OPERAND:
+            subtype = token.subtype
+            if subtype == Token.RANGE:
+                self.refs += 1
+                return ("ref", self.refs - 1)
+            if subtype == Token.NUMBER:
+                if token.value.isdigit():
+                    return ("value", int(token.value))
+                return ("value", float(token.value))
+            if subtype == Token.TEXT:
+                return ("value", token.value[1:-1].replace('""', '"'))
+            if subtype == Token.LOGICAL:
+                return ("value", token.value.upper() == "TRUE")
+            if subtype == Token.ERROR:
+                return ("error", token.value)
+
+        elif token.subtype == Token.OPEN:
+            if token.type == Token.FUNC:
+                return self.function(token)
+            if token.type == Token.PAREN:
+                tree = self.expression(0)
+                self.close(Token.PAREN)
+                return tree
+            if token.type == Token.ARRAY:
+                return self.array()
+
+        raise FormulaError(NAME)
+
+
+    def close(self, type_):
+        token = self.next()
+        if token.type != type_ or token.subtype != Token.CLOSE:
+            raise FormulaError(NAME)
+
+
+    def separator(self):
+        token = self.peek()
+        return token is not None and token.type == Token.SEP
+
+
+    def closer(self):
+        token = self.peek()
+        return token is not None and token.subtype == Token.CLOSE
+
+
+    def function(self, token):
+        name = token.value[:-1].upper()
+        for prefix in ("_XLFN.", "_XLWS."):
+            if name.startswith(prefix):
+                name = name[len(prefix):]
+        args = []
+        if self.closer():
+            self.close(Token.FUNC)
+            return ("func", name, args)
+        while True:
+            if self.separator() or self.closer():
+                args.append(("value", None)) # missing argument
+            else:
+                args.append(self.expression(0))
+            token = self.next()
+            if token.type == Token.FUNC and token.subtype == Token.CLOSE:
+                return ("func", name, args)
+            if token.type != Token.SEP or token.subtype != Token.ARG:
+                raise FormulaError(NAME)
+
+
+    def array(self):
+        rows = [[]]
+        while True:
+            rows[-1].append(self.expression(0))
+            token = self.next()
+            if token.type == Token.ARRAY and token.subtype == Token.CLOSE:
+                break
+            if token.type != Token.SEP:
+                raise FormulaError(NAME)
+            if token.subtype == Token.ROW:
+                rows.append([])
+        if len(set(len(row) for row in rows)) != 1:
+            raise FormulaError(VALUE)
+        return ("array", rows)
+
+
+class _Shape:
+
+    """
+    A formula compiled without its references
+    """
+
+    __slots__ = ("tree", "func", "arguments", "volatile")
+
+    def __init__(self):
+        self.tree = None
+        self.func = None
+        self.arguments = []
+        self.volatile = False
+
+
+class _Formula:
+
+    """
+    A compiled formula and what it refers to
+    """
+
+    __slots__ = ("func", "cells", "ranges", "volatile", "precedents")
+
+    def __init__(self):
+        self.func = None
+        self.cells = []
+        self.ranges = []
+        self.volatile = False
+        self.precedents = None # other formulae which must be calculated first
+
+
+class _RangeNode:
+
+    """
+    A range referred to by formulae, with its values once they are known
+    """
+
+    __slots__ = ("sheet", "min_row", "min_col", "max_row", "max_col",
+                 "dependents", "range", "precedents")
+
+    def __init__(self, sheet, min_row, min_col, max_row, max_col):
+        self.sheet = sheet
+        self.min_row = min_row
+        self.min_col = min_col
+        self.max_row = max_row
+        self.max_col = max_col
+        self.dependents = set()
+        self.range = None
+        self.precedents = None # formulae within the range
+
+
+class Evaluator:
+
+    """
+    Calculate the values of the formulae in a workbook.
+
+    Formulae are calculated when the value of any cell is looked up after
+    the evaluator has been created or cells have been changed. Errors are
+    returned as strings such as "#DIV/0!", and formulae which cannot be
+    parsed or use functions which are not supported evaluate to "#NAME?".
+
+    The evaluator should be created again after rows or columns have been
+    inserted or deleted, or worksheets added or renamed.
+    """
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self.epoch = workbook.epoch
+        self._worksheets = {ws.title: ws for ws in workbook.worksheets
+                            if hasattr(ws, "_cells")}
+        self._formulae = {}
+        self._values = {}
+        self._dependents = {} # cells referred to by formulae
+        self._ranges = {}
+        self._columns = {} # ranges by column
+        self._wide = {} # ranges which are too wide to index by column
+        self._formula_rows = {} # rows of formulae by worksheet and column
+        self._volatile = set()
+        self._dirty = set()
+        self._shapes = {}
+        self._names = set() # defined names being compiled
+
+        for title, ws in self._worksheets.items():
+            for cell in ws._cells.formulae():
+                self._add_formula((title, cell.row, cell.column), cell._value)
+
+
+    def _key(self, ref):
+        """
+        Worksheet, row and column of a cell or a coordinate such as
+        "Sheet1!A1". The active worksheet is used if there is no worksheet.
+        """
+        if isinstance(ref, str):
+            title, _, coord = split_sheet(ref)
+            if title is None:
+                title = self.workbook.active.title
+            row, col = coordinate_to_tuple(coord.replace("$", ""))
+            return title, row, col
+        return ref.parent.title, ref.row, ref.column
+
+
+    def _cell(self, key):
+        title, row, col = key
+        ws = self._worksheets.get(title)
+        if ws is None:
+            raise KeyError(f"Worksheet {title} does not exist")
+        return ws._cells.get((row, col))
+
+
+    def _read(self, ws, title, row, col):
+        """
+        The value of a cell as it is used in formulae
+        """
+        cell = ws._cells.get((row, col))
+        if cell is None:
+            return
+        data_type = cell.data_type
+        value = cell._value
+        if data_type == "f":
+            return self._values.get((title, row, col))
+        if data_type == "n":
+            if value is not None and type(value) not in (int, float):
+                value = float(value)
+            return value
+        if data_type == "s":
+            return value if value is None or type(value) is str else str(value)
+        if data_type == "d":
+            return to_excel(value, self.epoch)
+        if data_type == "e":
+            return FormulaError(value)
+        return value
+
+
+    def _read_cell(self, ws, title, row, col):
+        value = self._read(ws, title, row, col)
+        if isinstance(value, FormulaError):
+            raise FormulaError(value.code)
+        return value
+
+
+    def _read_cell_range(self, ws, title, row, col):
+        return Range([[self._read(ws, title, row, col)]])
+
+
+    def _read_range(self, ws, node):
+        rng = node.range
+        if rng is not None:
+            return rng
+        max_row = node.max_row
+        max_col = node.max_col
+        # whole rows and columns only go as far as the worksheet
+        if max_row == MAX_ROW:
+            max_row = max(ws.max_row, node.min_row)
+        if max_col == MAX_COLUMN:
+            max_col = max(ws.max_column, node.min_col)
+        read = self._read
+        title = node.sheet
+        cols = range(node.min_col, max_col + 1)
+        shape = (node.max_row - node.min_row + 1, node.max_col - node.min_col + 1)
+        rng = node.range = Range([[read(ws, title, row, col) for col in cols]
+                                  for row in range(node.min_row, max_row + 1)], shape)
+        return rng
+
+
+    # dependency graph
+
+    def _add_formula(self, key, value):
+        title, row, col = key
+        if isinstance(value, ArrayFormula):
+            value = value.text
+        if not isinstance(value, str) or not value.startswith("="):
+            return # data tables are not calculated
+        formula = _Formula()
+        formula.func = self._compile_formula(value, title, formula)
+        self._formulae[key] = formula
+        for ref in formula.cells:
+            self._dependents.setdefault(ref, set()).add(key)
+        for node in formula.ranges:
+            node.dependents.add(key)
+        if formula.volatile:
+            self._volatile.add(key)
+        insort(self._formula_rows.setdefault(title, {}).setdefault(col, []), row)
+        self._dirty.add(key)
+
+
+    def _remove_formula(self, key):
+        formula = self._formulae.pop(key, None)
+        if formula is None:
+            return
+        for ref in formula.cells:
+            self._dependents[ref].discard(key)
+        for node in formula.ranges:
+            node.dependents.discard(key)
+        self._volatile.discard(key)
+        self._dirty.discard(key)
+        self._values.pop(key, None)
+        title, row, col = key
+        rows = self._formula_rows[title][col]
+        del rows[bisect_left(rows, row)]
+
+
+    def _range_node(self, title, min_row, min_col, max_row, max_col):
+        bounds = title, min_row, min_col, max_row, max_col
+        node = self._ranges.get(bounds)
+        if node is None:
+            node = self._ranges[bounds] = _RangeNode(*bounds)
+            if max_col - min_col < WIDE:
+                for col in range(min_col, max_col + 1):
+                    self._columns.setdefault((title, col), []).append(node)
+            else:
+                self._wide.setdefault(title, []).append(node)
+        return node
+
+
+    def _nodes(self, key):
+        """
+        The ranges which contain a cell
+        """
+        title, row, col = key
+        for nodes in (self._columns.get((title, col), ()), self._wide.get(title, ())):
+            for node in nodes:
+                if node.min_row <= row <= node.max_row and node.min_col <= col <= node.max_col:
+                    yield node
+
+
+    def _precedents(self, item):
+        """
+        The formulae and ranges which have to be calculated before a formula,
+        or the formulae within a range
+        """
+        if item.precedents is None:
+            if isinstance(item, _Formula):
+                formulae = self._formulae
+                precedents = [key for key in item.cells if key in formulae]
+                precedents.extend(item.ranges)
+            else:
+                precedents = []
+                columns = self._formula_rows.get(item.sheet, {})
+                if item.max_col - item.min_col < len(columns):
+                    cols = range(item.min_col, item.max_col + 1)
+                else:
+                    cols = [col for col in columns if item.min_col <= col <= item.max_col]
+                for col in cols:
+                    rows = columns.get(col)
+                    if rows:
+                        start = bisect_left(rows, item.min_row)
+                        end = bisect_right(rows, item.max_row)
+                        precedents.extend((item.sheet, row, col) for row in rows[start:end])
+            item.precedents = precedents
+        return item.precedents
+
+
+    def changed(self, *cells):
+        """
+        Update the formulae of cells, or coordinates such as "Sheet1!A1",
+        which have been edited so that the formulae which depend upon them
+        are calculated again
+        """
+        keys = []
+        for ref in cells:
+            key = self._key(ref)
+            self._remove_formula(key)
+            cell = self._cell(key)
+            if cell is not None and cell.data_type == "f":
+                self._add_formula(key, cell._value)
+            # formulae which refer to the cell may now have to calculate it
+            # first
+            for dependent in self._dependents.get(key, ()):
+                self._formulae[dependent].precedents = None
+            for node in self._nodes(key):
+                node.precedents = None
+            keys.append(key)
+        self._invalidate(keys)
+
+
+    def _invalidate(self, keys):
+        """
+        Mark the formulae which depend upon cells as dirty
+        """
+        dirty = self._dirty
+        stack = list(keys)
+        while stack:
+            key = stack.pop()
+            dependents = self._dependents.get(key, ())
+            for node in self._nodes(key):
+                node.range = None
+                for dependent in node.dependents:
+                    if dependent not in dirty:
+                        dirty.add(dependent)
+                        stack.append(dependent)
+            for dependent in dependents:
+                if dependent not in dirty:
+                    dirty.add(dependent)
+                    stack.append(dependent)
+
+
+    # calculation
+
+    def calculate(self):
+        """
+        Calculate the formulae which are out of date, and those with
+        volatile functions such as NOW() and TODAY()
+        """
+        if self._volatile:
+            self._dirty.update(self._volatile)
+            self._invalidate(self._volatile)
+        dirty = self._dirty
+        ready = set() # ranges whose formulae have been calculated
+        circular = set() # ranges with formulae which refer to them
+        for key in list(dirty):
+            if key in dirty:
+                self._calculate(key, ready, circular)
+
+
+    def _calculate(self, key, ready, circular):
+        """
+        Calculate a formula after the dirty formulae and ranges it depends
+        upon
+        """
+        dirty = self._dirty
+        formulae = self._formulae
+
+        def pending(item):
+            if type(item) is tuple:
+                return item in dirty
+            return item not in ready
+
+        expanded = set()
+        stack = [key]
+        while stack:
+            item = stack[-1]
+            if not pending(item):
+                stack.pop()
+                continue
+            is_key = type(item) is tuple
+            precedents = self._precedents(formulae[item] if is_key else item)
+            if item not in expanded:
+                expanded.add(item)
+                waiting = [p for p in precedents if p not in expanded and pending(p)]
+                if waiting:
+                    stack.extend(waiting)
+                    continue
+            stack.pop()
+            cycle = any(pending(p) or p in circular for p in precedents)
+            if not is_key:
+                ready.add(item)
+                if cycle:
+                    circular.add(item)
+                continue
+
+            dirty.discard(item)
+            if cycle:
+                value = 0 # circular references are 0, as in Excel
+            else:
+                value = self._evaluate(formulae[item])
+            old = self._values.get(item)
+            self._values[item] = value
+            if type(old) is not type(value) or old != value:
+                for node in self._nodes(item):
+                    node.range = None
+
+
+    def _evaluate(self, formula):
+        try:
+            value = formula.func()
+            if isinstance(value, Range):
+                value = value.rows[0][0] if len(value) else None
+            if isinstance(value, FormulaError):
+                return value
+            if value is None:
+                value = 0
+            return check(value)
+        except FormulaError as e:
+            e.__traceback__ = None
+            return e
+        except ZeroDivisionError:
+            return FormulaError("#DIV/0!")
+        except (OverflowError, ValueError):
+            return FormulaError("#NUM!")
+
+
+    def value(self, ref):
+        """
+        The value of a cell, or a coordinate such as "Sheet1!A1". Dates are
+        returned as datetimes if the number format of the cell is a date
+        format.
+        """
+        if self._dirty:
+            self.calculate()
+        key = self._key(ref)
+        cell = self._cell(key)
+        if key not in self._formulae:
+            return cell.value if cell is not None else None
+        value = self._values.get(key)
+        if isinstance(value, FormulaError):
+            return value.code
+        if (type(value) in (int, float) and value >= 0
+            and is_date_format(cell.number_format)):
+            return from_excel(value, self.epoch)
+        return value
+
+
+    # compilation
+
+    def _shape(self, text):
+        """
+        The compiled tree of a formula and its references. Formulae with the
+        same literals between their references, such as those filled down a
+        column, share the same compiled tree.
+        """
+        parts = CELL_RE.split(text)
+        templates = _template(tuple(parts[::2]))
+        cells = parts[1::2]
+        refs = [fmt.format(*cells) for fmt in templates[1::2]]
+        shape = self._shapes.get(templates)
+        if shape is None:
+            formula = "".join(fmt.format(*cells) for fmt in templates)
+            shape = self._shapes[templates] = _Shape()
+            try:
+                shape.tree = Parser(formula).parse()
+            except FormulaError as e:
+                shape.tree = ("error", e.code)
+            shape.arguments = [False] * len(refs)
+            shape.func = self._compile(shape.tree, shape)
+        return shape, refs
+
+
+    def _compile_formula(self, text, title, formula, argument=False):
+        """
+        Compile a formula, recording what it refers to
+        """
+        shape, refs = self._shape(text)
+        arguments = shape.arguments
+        if argument and shape.tree == ("ref", 0):
+            arguments = [True] # a defined name passed to a function
+        if shape.volatile:
+            formula.volatile = True
+        readers = tuple(self._compile_reference(ref, title, formula, arg)
+                        for ref, arg in zip(refs, arguments))
+        return partial(shape.func, readers)
+
+
+    def _compile(self, tree, shape, argument=False):
+        """
+        Compile a tree into a function which is called with functions which
+        read the references of a formula
+        """
+        kind = tree[0]
+
+        if kind == "value":
+            value = tree[1]
+            return lambda refs: value
+
+        if kind == "error":
+            return partial(_error, tree[1])
+
+        if kind == "ref":
+            idx = tree[1]
+            shape.arguments[idx] = argument
+            return lambda refs: refs[idx]()
+
+        if kind == "neg":
+            operand = self._compile(tree[1], shape)
+            return lambda refs: -to_number(operand(refs))
+
+        if kind == "percent":
+            operand = self._compile(tree[1], shape)
+            return lambda refs: to_number(operand(refs)) / 100
+
+        if kind == "op":
+            op = OPERATORS[tree[1]]
+            left = self._compile(tree[2], shape)
+            right = self._compile(tree[3], shape)
+            return lambda refs: op(left(refs), right(refs))
+
+        if kind == "func":
+            return self._compile_function(tree[1], tree[2], shape)
+
+        if kind == "array":
+            try:
+                rows = [[scalar(self._compile(element, shape)(()))
+                         for element in row] for row in tree[1]]
+            except FormulaError as e:
+                return partial(_error, e.code)
+            array = Range(rows)
+            return lambda refs: array
+
+
+    def _compile_function(self, name, args, shape):
+        func = FUNCTIONS.get(name)
+        if func is None:
+            return partial(_error, NAME)
+        # references are passed to functions as ranges, even single cells,
+        # so that they can tell them apart from values
+        args = [self._compile(arg, shape, argument=True) for arg in args]
+        if func.volatile:
+            shape.volatile = True
+        if func.lazy:
+            return lambda refs: func(*[partial(arg, refs) for arg in args])
+        if func.epoch:
+            epoch = self.epoch
+            return lambda refs: func(*[arg(refs) for arg in args], epoch=epoch)
+        return lambda refs: func(*[arg(refs) for arg in args])
+
+
+    def _compile_reference(self, ref, title, formula, argument):
+        """
+        A function which reads a reference
+        """
+        sheet, _, coord = split_sheet(ref)
+        if sheet is None:
+            sheet = title
+        ws = self._worksheets.get(sheet)
+        try:
+            min_col, min_row, max_col, max_row = range_boundaries(coord)
+        except ValueError:
+            return self._compile_name(ref, title, formula, argument)
+        if ws is None:
+            return partial(_error, REF, None)
+
+        if min_row is None:
+            min_row, max_row = 1, MAX_ROW
+        if min_col is None:
+            min_col, max_col = 1, MAX_COLUMN
+
+        if min_row == max_row and min_col == max_col:
+            formula.cells.append((sheet, min_row, min_col))
+            if argument:
+                return partial(self._read_cell_range, ws, sheet, min_row, min_col)
+            return partial(self._read_cell, ws, sheet, min_row, min_col)
+
+        node = self._range_node(sheet, min_row, min_col, max_row, max_col)
+        formula.ranges.append(node)
+        return partial(self._read_range, ws, node)
+
+
+    def _compile_name(self, name, title, formula, argument):
+        """
+        Compile the value of a defined name, which is usually a reference
+        """
+        ws = self._worksheets.get(title)
+        defn = None
+        for names in (ws.defined_names, self.workbook.defined_names):
+            defn = names.get(name)
+            if defn is None:
+                defn = next((d for key, d in names.items()
+                             if key.lower() == name.lower()), None)
+            if defn is not None:
+                break
+        if defn is None or defn.is_external or not defn.value or name in self._names:
+            return partial(_error, NAME, None)
+
+        text = defn.value if defn.value.startswith("=") else "=" + defn.value
+        self._names.add(name)
+        try:
+            return self._compile_formula(text, title, formula, argument)
+        finally:
+            self._names.discard(name)
+
+
+def _error(code, refs):
+    raise FormulaError(code)
@@ -0,0 +1,1653 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Worksheet functions for the formula evaluator.
+
+Functions are called with the values of their arguments: numbers, strings,
+booleans, None for empty cells and missing arguments, and Range objects for
+references. Excel errors are raised as FormulaError. Lazy functions, such as
+IF, are called with functions which return the values of their arguments, so
+that only the arguments which are needed are evaluated.
+
+Dates and times are serial numbers as in Excel.
+"""
+
+import calendar
+import datetime
+import math
+import operator
+import re
+from bisect import bisect_left, bisect_right
+from decimal import Decimal, InvalidOperation, ROUND_DOWN, ROUND_HALF_UP, ROUND_UP
+
+from openpyxl.compat.numbers import NUMPY
+from openpyxl.utils.datetime import from_excel, to_excel
+
+if NUMPY:
+    import numpy
+
+
+NULL = "#NULL!"
+DIV0 = "#DIV/0!"
+VALUE = "#VALUE!"
+REF = "#REF!"
+NAME = "#NAME?"
+NUM = "#NUM!"
+NA = "#N/A"
+
+# ranges with fewer cells are not worth converting to arrays
+NUMPY_THRESHOLD = 64
+
+
+class FormulaError(Exception):
+
+    """
+    An Excel error such as #DIV/0! Errors are raised while formulae are
+    evaluated and become the values of their cells.
+    """
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.code = code
+
+
+class Range:
+
+    """
+    The values of a block of cells, by row. The numbers in a range and the
+    indices used to look values up in it are kept, so a range should not be
+    changed once it has been created.
+    """
+
+    def __init__(self, rows, shape=None):
+        self.rows = rows
+        self.height = len(rows)
+        self.width = len(rows[0]) if rows else 0
+        # references to whole rows or columns are larger than their values
+        self.shape = shape or (self.height, self.width)
+        self._flat = None
+        self._numbers = None
+        self._numeric = None
+        self._exact = {}
+        self._sorted = {}
+
+
+    def __len__(self):
+        return self.height * self.width
+
+
+    def __iter__(self):
+        return iter(self.flat())
+
+
+    def flat(self):
+        if self._flat is None:
+            self._flat = [value for row in self.rows for value in row]
+        return self._flat
+
+
+    def column(self, idx):
+        return [row[idx] for row in self.rows]
+
+
+    def scalar(self):
+        """
+        The value of a range of a single cell
+        """
+        if self.height != 1 or self.width != 1:
+            raise FormulaError(VALUE)
+        value = self.rows[0][0]
+        if isinstance(value, FormulaError):
+            raise value
+        return value
+
+
+    def numbers(self):
+        """
+        The numbers in the range, ignoring text, booleans and empty cells,
+        as an array if NumPy is installed and there are enough of them.
+        Raises the first error in the range.
+        """
+        if self._numbers is None:
+            numbers = []
+            for value in self.flat():
+                cls = type(value)
+                if cls is int or cls is float:
+                    numbers.append(value)
+                elif cls is FormulaError:
+                    raise value
+            if NUMPY and len(numbers) >= NUMPY_THRESHOLD:
+                numbers = numpy.array(numbers, dtype=float)
+            self._numbers = numbers
+        return self._numbers
+
+
+    def numeric(self):
+        """
+        All the values of the range with anything which is not a number as
+        0, and which of them are numbers. These are arrays if NumPy is
+        installed and the range is large enough.
+        """
+        if self._numeric is None:
+            values = []
+            mask = []
+            for value in self.flat():
+                cls = type(value)
+                if cls is int or cls is float:
+                    values.append(value)
+                    mask.append(True)
+                elif cls is FormulaError:
+                    raise value
+                else:
+                    values.append(0)
+                    mask.append(False)
+            if NUMPY and len(values) >= NUMPY_THRESHOLD:
+                values = numpy.array(values, dtype=float)
+                mask = numpy.array(mask, dtype=bool)
+            self._numeric = values, mask
+        return self._numeric
+
+
+    def _vector(self, by_row):
+        return self.rows[0] if by_row else self.column(0)
+
+
+    def find(self, value, by_row, match_type=0):
+        """
+        Position of a value in the first row or column of the range. With a
+        match_type of 0 the first value which is the same is found, with 1
+        the largest value which is less than or equal to it and with -1 the
+        smallest which is greater than or equal to it. Raises #N/A if there
+        is no such value.
+        """
+        lookup = scalar(value)
+        if lookup is None:
+            lookup = 0
+
+        if match_type == 0:
+            if isinstance(lookup, str) and ("*" in lookup or "?" in lookup):
+                pattern = _wildcard(lookup)
+                for idx, value in enumerate(self._vector(by_row)):
+                    if isinstance(value, str) and pattern.fullmatch(value):
+                        return idx
+                raise FormulaError(NA)
+            index = self._exact.get(by_row)
+            if index is None:
+                index = self._exact[by_row] = {}
+                for idx, value in enumerate(self._vector(by_row)):
+                    index.setdefault(_lookup_key(value), idx)
+            try:
+                return index[_lookup_key(lookup)]
+            except KeyError:
+                raise FormulaError(NA)
+
+        # values of the same type, sorted so that the last of equal values
+        # is found
+        ordered = self._sorted.get(by_row)
+        if ordered is None:
+            by_type = {}
+            for idx, value in enumerate(self._vector(by_row)):
+                if value is not None and not isinstance(value, FormulaError):
+                    key = _lookup_key(value)
+                    by_type.setdefault(key[0], []).append((key[1], idx))
+            ordered = self._sorted[by_row] = {}
+            for rank, keys in by_type.items():
+                keys.sort()
+                ordered[rank] = [k for k, _ in keys], [idx for _, idx in keys]
+        rank, key = _lookup_key(lookup)
+        keys, positions = ordered.get(rank, ((), ()))
+        if match_type > 0:
+            idx = bisect_right(keys, key) - 1
+            if idx < 0:
+                raise FormulaError(NA)
+        else:
+            idx = bisect_left(keys, key)
+            if idx == len(keys):
+                raise FormulaError(NA)
+        return positions[idx]
+
+
+def _lookup_key(value):
+    """
+    Key for matching values: text is case insensitive and booleans are not
+    numbers
+    """
+    if isinstance(value, bool):
+        return 2, value
+    if isinstance(value, str):
+        return 1, value.lower()
+    if isinstance(value, FormulaError):
+        return 3, value.code
+    return 0, value
+
+
+def _wildcard(text):
+    """
+    Regular expression for text with the wildcards * and ?, which can be
+    escaped with ~
+    """
+    pattern = []
+    chars = iter(text)
+    for char in chars:
+        if char == "~":
+            pattern.append(re.escape(next(chars, "~")))
+        elif char == "*":
+            pattern.append(".*")
+        elif char == "?":
+            pattern.append(".")
+        else:
+            pattern.append(re.escape(char))
+    return re.compile("".join(pattern), re.IGNORECASE | re.DOTALL)
+
+
+# conversions
+
+
+def scalar(value):
+    """
+    A single value: ranges of one cell are replaced by their value and errors
+    are raised
+    """
+    if isinstance(value, Range):
+        return value.scalar()
+    if isinstance(value, FormulaError):
+        raise value
+    return value
+
+
+def to_number(value):
+    cls = type(value)
+    if cls is int or cls is float:
+        return value
+    if value is None:
+        return 0
+    if cls is bool:
+        return int(value)
+    if cls is str:
+        try:
+            number = float(value)
+        except ValueError:
+            raise FormulaError(VALUE)
+        if not math.isfinite(number):
+            raise FormulaError(VALUE)
+        return number
+    if isinstance(value, (Range, FormulaError)):
+        return to_number(scalar(value))
+    return float(value)
+
+
+def to_int(value):
+    return int(to_number(value))
+
+
+def to_text(value):
+    value = scalar(value)
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float):
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return f"{value:.15g}".replace("e", "E")
+    return str(value)
+
+
+def to_bool(value):
+    value = scalar(value)
+    if value is None:
+        return False
+    if isinstance(value, str):
+        text = value.upper()
+        if text not in ("TRUE", "FALSE"):
+            raise FormulaError(VALUE)
+        return text == "TRUE"
+    return bool(value)
+
+
+def check(number):
+    """
+    Raise #NUM! for results which are not finite
+    """
+    if type(number) is float and not math.isfinite(number):
+        raise FormulaError(NUM)
+    return number
+
+
+# operators
+
+
+def _rank(value):
+    if isinstance(value, bool):
+        return 2
+    if isinstance(value, str):
+        return 1
+    return 0
+
+
+def _significant(number):
+    """
+    The number to the 15 significant digits that Excel uses when comparing
+    numbers
+    """
+    return float(f"{number:.15g}")
+
+
+def compare(left, right):
+    """
+    Compare two values as Excel does: numbers are less than text, which is
+    less than booleans, numbers are compared to 15 significant digits and
+    text is compared without case. Returns -1, 0 or 1.
+    """
+    left = scalar(left)
+    right = scalar(right)
+    if left is None:
+        left = _empty(right)
+    if right is None:
+        right = _empty(left)
+    rank = _rank(left)
+    other = _rank(right)
+    if rank != other:
+        return (rank > other) - (rank < other)
+    if rank == 1:
+        left = left.lower()
+        right = right.lower()
+    elif rank == 0 and left != right:
+        left = _significant(left)
+        right = _significant(right)
+    return (left > right) - (left < right)
+
+
+def _empty(other):
+    """
+    The value of an empty cell when it is compared with another value
+    """
+    if isinstance(other, str):
+        return ""
+    if isinstance(other, bool):
+        return False
+    return 0
+
+
+def power(base, exponent):
+    base = to_number(base)
+    exponent = to_number(exponent)
+    if base == 0:
+        if exponent == 0:
+            raise FormulaError(NUM)
+        if exponent < 0:
+            raise FormulaError(DIV0)
+    if base < 0 and not float(exponent).is_integer():
+        raise FormulaError(NUM)
+    try:
+        return check(float(base) ** exponent)
+    except OverflowError:
+        raise FormulaError(NUM)
+
+
+def divide(left, right):
+    right = to_number(right)
+    if right == 0:
+        raise FormulaError(DIV0)
+    return to_number(left) / right
+
+
+OPERATORS = {
+    "+": lambda a, b: check(to_number(a) + to_number(b)),
+    "-": lambda a, b: check(to_number(a) - to_number(b)),
+    "*": lambda a, b: check(to_number(a) * to_number(b)),
+    "/": divide,
+    "^": power,
+    "&": lambda a, b: to_text(a) + to_text(b),
+    "=": lambda a, b: compare(a, b) == 0,
+    "<>": lambda a, b: compare(a, b) != 0,
+    "<": lambda a, b: compare(a, b) < 0,
+    ">": lambda a, b: compare(a, b) > 0,
+    "<=": lambda a, b: compare(a, b) <= 0,
+    ">=": lambda a, b: compare(a, b) >= 0,
+}
+
+
+# functions
+
+FUNCTIONS = {}
+
+
+def function(*names, lazy=False, epoch=False, volatile=False):
+    """
+    Register a worksheet function. Lazy functions are called with functions
+    which return the values of their arguments, functions which use dates
+    with the epoch of the workbook and volatile functions are calculated
+    every time a workbook is.
+    """
+    def register(func):
+        func.lazy = lazy
+        func.epoch = epoch
+        func.volatile = volatile
+        for name in names:
+            FUNCTIONS[name] = func
+        return func
+    return register
+
+
+def _groups(args):
+    """
+    The numbers of the arguments of aggregate functions as lists or arrays.
+    Only the numbers in ranges are used, whereas other arguments are
+    converted to numbers.
+    """
+    groups = []
+    scalars = []
+    for arg in args:
+        if isinstance(arg, Range):
+            groups.append(arg.numbers())
+        else:
+            scalars.append(to_number(arg))
+    if scalars:
+        groups.append(scalars)
+    return groups
+
+
+def _is_array(values):
+    return NUMPY and isinstance(values, numpy.ndarray)
+
+
+@function("SUM")
+def sum_(*args):
+    total = 0
+    for numbers in _groups(args):
+        if _is_array(numbers):
+            total += float(numbers.sum())
+        else:
+            total += sum(numbers)
+    return check(total)
+
+
+@function("PRODUCT")
+def product(*args):
+    result = 1
+    for numbers in _groups(args):
+        if _is_array(numbers):
+            result *= float(numbers.prod())
+        else:
+            result *= math.prod(numbers)
+    return check(result)
+
+
+@function("AVERAGE")
+def average(*args):
+    groups = _groups(args)
+    count = sum(len(numbers) for numbers in groups)
+    if not count:
+        raise FormulaError(DIV0)
+    return sum_(*args) / count
+
+
+@function("MIN")
+def min_(*args):
+    values = [float(numbers.min()) if _is_array(numbers) else min(numbers)
+              for numbers in _groups(args) if len(numbers)]
+    return min(values, default=0)
+
+
+@function("MAX")
+def max_(*args):
+    values = [float(numbers.max()) if _is_array(numbers) else max(numbers)
+              for numbers in _groups(args) if len(numbers)]
+    return max(values, default=0)
+
+
+@function("MEDIAN")
+def median(*args):
+    values = []
+    for numbers in _groups(args):
+        values.extend(numbers)
+    if not values:
+        raise FormulaError(NUM)
+    values.sort()
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2
+
+
+@function("COUNT", lazy=True)
+def count(*args):
+    total = 0
+    for arg in args:
+        try:
+            value = arg()
+        except FormulaError:
+            continue
+        if isinstance(value, Range):
+            total += sum(1 for v in value if type(v) in (int, float))
+        elif value is not None:
+            try:
+                to_number(value)
+                total += 1
+            except FormulaError:
+                pass
+    return total
+
+
+@function("COUNTA", lazy=True)
+def counta(*args):
+    total = 0
+    for arg in args:
+        try:
+            value = arg()
+        except FormulaError:
+            total += 1
+            continue
+        if isinstance(value, Range):
+            total += sum(1 for v in value if v is not None)
+        elif value is not None:
+            total += 1
+    return total
+
+
+@function("COUNTBLANK")
+def countblank(rng):
+    if not isinstance(rng, Range):
+        raise FormulaError(VALUE)
+    return sum(1 for v in rng if v is None or v == "")
+
+
+@function("SUMPRODUCT")
+def sumproduct(*args):
+    ranges = [arg if isinstance(arg, Range) else Range([[scalar(arg)]])
+              for arg in args]
+    first = ranges[0]
+    if any((r.height, r.width) != (first.height, first.width) for r in ranges):
+        raise FormulaError(VALUE)
+    arrays = [r.numeric()[0] for r in ranges]
+    if all(_is_array(a) for a in arrays):
+        result = arrays[0].copy()
+        for a in arrays[1:]:
+            result *= a
+        return check(float(result.sum()))
+    return check(sum(math.prod(values) for values in zip(*arrays)))
+
+
+# criteria
+
+CRITERION_RE = re.compile(r"(<=|>=|<>|<|>|=)?(.*)", re.DOTALL)
+
+COMPARISONS = {
+    "=": operator.eq,
+    "<>": operator.ne,
+    "<": operator.lt,
+    ">": operator.gt,
+    "<=": operator.le,
+    ">=": operator.ge,
+}
+
+
+class Criterion:
+
+    """
+    The criteria of functions such as SUMIF and COUNTIF, e.g. 5, ">=5",
+    "<>" or "a*"
+    """
+
+    def __init__(self, criterion):
+        criterion = scalar(criterion)
+        self.pattern = None
+        if isinstance(criterion, str):
+            op, operand = CRITERION_RE.fullmatch(criterion).groups()
+            self.op = op or "="
+            try:
+                value = to_number(operand) if operand.strip() else operand
+            except FormulaError:
+                value = operand
+                if operand.upper() in ("TRUE", "FALSE"):
+                    value = operand.upper() == "TRUE"
+                elif self.op in ("=", "<>") and ("*" in operand or "?" in operand):
+                    self.pattern = _wildcard(operand)
+        else:
+            self.op = "="
+            value = criterion
+        if value is None:
+            value = ""
+        self.value = value
+        self.rank = _rank(value)
+
+
+    def __call__(self, value):
+        op = self.op
+        if isinstance(self.value, str):
+            if self.value == "" and op in ("=", "<>"):
+                matched = value is None or value == ""
+                return matched if op == "=" else not matched
+            if not isinstance(value, str):
+                return op == "<>"
+            if self.pattern is not None:
+                matched = self.pattern.fullmatch(value) is not None
+                return matched if op == "=" else not matched
+            return COMPARISONS[op](value.lower(), self.value.lower())
+        if value is None or _rank(value) != self.rank or isinstance(value, FormulaError):
+            return op == "<>"
+        return COMPARISONS[op](value, self.value)
+
+
+    def mask(self, rng):
+        """
+        Which cells of a range match as an array, if the criterion is a
+        number and the range is an array
+        """
+        if self.rank != 0:
+            return
+        values, numbers = rng.numeric()
+        if not _is_array(values):
+            return
+        if self.op == "<>":
+            return ~(numbers & (values == self.value))
+        return numbers & COMPARISONS[self.op](values, self.value)
+
+
+def _matches(pairs):
+    """
+    Positions of the cells which match all the criteria, as an array if
+    possible
+    """
+    masks = [criterion.mask(rng) for rng, criterion in pairs]
+    if all(mask is not None for mask in masks):
+        result = masks[0]
+        for mask in masks[1:]:
+            result = result & mask
+        return result
+    columns = [(rng.flat(), criterion) for rng, criterion in pairs]
+    size = len(columns[0][0])
+    return [idx for idx in range(size)
+            if all(criterion(values[idx]) for values, criterion in columns)]
+
+
+def _criteria(args):
+    if not args or len(args) % 2:
+        raise FormulaError(VALUE)
+    pairs = []
+    shape = None
+    for rng, criterion in zip(args[::2], args[1::2]):
+        if not isinstance(rng, Range):
+            raise FormulaError(VALUE)
+        if shape is None:
+            shape = rng.height, rng.width
+        elif (rng.height, rng.width) != shape:
+            raise FormulaError(VALUE)
+        pairs.append((rng, Criterion(criterion)))
+    return pairs
+
+
+def _sum_matches(rng, matches):
+    values, numbers = rng.numeric()
+    if _is_array(matches):
+        if not _is_array(values):
+            values = numpy.array(values, dtype=float)
+            numbers = numpy.array(numbers, dtype=bool)
+        return float(values[matches].sum()), int((numbers & matches).sum())
+    total = 0
+    found = 0
+    for idx in matches:
+        if numbers[idx]:
+            total += values[idx]
+            found += 1
+    return total, found
+
+
+def _count_matches(matches):
+    if _is_array(matches):
+        return int(matches.sum())
+    return len(matches)
+
+
+@function("COUNTIF")
+def countif(rng, criterion):
+    return countifs(rng, criterion)
+
+
+@function("COUNTIFS")
+def countifs(*args):
+    return _count_matches(_matches(_criteria(args)))
+
+
+@function("SUMIF")
+def sumif(rng, criterion, sum_range=None):
+    if sum_range is None:
+        sum_range = rng
+    return sumifs(sum_range, rng, criterion)
+
+
+@function("SUMIFS")
+def sumifs(sum_range, *args):
+    pairs = _criteria(args)
+    if not isinstance(sum_range, Range) or len(sum_range) != len(pairs[0][0]):
+        raise FormulaError(VALUE)
+    return check(_sum_matches(sum_range, _matches(pairs))[0])
+
+
+@function("AVERAGEIF")
+def averageif(rng, criterion, average_range=None):
+    if average_range is None:
+        average_range = rng
+    return averageifs(average_range, rng, criterion)
+
+
+@function("AVERAGEIFS")
+def averageifs(average_range, *args):
+    pairs = _criteria(args)
+    if not isinstance(average_range, Range) or len(average_range) != len(pairs[0][0]):
+        raise FormulaError(VALUE)
+    total, found = _sum_matches(average_range, _matches(pairs))
+    if not found:
+        raise FormulaError(DIV0)
+    return total / found
+
+
+# maths
+
+
+def _round(number, digits, rounding):
+    number = to_number(number)
+    digits = to_int(digits)
+    try:
+        result = Decimal(repr(number)).quantize(Decimal(1).scaleb(-digits),
+                                                rounding=rounding)
+    except InvalidOperation:
+        return number
+    if digits <= 0:
+        return int(result)
+    return float(result)
+
+
+@function("ROUND")
+def round_(number, digits=0):
+    return _round(number, digits, ROUND_HALF_UP)
+
+
+@function("ROUNDUP")
+def roundup(number, digits=0):
+    return _round(number, digits, ROUND_UP)
+
+
+@function("ROUNDDOWN")
+def rounddown(number, digits=0):
+    return _round(number, digits, ROUND_DOWN)
+
+
+@function("TRUNC")
+def trunc(number, digits=0):
+    return _round(number, digits, ROUND_DOWN)
+
+
+@function("INT")
+def int_(number):
+    return math.floor(to_number(number))
+
+
+@function("ABS")
+def abs_(number):
+    return abs(to_number(number))
+
+
+@function("SIGN")
+def sign(number):
+    number = to_number(number)
+    return (number > 0) - (number < 0)
+
+
+@function("MOD")
+def mod(number, divisor):
+    divisor = to_number(divisor)
+    if divisor == 0:
+        raise FormulaError(DIV0)
+    return to_number(number) % divisor
+
+
+@function("POWER")
+def power_(number, exponent):
+    return power(number, exponent)
+
+
+@function("SQRT")
+def sqrt(number):
+    number = to_number(number)
+    if number < 0:
+        raise FormulaError(NUM)
+    return math.sqrt(number)
+
+
+@function("EXP")
+def exp(number):
+    try:
+        return math.exp(to_number(number))
+    except OverflowError:
+        raise FormulaError(NUM)
+
+
+@function("LN")
+def ln(number):
+    number = to_number(number)
+    if number <= 0:
+        raise FormulaError(NUM)
+    return math.log(number)
+
+
+@function("LOG")
+def log(number, base=10):
+    number = to_number(number)
+    base = to_number(base)
+    if number <= 0 or base <= 0:
+        raise FormulaError(NUM)
+    if base == 1:
+        raise FormulaError(DIV0)
+    return math.log(number, base)
+
+
+@function("LOG10")
+def log10(number):
+    return log(number)
+
+
+@function("PI")
+def pi():
+    return math.pi
+
+
+# logic
+
+
+@function("IF", lazy=True)
+def if_(condition, value_if_true=None, value_if_false=None):
+    if to_bool(condition()):
+        return value_if_true() if value_if_true is not None else True
+    return value_if_false() if value_if_false is not None else False
+
+
+@function("IFERROR", lazy=True)
+def iferror(value, value_if_error):
+    try:
+        result = value()
+        if isinstance(result, Range) and len(result) == 1:
+            result = result.scalar()
+        return result
+    except FormulaError:
+        return value_if_error()
+
+
+@function("IFNA", lazy=True)
+def ifna(value, value_if_na):
+    try:
+        result = value()
+        if isinstance(result, Range) and len(result) == 1:
+            result = result.scalar()
+        return result
+    except FormulaError as e:
+        if e.code != NA:
+            raise
+        return value_if_na()
+
+
+def _logical(args):
+    values = []
+    for arg in args:
+        if isinstance(arg, Range):
+            for value in arg:
+                if isinstance(value, FormulaError):
+                    raise value
+                if isinstance(value, (bool, int, float)):
+                    values.append(bool(value))
+        elif arg is not None:
+            values.append(to_bool(arg))
+    if not values:
+        raise FormulaError(VALUE)
+    return values
+
+
+@function("AND")
+def and_(*args):
+    return all(_logical(args))
+
+
+@function("OR")
+def or_(*args):
+    return any(_logical(args))
+
+
+@function("XOR")
+def xor(*args):
+    return sum(_logical(args)) % 2 == 1
+
+
+@function("NOT")
+def not_(value):
+    return not to_bool(value)
+
+
+@function("TRUE")
+def true():
+    return True
+
+
+@function("FALSE")
+def false():
+    return False
+
+
+@function("CHOOSE", lazy=True)
+def choose(index, *values):
+    idx = to_int(index())
+    if not 1 <= idx <= len(values):
+        raise FormulaError(VALUE)
+    return values[idx - 1]()
+
+
+# information
+
+
+def _error(value):
+    """
+    The error of an argument, if any
+    """
+    try:
+        scalar(value())
+    except FormulaError as e:
+        return e.code
+
+
+@function("ISERROR", lazy=True)
+def iserror(value):
+    return _error(value) is not None
+
+
+@function("ISERR", lazy=True)
+def iserr(value):
+    return _error(value) not in (None, NA)
+
+
+@function("ISNA", lazy=True)
+def isna(value):
+    return _error(value) == NA
+
+
+@function("NA")
+def na():
+    raise FormulaError(NA)
+
+
+@function("ISBLANK")
+def isblank(value):
+    return scalar(value) is None
+
+
+@function("ISNUMBER")
+def isnumber(value):
+    return type(scalar(value)) in (int, float)
+
+
+@function("ISTEXT")
+def istext(value):
+    return isinstance(scalar(value), str)
+
+
+@function("ISLOGICAL")
+def islogical(value):
+    return isinstance(scalar(value), bool)
+
+
+# lookup
+
+
+@function("MATCH")
+def match(lookup_value, lookup_array, match_type=1):
+    if not isinstance(lookup_array, Range):
+        raise FormulaError(NA)
+    if lookup_array.height != 1 and lookup_array.width != 1:
+        raise FormulaError(NA)
+    match_type = to_number(match_type)
+    match_type = (match_type > 0) - (match_type < 0)
+    by_row = lookup_array.height == 1
+    return lookup_array.find(lookup_value, by_row, match_type) + 1
+
+
+def _lookup(lookup_value, table, index, approximate, by_row):
+    if not isinstance(table, Range):
+        raise FormulaError(VALUE)
+    index = to_int(index)
+    size = table.height if by_row else table.width
+    if index < 1:
+        raise FormulaError(VALUE)
+    if index > size:
+        raise FormulaError(REF)
+    match_type = 1 if approximate is None or to_bool(approximate) else 0
+    pos = table.find(lookup_value, by_row, match_type)
+    if by_row:
+        value = table.rows[index - 1][pos]
+    else:
+        value = table.rows[pos][index - 1]
+    if isinstance(value, FormulaError):
+        raise value
+    return value
+
+
+@function("VLOOKUP")
+def vlookup(lookup_value, table_array, col_index_num, range_lookup=None):
+    return _lookup(lookup_value, table_array, col_index_num, range_lookup, False)
+
+
+@function("HLOOKUP")
+def hlookup(lookup_value, table_array, row_index_num, range_lookup=None):
+    return _lookup(lookup_value, table_array, row_index_num, range_lookup, True)
+
+
+@function("INDEX")
+def index(array, row_num, column_num=None):
+    if not isinstance(array, Range):
+        array = Range([[scalar(array)]])
+    row = to_int(row_num)
+    col = None if column_num is None else to_int(column_num)
+    if col is None and array.height == 1:
+        row, col = 1, row
+    elif col is None:
+        col = 1
+    if not (0 <= row <= array.height and 0 <= col <= array.width):
+        raise FormulaError(REF)
+    if row == 0 and col == 0:
+        return array
+    if row == 0:
+        return Range([[r[col - 1]] for r in array.rows])
+    if col == 0:
+        return Range([array.rows[row - 1]])
+    value = array.rows[row - 1][col - 1]
+    if isinstance(value, FormulaError):
+        raise value
+    return value
+
+
+@function("ROWS")
+def rows(array):
+    if isinstance(array, Range):
+        return array.shape[0]
+    scalar(array)
+    return 1
+
+
+@function("COLUMNS")
+def columns(array):
+    if isinstance(array, Range):
+        return array.shape[1]
+    scalar(array)
+    return 1
+
+
+# text
+
+
+@function("LEN")
+def len_(text):
+    return len(to_text(text))
+
+
+@function("LEFT")
+def left(text, num_chars=1):
+    num_chars = to_int(num_chars)
+    if num_chars < 0:
+        raise FormulaError(VALUE)
+    return to_text(text)[:num_chars]
+
+
+@function("RIGHT")
+def right(text, num_chars=1):
+    num_chars = to_int(num_chars)
+    if num_chars < 0:
+        raise FormulaError(VALUE)
+    text = to_text(text)
+    return text[len(text) - num_chars:] if num_chars else ""
+
+
+@function("MID")
+def mid(text, start_num, num_chars):
+    start = to_int(start_num)
+    num_chars = to_int(num_chars)
+    if start < 1 or num_chars < 0:
+        raise FormulaError(VALUE)
+    return to_text(text)[start - 1:start - 1 + num_chars]
+
+
+@function("UPPER")
+def upper(text):
+    return to_text(text).upper()
+
+
+@function("LOWER")
+def lower(text):
+    return to_text(text).lower()
+
+
+@function("PROPER")
+def proper(text):
+    return to_text(text).title()
+
+
+@function("TRIM")
+def trim(text):
+    return re.sub(" +", " ", to_text(text).strip(" "))
+
+
+@function("CONCATENATE")
+def concatenate(*args):
+    return "".join(to_text(arg) for arg in args)
+
+
+def _texts(args):
+    for arg in args:
+        if isinstance(arg, Range):
+            for value in arg:
+                yield to_text(value)
+        else:
+            yield to_text(arg)
+
+
+@function("CONCAT")
+def concat(*args):
+    return "".join(_texts(args))
+
+
+@function("TEXTJOIN")
+def textjoin(delimiter, ignore_empty, *args):
+    texts = _texts(args)
+    if to_bool(ignore_empty):
+        texts = (text for text in texts if text)
+    return to_text(delimiter).join(texts)
+
+
+@function("REPT")
+def rept(text, number_times):
+    number_times = to_int(number_times)
+    if number_times < 0:
+        raise FormulaError(VALUE)
+    return to_text(text) * number_times
+
+
+@function("EXACT")
+def exact(text1, text2):
+    return to_text(text1) == to_text(text2)
+
+
+@function("VALUE")
+def value(text):
+    text = scalar(text)
+    if isinstance(text, bool):
+        raise FormulaError(VALUE)
+    return to_number(text)
+
+
+@function("FIND")
+def find(find_text, within_text, start_num=1):
+    start = to_int(start_num)
+    within = to_text(within_text)
+    if not 1 <= start <= len(within) + 1:
+        raise FormulaError(VALUE)
+    pos = within.find(to_text(find_text), start - 1)
+    if pos < 0:
+        raise FormulaError(VALUE)
+    return pos + 1
+
+
+@function("SEARCH")
+def search(find_text, within_text, start_num=1):
+    start = to_int(start_num)
+    within = to_text(within_text)
+    if not 1 <= start <= len(within) + 1:
+        raise FormulaError(VALUE)
+    match = _wildcard(to_text(find_text)).search(within, start - 1)
+    if match is None:
+        raise FormulaError(VALUE)
+    return match.start() + 1
+
+
+@function("SUBSTITUTE")
+def substitute(text, old_text, new_text, instance_num=None):
+    text = to_text(text)
+    old = to_text(old_text)
+    new = to_text(new_text)
+    if not old:
+        return text
+    if instance_num is None:
+        return text.replace(old, new)
+    instance = to_int(instance_num)
+    if instance < 1:
+        raise FormulaError(VALUE)
+    pos = -1
+    for _ in range(instance):
+        pos = text.find(old, pos + 1)
+        if pos < 0:
+            return text
+    return text[:pos] + new + text[pos + len(old):]
+
+
+# dates and times
+
+
+def _datetime(serial, epoch):
+    serial = to_number(serial)
+    if serial < 0:
+        raise FormulaError(NUM)
+    value = from_excel(serial, epoch)
+    if isinstance(value, datetime.time):
+        value = datetime.datetime.combine(epoch, value)
+    return value
+
+
+def _serial(date, epoch):
+    return int(to_excel(date, epoch))
+
+
+@function("DATE", epoch=True)
+def date(year, month, day, epoch):
+    year = to_int(year)
+    if 0 <= year < 1900:
+        year += 1900
+    month = to_int(month) - 1
+    year += month // 12
+    if not 1 <= year <= 9999:
+        raise FormulaError(NUM)
+    value = datetime.date(year, month % 12 + 1, 1)
+    try:
+        value += datetime.timedelta(days=to_int(day) - 1)
+    except OverflowError:
+        raise FormulaError(NUM)
+    return _serial(value, epoch)
+
+
+@function("TIME")
+def time(hour, minute, second):
+    seconds = to_int(hour) * 3600 + to_int(minute) * 60 + to_int(second)
+    if seconds < 0:
+        raise FormulaError(NUM)
+    return seconds % 86400 / 86400
+
+
+@function("YEAR", epoch=True)
+def year(serial_number, epoch):
+    return _datetime(serial_number, epoch).year
+
+
+@function("MONTH", epoch=True)
+def month(serial_number, epoch):
+    return _datetime(serial_number, epoch).month
+
+
+@function("DAY", epoch=True)
+def day(serial_number, epoch):
+    return _datetime(serial_number, epoch).day
+
+
+def _seconds(serial_number):
+    serial = to_number(serial_number)
+    if serial < 0:
+        raise FormulaError(NUM)
+    return round(serial % 1 * 86400) % 86400
+
+
+@function("HOUR")
+def hour(serial_number):
+    return _seconds(serial_number) // 3600
+
+
+@function("MINUTE")
+def minute(serial_number):
+    return _seconds(serial_number) // 60 % 60
+
+
+@function("SECOND")
+def second(serial_number):
+    return _seconds(serial_number) % 60
+
+
+@function("WEEKDAY", epoch=True)
+def weekday(serial_number, return_type=1, epoch=None):
+    weekday = _datetime(serial_number, epoch).weekday() # Monday is 0
+    return_type = to_int(return_type)
+    if return_type == 1:
+        return (weekday + 1) % 7 + 1
+    if return_type == 2:
+        return weekday + 1
+    if return_type == 3:
+        return weekday
+    raise FormulaError(NUM)
+
+
+def _add_months(serial_number, months, epoch, last_day=False):
+    value = _datetime(serial_number, epoch)
+    month = value.month - 1 + to_int(months)
+    year = value.year + month // 12
+    month = month % 12 + 1
+    if not 1 <= year <= 9999:
+        raise FormulaError(NUM)
+    days = calendar.monthrange(year, month)[1]
+    day = days if last_day else min(value.day, days)
+    return _serial(datetime.date(year, month, day), epoch)
+
+
+@function("EDATE", epoch=True)
+def edate(start_date, months, epoch):
+    return _add_months(start_date, months, epoch)
+
+
+@function("EOMONTH", epoch=True)
+def eomonth(start_date, months, epoch):
+    return _add_months(start_date, months, epoch, last_day=True)
+
+
+@function("DAYS")
+def days(end_date, start_date):
+    return math.floor(to_number(end_date)) - math.floor(to_number(start_date))
+
+
+@function("TODAY", epoch=True, volatile=True)
+def today(epoch):
+    return _serial(datetime.date.today(), epoch)
+
+
+@function("NOW", epoch=True, volatile=True)
+def now(epoch):
+    return to_excel(datetime.datetime.now(), epoch)
+
+
+
+# number formats
+
+FORMAT_TOKEN_RE = re.compile(r'"([^"]*)"|\\(.)|_(.)|\*(.)|\[[^\]]*\]|(.)', re.DOTALL)
+DATE_TOKEN_RE = re.compile(r"am/pm|a/p|\.0+|y+|m+|d+|h+|s+", re.IGNORECASE)
+PLACEHOLDERS = "0#?"
+
+
+def _tokens(text):
+    """
+    The characters of a number format which have a meaning, as (True, char),
+    and the literal text between them, as (False, text). Fills, colours and
+    conditions are ignored.
+    """
+    tokens = []
+    for match in FORMAT_TOKEN_RE.finditer(text):
+        quoted, escaped, space, fill, char = match.groups()
+        if char is not None:
+            tokens.append((True, char))
+        elif quoted is not None:
+            tokens.append((False, quoted))
+        elif escaped is not None:
+            tokens.append((False, escaped))
+        elif space is not None:
+            tokens.append((False, " "))
+    return tokens
+
+
+def _sections(text):
+    """
+    The tokens of the sections of a number format: for positive numbers,
+    negative numbers, zero and text
+    """
+    sections = [[]]
+    for token in _tokens(text):
+        if token == (True, ";"):
+            sections.append([])
+        else:
+            sections[-1].append(token)
+    return sections
+
+
+def _is_placeholder(token):
+    return token[0] and token[1] in PLACEHOLDERS
+
+
+def _literal(tokens):
+    return "".join(text for _, text in tokens)
+
+
+def _integer(digits, tokens):
+    """
+    Fill the placeholders of the integer part of a number format from the
+    right. The first placeholder takes all the digits left over. Missing
+    digits are zeros for 0, spaces for ? and nothing for #.
+    """
+    count = sum(1 for token in tokens if _is_placeholder(token))
+    if not count:
+        return digits + _literal(tokens)
+    parts = []
+    for token in reversed(tokens):
+        if not _is_placeholder(token):
+            parts.append(token[1])
+            continue
+        count -= 1
+        take = digits if count == 0 else digits[-1:]
+        digits = digits[:len(digits) - len(take)]
+        if take:
+            parts.append(take)
+        elif token[1] == "0":
+            parts.append("0")
+        elif token[1] == "?":
+            parts.append(" ")
+    return "".join(reversed(parts))
+
+
+def _fraction(digits, tokens):
+    """
+    Fill the placeholders of the decimal part of a number format from the
+    left. Trailing zeros are only shown for 0.
+    """
+    placeholders = [char for is_format, char in tokens if is_format and char in PLACEHOLDERS]
+    shown = len(digits.rstrip("0"))
+    if "0" in placeholders:
+        shown = max(shown, len(placeholders) - placeholders[::-1].index("0"))
+    parts = []
+    pos = 0
+    for token in tokens:
+        if not _is_placeholder(token):
+            parts.append(token[1])
+            continue
+        if pos < shown:
+            parts.append(digits[pos])
+        elif token[1] == "?":
+            parts.append(" ")
+        pos += 1
+    return "".join(parts)
+
+
+def _group(text):
+    """
+    Add thousands separators to the digits of a number
+    """
+    match = re.search(r"\d+", text)
+    if match is None:
+        return text
+    digits = match.group()
+    groups = []
+    while len(digits) > 3:
+        groups.append(digits[-3:])
+        digits = digits[:-3]
+    groups.append(digits)
+    return text[:match.start()] + ",".join(reversed(groups)) + text[match.end():]
+
+
+def _split(tokens, chars):
+    """
+    Split tokens at the first of the characters
+    """
+    for idx, (is_format, char) in enumerate(tokens):
+        if is_format and char in chars:
+            return tokens[:idx], tokens[idx], tokens[idx + 1:]
+    return tokens, None, []
+
+
+def _format_number(number, tokens):
+    """
+    Format a positive number
+    """
+    number *= 100 ** tokens.count((True, "%"))
+    positions = [idx for idx, token in enumerate(tokens) if _is_placeholder(token)]
+    if not positions:
+        return _literal(tokens)
+    prefix = tokens[:positions[0]]
+    body = tokens[positions[0]:positions[-1] + 1]
+    suffix = tokens[positions[-1] + 1:]
+    # each comma after the last placeholder divides by a thousand
+    while suffix[:1] == [(True, ",")]:
+        number /= 1000
+        suffix = suffix[1:]
+
+    exponent_tokens = []
+    exponent = None
+    mantissa, marker, rest = _split(body, "Ee")
+    if marker is not None and rest[:1] in ([(True, "+")], [(True, "-")]):
+        exponent_sign = rest[0][1]
+        exponent_tokens = rest[1:]
+        body = mantissa
+    int_tokens, point, frac_tokens = _split(body, ".")
+    thousands = (True, ",") in int_tokens
+    int_tokens = [token for token in int_tokens if token != (True, ",")]
+    decimals = sum(1 for token in frac_tokens if _is_placeholder(token))
+
+    if exponent_tokens:
+        places = max(sum(1 for token in int_tokens if _is_placeholder(token)), 1)
+        exponent = 0
+        if number:
+            exponent = math.floor(math.log10(number)) - places + 1
+            if round(number / 10 ** exponent, decimals) >= 10 ** places:
+                exponent += 1
+        number /= 10 ** exponent
+    try:
+        value = Decimal(repr(number)).quantize(Decimal(1).scaleb(-decimals),
+                                               rounding=ROUND_HALF_UP)
+    except InvalidOperation:
+        raise FormulaError(VALUE)
+    int_digits, _, frac_digits = f"{value:f}".partition(".")
+    if int_digits == "0":
+        int_digits = ""
+
+    text = _integer(int_digits, int_tokens)
+    if thousands:
+        text = _group(text)
+    if point is not None:
+        text += "." + _fraction(frac_digits, frac_tokens)
+    if exponent is not None:
+        sign = "-" if exponent < 0 else "+" if exponent_sign == "+" else ""
+        text += "E" + sign + _integer(str(abs(exponent)) if exponent else "", exponent_tokens)
+    return _literal(prefix) + text + _literal(suffix)
+
+
+def _date_codes(tokens):
+    """
+    The date and time codes of a number format, as (code, text), and the
+    literal text between them, as (None, text)
+    """
+    items = []
+    codes = ""
+    for is_format, text in tokens + [(False, "")]:
+        if is_format:
+            codes += text
+            continue
+        pos = 0
+        for match in DATE_TOKEN_RE.finditer(codes):
+            if match.start() > pos:
+                items.append((None, codes[pos:match.start()]))
+            items.append((match.group()[0].lower(), match.group()))
+            pos = match.end()
+        if pos < len(codes):
+            items.append((None, codes[pos:]))
+        codes = ""
+        if text:
+            items.append((None, text))
+    return items
+
+
+def _format_date(serial, tokens, epoch):
+    """
+    Format a serial number as a date or time
+    """
+    if serial < 0:
+        raise FormulaError(VALUE)
+    items = _date_codes(tokens)
+    codes = [code for code, _ in items if code is not None]
+    twelve = "a" in codes
+    places = max((len(text) - 1 for code, text in items if code == "."), default=0)
+    value = _datetime(serial, epoch)
+    # times are rounded to the digits shown
+    unit = 10 ** (6 - places)
+    micro = (value.microsecond + unit // 2) // unit * unit
+    value = value.replace(microsecond=0) + datetime.timedelta(microseconds=micro)
+
+    parts = []
+    pos = 0 # of the code among the codes
+    for code, text in items:
+        if code is None:
+            parts.append(text)
+            continue
+        size = len(text)
+        if code == "m" and size <= 2:
+            # minutes rather than months after hours or before seconds
+            if pos and codes[pos - 1] == "h" or codes[pos + 1:pos + 2] == ["s"]:
+                code = "minute"
+        pos += 1
+        if code == "y":
+            text = f"{value.year % 100:02d}" if size <= 2 else f"{value.year}"
+        elif code == "m":
+            names = [f"{value.month}", f"{value.month:02d}",
+                     calendar.month_abbr[value.month], calendar.month_name[value.month],
+                     calendar.month_name[value.month][0]]
+            text = names[min(size, 5) - 1]
+        elif code == "d":
+            names = [f"{value.day}", f"{value.day:02d}",
+                     calendar.day_abbr[value.weekday()], calendar.day_name[value.weekday()]]
+            text = names[min(size, 4) - 1]
+        elif code == "h":
+            hour = (value.hour % 12 or 12) if twelve else value.hour
+            text = f"{hour:02d}" if size > 1 else f"{hour}"
+        elif code == "minute":
+            text = f"{value.minute:02d}" if size > 1 else f"{value.minute}"
+        elif code == "s":
+            text = f"{value.second:02d}" if size > 1 else f"{value.second}"
+        elif code == ".":
+            text = "." + f"{value.microsecond:06d}"[:size - 1]
+        elif code == "a":
+            pm = value.hour >= 12
+            if size == 5:
+                text = "PM" if pm else "AM"
+            else:
+                text = text[2] if pm else text[0]
+        parts.append(text)
+    return "".join(parts)
+
+
+@function("TEXT", epoch=True)
+def text(value, format_text, epoch):
+    value = scalar(value)
+    sections = _sections(to_text(format_text))
+    if isinstance(value, bool):
+        return to_text(value)
+    try:
+        number = to_number(value)
+    except FormulaError:
+        if len(sections) > 3:
+            return "".join(value if token == (True, "@") else token[1]
+                           for token in sections[3])
+        return value
+
+    sign = ""
+    if number < 0 and len(sections) > 1:
+        tokens = sections[1]
+        number = -number
+    elif number == 0 and len(sections) > 2:
+        tokens = sections[2]
+    else:
+        tokens = sections[0]
+        if number < 0:
+            sign = "-"
+            number = -number
+    codes = "".join(char for is_format, char in tokens if is_format)
+    if not tokens or codes.lower() in ("general", "@"):
+        return sign + to_text(number)
+    if re.search("[dmyhs]", codes, re.IGNORECASE):
+        if sign:
+            raise FormulaError(VALUE)
+        return _format_date(number, tokens, epoch)
+    return sign + _format_number(number, tokens)
@@ -0,0 +1,139 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Find and replace the references in formulae.
+
+Formulae are tokenized once for each shape: cell references such as A1 or
+$B$2 can be replaced by any other without changing how a formula is
+tokenized, so formulae which only differ in their cell references, such as
+those copied down a column, share the same template of literal text and
+references.
+"""
+
+import re
+from functools import lru_cache
+
+from .tokenizer import Tokenizer, Token, TokenizerError
+
+
+# cell references which are not part of a longer name, number or function
+CELL_RE = re.compile(
+    r"(?<![A-Za-z0-9_.$])(\$?[A-Za-z]{1,3}\$?[0-9]{1,7})(?![A-Za-z0-9_.$(!\[])"
+)
+
+
+def _split_tokens(formula):
+    """
+    Split a formula into literal text and range references with the tokenizer
+    """
+    try:
+        tokens = Tokenizer(formula).items
+    except (TokenizerError, IndexError):
+        # unbalanced or malformed formulae are left alone
+        return [formula]
+    if not tokens or tokens[0].type == Token.LITERAL:
+        return [formula]
+
+    # the tokenizer collapses whitespace, so the tokens are found in the
+    # formula to keep it as it is
+    chunks = []
+    literal = ["="]
+    pos = 1
+    for token in tokens:
+        if token.type == Token.WSPACE:
+            m = Tokenizer.WSPACE_RE.match(formula, pos)
+            if m is None:
+                return [formula]
+            value = m.group()
+        elif formula.startswith(token.value, pos):
+            value = token.value
+        else:
+            return [formula]
+        pos += len(value)
+        if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+            chunks.append("".join(literal))
+            chunks.append(value)
+            literal = []
+        else:
+            literal.append(value)
+    if pos != len(formula):
+        return [formula]
+    chunks.append("".join(literal))
+    return chunks
+
+
+@lru_cache(maxsize=2**14)
+def _template(literals):
+    """
+    Format strings for the chunks of formulae with the same literal text
+    between their cell references
+    """
+    slot = "A1"
+    formula = slot.join(literals)
+    templates = []
+    idx = 0 # cell reference
+    pos = len(literals[0]) # position of the next cell reference
+    start = 0
+    for chunk in _split_tokens(formula):
+        end = start + len(chunk)
+        fmt = []
+        last = start
+        while idx < len(literals) - 1 and pos < end:
+            fmt.append(formula[last:pos].replace("{", "{{").replace("}", "}}"))
+            fmt.append(f"{{{idx}}}")
+            last = pos + len(slot)
+            idx += 1
+            pos = last + len(literals[idx])
+        fmt.append(formula[last:end].replace("{", "{{").replace("}", "}}"))
+        templates.append("".join(fmt))
+        start = end
+    return tuple(templates)
+
+
+def split_references(formula):
+    """
+    Split a formula, including the leading "=", into the literal text and
+    the range references in it. References are at the odd positions of the
+    tuple returned, so that joining it gives the formula back.
+    """
+    parts = CELL_RE.split(formula)
+    templates = _template(tuple(parts[::2]))
+    cells = parts[1::2]
+    return tuple(fmt.format(*cells) for fmt in templates)
+
+
+def rewrite_references(formula, func):
+    """
+    Replace each range reference in a formula with the result of calling
+    `func` with it. The formula is returned unchanged if no references are
+    replaced.
+    """
+    chunks = split_references(formula)
+    if len(chunks) == 1:
+        return formula
+    out = list(chunks)
+    changed = False
+    for idx in range(1, len(chunks), 2):
+        ref = chunks[idx]
+        new = func(ref)
+        if new != ref:
+            out[idx] = new
+            changed = True
+    if not changed:
+        return formula
+    return "".join(out)
+
+
+def split_sheet(ref):
+    """
+    Split the worksheet from a reference. Returns the title of the worksheet,
+    or None if the reference is not qualified, the qualifier as it appears in
+    the formula and the rest of the reference.
+    """
+    if "!" not in ref:
+        return None, "", ref
+    sheet, ref = ref.rsplit("!", 1)
+    prefix = sheet + "!"
+    if sheet.startswith("'"):
+        sheet = sheet[1:-1].replace("''", "'")
+    return sheet, prefix, ref
@@ -0,0 +1,247 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import datetime
+
+import pytest
+
+from openpyxl import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.formula import ArrayFormula
+
+from ..functions import FormulaError
+
+
+@pytest.fixture
+def Evaluator():
+    from ..evaluator import Evaluator
+    return Evaluator
+
+
+@pytest.fixture(params=[False, True], ids=["cells", "columnar"])
+def workbook(request):
+    wb = Workbook(columnar_cells=request.param)
+    ws = wb.active
+    ws.title = "Data"
+    for row in range(1, 6):
+        ws.append([row, row * 10, f"item{row}"])
+    return wb
+
+
+@pytest.mark.parametrize("formula, tree",
+                         [
+                             ("=1+2*3", ("op", "+", ("value", 1), ("op", "*", ("value", 2), ("value", 3)))),
+                             ("=-2^2", ("op", "^", ("neg", ("value", 2)), ("value", 2))),
+                             ("=A1&B1", ("op", "&", ("ref", 0), ("ref", 1))),
+                             ("=(1+2)%", ("percent", ("op", "+", ("value", 1), ("value", 2)))),
+                             ('=IF(A1,,"a""b")', ("func", "IF", [("ref", 0), ("value", None), ("value", 'a"b')])),
+                             ("=_xlfn.CONCAT()", ("func", "CONCAT", [])),
+                             ("={1,2;3,4}", ("array", [[("value", 1), ("value", 2)], [("value", 3), ("value", 4)]])),
+                             ("=1.5>=TRUE", ("op", ">=", ("value", 1.5), ("value", True))),
+                             ("=#N/A", ("error", "#N/A")),
+                         ]
+                         )
+def test_parse(formula, tree):
+    from ..evaluator import Parser
+    assert Parser(formula).parse() == tree
+
+
+@pytest.mark.parametrize("formula",
+                         [
+                             "=SUM(",
+                             "=1+",
+                             "=(A1,B1)",
+                             "=A1 B1",
+                             "text",
+                         ]
+                         )
+def test_parse_error(formula):
+    from ..evaluator import Parser
+    with pytest.raises(FormulaError):
+        Parser(formula).parse()
+
+
+class TestEvaluator:
+
+    @pytest.mark.parametrize("formula, expected",
+                             [
+                                 ("=SUM(A1:A5)", 15),
+                                 ("=AVERAGE(B1:B5)*2", 60),
+                                 ("=A2+B2/4", 7),
+                                 ("=VLOOKUP(3,A1:C5,3,FALSE)", "item3"),
+                                 ('=INDEX(B:B,MATCH("ITEM4",C:C,0))', 40),
+                                 ('=IF(AND(A5>4,OR(FALSE,B1=10)),"big","small")', "big"),
+                                 ("=SUMIF(A1:A5,\">2\",B1:B5)", 120),
+                                 ("=COUNT(A:C)", 10),
+                                 ("=C1&\" \"&A1", "item1 1"),
+                                 ("=1/0", "#DIV/0!"),
+                                 ("=IFERROR(1/0,-1)", -1),
+                                 ("=A1+C1", "#VALUE!"),
+                                 ("=Other!A1", "#REF!"),
+                                 ("=UNKNOWN(1)", "#NAME?"),
+                                 ("=Undefined*2", "#NAME?"),
+                                 ("=E1", 0),
+                                 ('=ISBLANK(E1)', True),
+                                 ("=0.1+0.2=0.3", True),
+                                 ("=ROWS(A:A)+COLUMNS(A1:C5)", 1048579),
+                                 ("=XOR(A1>0,B1>0)", False),
+                                 ('=TEXT(B2/3,"0.00")&"!"', "6.67!"),
+                             ]
+                             )
+    def test_formula(self, Evaluator, workbook, formula, expected):
+        ws = workbook.active
+        ws["D1"] = formula
+        ev = Evaluator(workbook)
+        assert ev.value("D1") == expected
+        assert ev.value(ws["D1"]) == expected
+
+
+    def test_values(self, Evaluator, workbook):
+        ws = workbook.active
+        ws["D1"] = "=SUM(A1:A5)"
+        ev = Evaluator(workbook)
+        assert ev.value("Data!$A$2") == 2
+        assert ev.value("Data!E1") is None
+
+
+    def test_chain(self, Evaluator, workbook):
+        ws = workbook.active
+        # formulae which are calculated before the cells they refer to
+        for row in range(1, 2000):
+            ws.cell(row, 4, f"=D{row + 1}+1")
+        ws["D2000"] = "=A5"
+        ev = Evaluator(workbook)
+        assert ev.value("D1") == 2004
+
+
+    def test_other_worksheets(self, Evaluator, workbook):
+        ws = workbook.create_sheet("Bob's Sheet")
+        ws["A1"] = "=SUM(Data!A1:A3)+'Bob''s Sheet'!B1"
+        ws["B1"] = "=Data!B5"
+        ev = Evaluator(workbook)
+        assert ev.value("'Bob''s Sheet'!A1") == 56
+
+
+    def test_defined_names(self, Evaluator, workbook):
+        ws = workbook.active
+        workbook.defined_names["Amounts"] = DefinedName("Amounts", attr_text="Data!$B$1:$B$5")
+        workbook.defined_names["Rate"] = DefinedName("Rate", attr_text="0.5")
+        ws.defined_names["Local"] = DefinedName("Local", attr_text="Data!$A$5*2")
+        ws["D1"] = "=SUM(amounts)*Rate+Local"
+        ev = Evaluator(workbook)
+        assert ev.value("D1") == 85
+        ws["B1"] = 110
+        ev.changed(ws["B1"])
+        assert ev.value("D1") == 135
+
+
+    def test_cell_types(self, Evaluator, workbook):
+        ws = workbook.active
+        ws["E1"] = datetime.date(2024, 1, 31)
+        ws["E2"] = True
+        ws["E3"] = "#N/A"
+        ws["D1"] = "=EDATE(E1,1)"
+        ws["D1"].number_format = "yyyy-mm-dd"
+        ws["D2"] = "=E1+1"
+        ws["D3"] = "=IF(E2,ISNA(E3))"
+        ws["D4"] = "=E3"
+        ev = Evaluator(workbook)
+        assert ev.value("D1") == datetime.datetime(2024, 2, 29)
+        assert ev.value("D2") == 45323
+        assert ev.value("D3") is True
+        assert ev.value("D4") == "#N/A"
+
+
+    def test_array_formula(self, Evaluator, workbook):
+        ws = workbook.active
+        ws["D1"] = ArrayFormula("D1", "=SUM(A1:A5*1)")
+        ws["D2"] = ArrayFormula("D2", "=MAX(B1:B5)")
+        ev = Evaluator(workbook)
+        assert ev.value("D1") == "#VALUE!" # arrays are not calculated
+        assert ev.value("D2") == 50
+
+
+    def test_circular(self, Evaluator, workbook):
+        ws = workbook.active
+        ws["D1"] = "=D2+1"
+        ws["D2"] = "=D1+1"
+        ws["D3"] = "=D3"
+        ev = Evaluator(workbook)
+        assert {ev.value("D1"), ev.value("D2")} == {0, 1}
+        assert ev.value("D3") == 0
+
+
+    def test_volatile(self, Evaluator, workbook):
+        ws = workbook.active
+        ws["D1"] = "=TODAY()"
+        ws["D2"] = "=D1+1"
+        ev = Evaluator(workbook)
+        assert ev.value("D2") == ev.value("D1") + 1
+        ev._values[("Data", 1, 4)] = 0
+        ev.calculate()
+        assert ev.value("D1") > 0
+
+
+class TestIncremental:
+
+    @pytest.fixture
+    def evaluator(self, Evaluator, workbook):
+        ws = workbook.active
+        ws["D1"] = "=SUM(A1:A5)"
+        ws["D2"] = "=D1*2"
+        ws["D3"] = "=B1+1"
+        ws["D4"] = "=VLOOKUP(2,A1:B5,2,FALSE)"
+        ev = Evaluator(workbook)
+        ev.calculate()
+        return ev
+
+
+    def test_clean(self, evaluator):
+        assert evaluator._dirty == set()
+
+
+    def test_value(self, evaluator):
+        ws = evaluator.workbook.active
+        ws["A1"] = 101
+        evaluator.changed(ws["A1"])
+        assert evaluator._dirty == {("Data", 1, 4), ("Data", 2, 4), ("Data", 4, 4)}
+        assert evaluator.value("D2") == 230
+
+
+    def test_only_dirty(self, evaluator):
+        ws = evaluator.workbook.active
+        ws["B2"] = 5
+        evaluator.changed("B2")
+        calculated = []
+        evaluate = evaluator._evaluate
+        def record(formula):
+            calculated.append(formula)
+            return evaluate(formula)
+        evaluator._evaluate = record
+        assert evaluator.value("D4") == 5
+        assert calculated == [evaluator._formulae[("Data", 4, 4)]]
+
+
+    def test_new_formula(self, evaluator):
+        ws = evaluator.workbook.active
+        ws["A2"] = "=D3*2"
+        evaluator.changed(ws["A2"])
+        assert evaluator.value("D2") == 2 * (1 + 22 + 3 + 4 + 5)
+        assert evaluator.value("D4") == "#N/A"
+
+
+    def test_removed_formula(self, evaluator):
+        ws = evaluator.workbook.active
+        ws["D1"] = 7
+        evaluator.changed(ws["D1"])
+        assert ("Data", 1, 4) not in evaluator._formulae
+        assert evaluator.value("D2") == 14
+
+
+    def test_errors(self, evaluator):
+        ws = evaluator.workbook.active
+        ws["A3"] = "=1/0"
+        evaluator.changed(ws["A3"])
+        assert evaluator.value("D2") == "#DIV/0!"
+        ws["A3"] = 3
+        evaluator.changed(ws["A3"])
+        assert evaluator.value("D2") == 30
@@ -0,0 +1,320 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+from ..functions import FUNCTIONS, OPERATORS, FormulaError, Range
+
+
+def call(name, *args):
+    func = FUNCTIONS[name]
+    if func.lazy:
+        args = [lambda arg=arg: arg for arg in args]
+    if func.epoch:
+        from openpyxl.utils.datetime import WINDOWS_EPOCH
+        return func(*args, epoch=WINDOWS_EPOCH)
+    return func(*args)
+
+
+@pytest.fixture
+def table():
+    return Range([
+        [1, "apple", 0.5],
+        [2, "Banana", 1.25],
+        [3, "cherry", None],
+        [5, True, "x"],
+    ])
+
+
+class TestRange:
+
+    def test_numbers(self, table):
+        assert table.numbers() == [1, 0.5, 2, 1.25, 3, 5]
+
+
+    def test_numbers_error(self):
+        with pytest.raises(FormulaError):
+            Range([[1, FormulaError("#N/A")]]).numbers()
+
+
+    @pytest.mark.numpy_required
+    def test_numbers_array(self):
+        import numpy
+        rng = Range([[idx] for idx in range(100)])
+        assert isinstance(rng.numbers(), numpy.ndarray)
+        assert call("SUM", rng) == 4950
+
+
+    def test_scalar(self, table):
+        assert Range([[3]]).scalar() == 3
+        with pytest.raises(FormulaError):
+            table.scalar()
+
+
+    @pytest.mark.parametrize("value, match_type, expected",
+                             [
+                                 (3, 0, 2),
+                                 (4, 1, 2),
+                                 (4, -1, 3),
+                                 (9, 1, 3),
+                             ]
+                             )
+    def test_find(self, table, value, match_type, expected):
+        assert table.find(value, False, match_type) == expected
+
+
+    def test_find_missing(self, table):
+        with pytest.raises(FormulaError):
+            table.find(4, False, 0)
+
+
+@pytest.mark.parametrize("op, left, right, expected",
+                         [
+                             ("+", 1, "2", 3),
+                             ("-", True, None, 1),
+                             ("*", 2, 2.5, 5),
+                             ("/", 1, 4, 0.25),
+                             ("^", 2, 10, 1024),
+                             ("&", "a", 1.0, "a1"),
+                             ("&", 0.1, True, "0.1TRUE"),
+                             ("=", "ABC", "abc", True),
+                             ("<", 99, "a", True),
+                             ("<", "z", False, True),
+                             (">=", None, 0, True),
+                             ("<>", None, "", False),
+                             ("=", 0.1 + 0.2, 0.3, True),
+                             ("<", 0.3, 0.1 + 0.2, False),
+                             ("<>", 1, 1 + 1e-14, True),
+                         ]
+                         )
+def test_operators(op, left, right, expected):
+    assert OPERATORS[op](left, right) == expected
+
+
+@pytest.mark.parametrize("op, left, right, code",
+                         [
+                             ("/", 1, 0, "#DIV/0!"),
+                             ("+", "a", 1, "#VALUE!"),
+                             ("^", -8, 0.5, "#NUM!"),
+                         ]
+                         )
+def test_operator_errors(op, left, right, code):
+    with pytest.raises(FormulaError) as e:
+        OPERATORS[op](left, right)
+    assert e.value.code == code
+
+
+@pytest.mark.parametrize("name, args, expected",
+                         [
+                             ("SUM", (Range([[1, "a", True]]), True, "2"), 4),
+                             ("AVERAGE", (Range([[1, 2, None, 6]]),), 3),
+                             ("COUNT", (Range([[1, "a", None, 2.5]]), "3", "x"), 3),
+                             ("COUNTA", (Range([[1, "a", None, ""]]),), 3),
+                             ("COUNTBLANK", (Range([[1, "", None]]),), 2),
+                             ("MIN", (Range([["a"]]),), 0),
+                             ("MAX", (Range([[1, 7]]), 3), 7),
+                             ("MEDIAN", (1, 4, 2, 8), 3),
+                             ("PRODUCT", (Range([[2, 3]]), 4), 24),
+                             ("ROUND", (2.5,), 3),
+                             ("ROUND", (-1.2345, 2), -1.23),
+                             ("ROUND", (1234, -2), 1200),
+                             ("ROUNDUP", (1.21, 1), 1.3),
+                             ("ROUNDDOWN", (-1.29, 1), -1.2),
+                             ("INT", (-1.5,), -2),
+                             ("MOD", (-3, 2), 1),
+                             ("ABS", (-2,), 2),
+                             ("SQRT", (16,), 4),
+                             ("IF", (0, 1, 2), 2),
+                             ("IF", ("TRUE", 1), 1),
+                             ("IF", (False, 1), False),
+                             ("AND", (Range([[True, 1, "a", None]]), True), True),
+                             ("OR", (False, 0), False),
+                             ("NOT", (0,), True),
+                             ("XOR", (True, Range([[1, 0, "a"]])), False),
+                             ("XOR", (True, False, False), True),
+                             ("ROWS", (Range([[1, 2], [3, 4], [5, 6]]),), 3),
+                             ("ROWS", (Range([[1]], (1048576, 1)),), 1048576),
+                             ("ROWS", (5,), 1),
+                             ("COLUMNS", (Range([[1, 2], [3, 4], [5, 6]]),), 2),
+                             ("CHOOSE", (2, "a", "b", "c"), "b"),
+                             ("ISBLANK", (Range([[None]]),), True),
+                             ("ISNUMBER", ("1",), False),
+                             ("ISTEXT", ("1",), True),
+                             ("LEN", (12.5,), 4),
+                             ("LEFT", ("openpyxl",), "o"),
+                             ("RIGHT", ("openpyxl", 4), "pyxl"),
+                             ("MID", ("openpyxl", 5, 2), "py"),
+                             ("UPPER", ("abc",), "ABC"),
+                             ("PROPER", ("the cat",), "The Cat"),
+                             ("TRIM", ("  a   b ",), "a b"),
+                             ("CONCATENATE", ("a", 1, True), "a1TRUE"),
+                             ("CONCAT", (Range([["a", None, "b"]]),), "ab"),
+                             ("TEXTJOIN", ("-", True, Range([["a", None, "b"]])), "a-b"),
+                             ("REPT", ("ab", 2), "abab"),
+                             ("EXACT", ("a", "A"), False),
+                             ("VALUE", (" 1.5 ",), 1.5),
+                             ("FIND", ("p", "openpyxl", 3), 5),
+                             ("SEARCH", ("P?X", "openpyxl"), 5),
+                             ("SUBSTITUTE", ("a-b-c", "-", "+"), "a+b+c"),
+                             ("SUBSTITUTE", ("a-b-c", "-", "+", 2), "a-b+c"),
+                             ("DATE", (2024, 14, 1), 45689),
+                             ("DATE", (2024, 3, 0), 45351),
+                             ("TIME", (12, 30, 0), 0.5208333333333334),
+                             ("YEAR", (45689,), 2025),
+                             ("MONTH", (45689,), 2),
+                             ("DAY", (45689.75,), 1),
+                             ("HOUR", (45689.75,), 18),
+                             ("MINUTE", (0.5208333333333334,), 30),
+                             ("WEEKDAY", (45689,), 7),
+                             ("WEEKDAY", (45689, 2), 6),
+                             ("EDATE", (45322, 1), 45351),
+                             ("EOMONTH", (45322, 0), 45322),
+                             ("DAYS", (45351, 45322.5), 29),
+                             ("TEXT", (1234.567, "#,##0.00"), "1,234.57"),
+                             ("TEXT", (2.675, "0.00"), "2.68"),
+                             ("TEXT", (0.285, "0.0%"), "28.5%"),
+                             ("TEXT", (0.5, "#.##"), ".5"),
+                             ("TEXT", (0.1, "0.0##"), "0.1"),
+                             ("TEXT", (5, "000"), "005"),
+                             ("TEXT", (5551234567, "000-000-0000"), "555-123-4567"),
+                             ("TEXT", (1234567, '#,##0,"k"'), "1,235k"),
+                             ("TEXT", (12345678, "0.00E+00"), "1.23E+07"),
+                             ("TEXT", (0.000123, "0.0E+00"), "1.2E-04"),
+                             ("TEXT", (-5, "0;(0)"), "(5)"),
+                             ("TEXT", (-5.5, "$0.0"), "-$5.5"),
+                             ("TEXT", (0, '0;-0;"zero"'), "zero"),
+                             ("TEXT", ("1.5", "0.00"), "1.50"),
+                             ("TEXT", ("abc", "0.00"), "abc"),
+                             ("TEXT", ("abc", '0;0;0;"<"@">"'), "<abc>"),
+                             ("TEXT", (True, "0"), "TRUE"),
+                             ("TEXT", (1.5, "General"), "1.5"),
+                             ("TEXT", (45689.75, "yyyy-mm-dd hh:mm"), "2025-02-01 18:00"),
+                             ("TEXT", (45689.75, "dddd, mmmm d"), "Saturday, February 1"),
+                             ("TEXT", (45689.75, "[$-409]d-mmm-yy;@"), "1-Feb-25"),
+                             ("TEXT", (0.75, "h:mm AM/PM"), "6:00 PM"),
+                             ("TEXT", (0.500005, "hh:mm:ss.00"), "12:00:00.43"),
+                         ]
+                         )
+def test_function(name, args, expected):
+    assert call(name, *args) == expected
+
+
+@pytest.mark.parametrize("name, args, code",
+                         [
+                             ("SUM", (Range([[1, FormulaError("#N/A")]]),), "#N/A"),
+                             ("SUM", ("a",), "#VALUE!"),
+                             ("AVERAGE", (Range([["a"]]),), "#DIV/0!"),
+                             ("MOD", (1, 0), "#DIV/0!"),
+                             ("SQRT", (-1,), "#NUM!"),
+                             ("AND", ("a",), "#VALUE!"),
+                             ("CHOOSE", (3, "a"), "#VALUE!"),
+                             ("FIND", ("z", "openpyxl"), "#VALUE!"),
+                             ("VALUE", ("a",), "#VALUE!"),
+                             ("NA", (), "#N/A"),
+                             ("XOR", ("a",), "#VALUE!"),
+                             ("TEXT", (-1, "yyyy"), "#VALUE!"),
+                         ]
+                         )
+def test_function_errors(name, args, code):
+    with pytest.raises(FormulaError) as e:
+        call(name, *args)
+    assert e.value.code == code
+
+
+def test_iferror():
+    def error():
+        raise FormulaError("#N/A")
+    assert FUNCTIONS["IFERROR"](error, lambda: 0) == 0
+    assert FUNCTIONS["IFNA"](error, lambda: 0) == 0
+    assert FUNCTIONS["ISNA"](error) is True
+    assert FUNCTIONS["ISERR"](error) is False
+    assert FUNCTIONS["IFERROR"](lambda: Range([[FormulaError("#REF!")]]), lambda: 1) == 1
+
+
+def test_count_errors():
+    def error():
+        raise FormulaError("#N/A")
+    assert FUNCTIONS["COUNT"](error, lambda: 1) == 1
+    assert FUNCTIONS["COUNTA"](error, lambda: None) == 1
+
+
+class TestLookup:
+
+    def test_vlookup(self, table):
+        assert call("VLOOKUP", 2, table, 3, False) == 1.25
+        names = Range([row[1:] for row in table.rows])
+        assert call("VLOOKUP", "BANANA", names, 2, False) == 1.25
+        assert call("VLOOKUP", 4, table, 2) == "cherry"
+
+
+    def test_vlookup_errors(self, table):
+        with pytest.raises(FormulaError) as e:
+            call("VLOOKUP", 4, table, 2, 0)
+        assert e.value.code == "#N/A"
+        with pytest.raises(FormulaError) as e:
+            call("VLOOKUP", 1, table, 4, 0)
+        assert e.value.code == "#REF!"
+
+
+    def test_hlookup(self, table):
+        assert call("HLOOKUP", 1, table, 2, False) == 2
+
+
+    def test_match(self):
+        column = Range([["a"], ["b"], ["B"], [3]])
+        assert call("MATCH", "B", column, 0) == 2
+        assert call("MATCH", "?", column, 0) == 1
+        assert call("MATCH", 5, column) == 4
+        assert call("MATCH", "c", Range([["a", "b", "d"]]), 1) == 2
+
+
+    def test_index(self, table):
+        assert call("INDEX", table, 2, 2) == "Banana"
+        assert call("INDEX", Range([[1, 2, 3]]), 2) == 2
+        assert call("INDEX", table, 0, 1).column(0) == [1, 2, 3, 5]
+        with pytest.raises(FormulaError):
+            call("INDEX", table, 5, 1)
+
+
+class TestCriteria:
+
+    @pytest.mark.parametrize("criterion, expected",
+                             [
+                                 (2, 1),
+                                 (">2", 2),
+                                 ("<>2", 7),
+                                 ("b*", 1),
+                                 ("<>b*", 7),
+                                 ("", 1),
+                                 ("<>", 7),
+                                 ("TRUE", 1),
+                                 ("<c", 2),
+                             ]
+                             )
+    def test_countif(self, criterion, expected):
+        rng = Range([[1, 2, 3, 5, "apple", "Banana", None, True]])
+        assert call("COUNTIF", rng, criterion) == expected
+
+
+    def test_sumif(self, table):
+        names = Range([[row[1]] for row in table.rows])
+        amounts = Range([[row[2]] for row in table.rows])
+        assert call("SUMIF", names, "<>apple", amounts) == 1.25
+        assert call("SUMIF", Range([[1, 2, 3]]), ">1") == 5
+        assert call("AVERAGEIF", Range([[1, 2, 3]]), ">1") == 2.5
+
+
+    def test_sumifs(self):
+        amounts = Range([[10], [20], [30], [40]])
+        regions = Range([["north"], ["south"], ["north"], ["north"]])
+        years = Range([[2023], [2024], [2024], [2024]])
+        assert call("SUMIFS", amounts, regions, "north", years, ">=2024") == 70
+        assert call("COUNTIFS", regions, "north", years, 2024) == 2
+        assert call("AVERAGEIFS", amounts, regions, "north") == 80 / 3
+
+
+    @pytest.mark.numpy_required
+    def test_sumif_array(self):
+        values = Range([[idx] for idx in range(100)] + [["a"], [None]])
+        assert call("SUMIF", values, ">=90") == sum(range(90, 100))
+        assert call("COUNTIF", values, "<>5") == 101
+        assert call("SUMPRODUCT", values, values) == sum(i * i for i in range(100))
@@ -0,0 +1,62 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+
+@pytest.mark.parametrize("formula, chunks",
+                         [
+                             ("=SUM(A1:B2)+1", ("=SUM(", "A1:B2", ")+1")),
+                             ("='Sheet 1'!A1 & \"A1\"", ("=", "'Sheet 1'!A1", " & \"A1\"")),
+                             ("=A1", ("=", "A1", "")),
+                             ("=NOW()", ("=NOW()",)),
+                             ("Just text", ("Just text",)),
+                             ("=SUM(", ("=SUM(",)),
+                             ("", ("",)),
+                         ]
+                         )
+def test_split_references(formula, chunks):
+    from ..references import split_references
+    assert split_references(formula) == chunks
+    assert "".join(chunks) == formula
+
+
+def test_rewrite_references():
+    from ..references import rewrite_references
+    formula = "=A1+Sheet!B2*A1"
+    assert rewrite_references(formula, lambda ref: ref) is formula
+    assert rewrite_references(formula, str.lower) == "=a1+sheet!b2*a1"
+
+
+@pytest.mark.parametrize("ref, expected",
+                         [
+                             ("A1", (None, "", "A1")),
+                             ("Sheet!A1", ("Sheet", "Sheet!", "A1")),
+                             ("'Bob''s'!A1:B2", ("Bob's", "'Bob''s'!", "A1:B2")),
+                         ]
+                         )
+def test_split_sheet(ref, expected):
+    from ..references import split_sheet
+    assert split_sheet(ref) == expected
+
+
+def test_template_shared():
+    from ..references import split_references, _template
+    split_references("=SUM(A1:B1)*$C$1")
+    hits = _template.cache_info().hits
+    assert split_references("=SUM(A2:B2)*$C$1") == ("=SUM(", "A2:B2", ")*", "$C$1", "")
+    assert _template.cache_info().hits == hits + 1
+
+
+@pytest.mark.parametrize("formula",
+                         [
+                             "=A1  +  B2",
+                             '=IF(A1>1,"{x}",B2)',
+                             "=LOG10(A1)+1E5",
+                             "='Sheet A1'!B2",
+                             "=SUM((A1",
+                         ]
+                         )
+def test_split_like_tokenizer(formula):
+    from ..references import split_references, _split_tokens
+    assert split_references(formula) == tuple(_split_tokens(formula))
+    assert "".join(split_references(formula)) == formula
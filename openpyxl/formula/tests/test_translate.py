@@ -194,6 +194,7 @@ class TestTranslator:
         ("$DEF:$FOV", 25, 25, "$DEF:$FOV"),
         ("HA:$JA", -5, -15, "GL:$JA"),
         ("named1", -33, 33, "named1"),
+        ("Sheet1!named1", 1, 1, "Sheet1!named1"),
         ("A15", -3, 4, "E12"),
         ("$AB303", 3, 2, "$AB306"),
         ("YY$101", 4, 2, "ZA$101"),
@@ -211,6 +212,14 @@ class TestTranslator:
         else:
             assert value == Translator.translate_range(test_str,
                                                        rdelta, cdelta)
+        from ..translate import SharedFormula
+        shared = SharedFormula("=" + test_str, "A1")
+        if value is None:
+            with pytest.raises(TranslatorError):
+                shared.translate_formula(row_delta=rdelta, col_delta=cdelta)
+        else:
+            assert "=" + value == shared.translate_formula(row_delta=rdelta,
+                                                           col_delta=cdelta)
 
     @pytest.mark.parametrize("formula, origin, dest, result", [
         ('=IF(A$3<40%,"",INDEX(Pipeline!B$4:B$138,#REF!))', "A1", "B2",
@@ -231,6 +240,10 @@ class TestTranslator:
                                origin, dest, result):
         trans = Translator(formula, origin)
         assert trans.translate_formula(dest) == result
+        from ..translate import translate_formula
+        assert translate_formula(formula, 1, 1) == result
+        from ..translate import SharedFormula
+        assert SharedFormula(formula, origin).translate_formula(dest) == result
 
 
     def test_translate_formula_coordinates(self, Translator):
@@ -25,7 +25,7 @@ from openpyxl.descriptors.sequence import (
     MultiSequencePart,
 )
 from openpyxl.xml.constants import SHEET_MAIN_NS
-from openpyxl.xml.functions import tostring
+from openpyxl.xml.functions import tostring, xmlfile
 from openpyxl.packaging.relationship import (
     RelationshipList,
     Relationship,
@@ -931,6 +931,10 @@ class CacheDefinition(Serialisable):
         return node
 
 
+    def write_xml(self, xf):
+        self._write_xml(xf, xmlns=SHEET_MAIN_NS)
+
+
     @property
     def path(self):
         return self._path.format(self._id)
@@ -941,8 +945,9 @@ class CacheDefinition(Serialisable):
         Add to zipfile and update manifest
         """
         self._write_rels(archive, manifest)
-        xml = tostring(self.to_tree())
-        archive.writestr(self.path[1:], xml)
+        with archive.open(self.path[1:], "w", force_zip64=True) as out:
+            with xmlfile(out) as xf:
+                self.write_xml(xf)
         manifest.append(self)
 
 
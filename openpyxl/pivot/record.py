@@ -17,7 +17,7 @@ from openpyxl.descriptors.nested import (
 )
 
 from openpyxl.xml.constants import SHEET_MAIN_NS
-from openpyxl.xml.functions import tostring
+from openpyxl.xml.functions import xmlfile
 
 from .fields import (
     Boolean,
@@ -93,6 +93,10 @@ class RecordList(Serialisable):
         return tree
 
 
+    def write_xml(self, xf):
+        self._write_xml(xf, xmlns=SHEET_MAIN_NS)
+
+
     @property
     def path(self):
         return self._path.format(self._id)
@@ -102,8 +106,9 @@ class RecordList(Serialisable):
         """
         Write to zipfile and update manifest
         """
-        xml = tostring(self.to_tree())
-        archive.writestr(self.path[1:], xml)
+        with archive.open(self.path[1:], "w", force_zip64=True) as out:
+            with xmlfile(out) as xf:
+                self.write_xml(xf)
         manifest.append(self)
 
 
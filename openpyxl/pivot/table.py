@@ -17,7 +17,7 @@ from openpyxl.descriptors import (
 from openpyxl.descriptors.excel import ExtensionList, Relation
 from openpyxl.descriptors.sequence import NestedSequence
 from openpyxl.xml.constants import SHEET_MAIN_NS
-from openpyxl.xml.functions import tostring
+from openpyxl.xml.functions import tostring, xmlfile
 from openpyxl.packaging.relationship import (
     RelationshipList,
     Relationship,
@@ -547,6 +547,11 @@ class ConditionalFormatList(Serialisable):
         return super().to_tree(tagname)
 
 
+    def write_xml(self, xf, tagname=None):
+        self._dedupe()
+        self._write_xml(xf, tagname)
+
+
 class Format(Serialisable):
 
     tagname = "format"
@@ -1207,6 +1212,10 @@ class TableDefinition(Serialisable):
         return tree
 
 
+    def write_xml(self, xf):
+        self._write_xml(xf, xmlns=SHEET_MAIN_NS)
+
+
     @property
     def path(self):
         return self._path.format(self._id)
@@ -1217,8 +1226,9 @@ class TableDefinition(Serialisable):
         Add to zipfile and update manifest
         """
         self._write_rels(archive, manifest)
-        xml = tostring(self.to_tree())
-        archive.writestr(self.path[1:], xml)
+        with archive.open(self.path[1:], "w", force_zip64=True) as out:
+            with xmlfile(out) as xf:
+                self.write_xml(xf)
         manifest.append(self)
 
 
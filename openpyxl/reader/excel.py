@@ -4,6 +4,8 @@
 """Read an xlsx file into Python"""
 
 # Python stdlib imports
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from zipfile import ZipFile, ZIP_DEFLATED
 from io import BytesIO
 import os.path
@@ -33,9 +35,10 @@ from openpyxl.xml.constants import (
     XLSX,
 )
 from openpyxl.cell import MergedCell
+from openpyxl.descriptors.base import unvalidated
 from openpyxl.comments.comment_sheet import CommentSheet
 
-from .strings import read_string_table, read_rich_text
+from .strings import read_string_table, read_rich_text, LazyStringTable
 from .workbook import WorkbookParser
 from openpyxl.styles.stylesheet import apply_stylesheet
 
@@ -50,7 +53,7 @@ from openpyxl.packaging.relationship import (
 )
 
 from openpyxl.worksheet._read_only import ReadOnlyWorksheet
-from openpyxl.worksheet._reader import WorksheetReader
+from openpyxl.worksheet._reader import WorksheetReader, parse_worksheet
 from openpyxl.chartsheet import Chartsheet
 from openpyxl.worksheet.table import Table
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
@@ -112,6 +115,40 @@ def _find_workbook_part(package):
     raise IOError("File contains no valid workbook part")
 
 
+_worker_archive = None
+
+
+def _init_worker(filename):
+    """
+    Open the archive once in each worker process
+    """
+    global _worker_archive
+    if filename is not None:
+        _worker_archive = ZipFile(filename, 'r')
+
+
+def _parse_worksheet(path, xml, options, validate=True):
+    """
+    Parse a worksheet in a worker process. Warnings are returned so that they
+    can be issued in the main process.
+    """
+    if xml is None:
+        src = _worker_archive.open(path)
+    else:
+        src = BytesIO(xml)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        with src, _validation(validate):
+            parsed = parse_worksheet(src, **options)
+    return parsed, [(str(w.message), w.category) for w in caught]
+
+
+def _validation(validate):
+    if validate:
+        return nullcontext()
+    return unvalidated()
+
+
 class ExcelReader:
 
     """
@@ -119,7 +156,9 @@ class ExcelReader:
     """
 
     def __init__(self, fn, read_only=False, keep_vba=KEEP_VBA,
-                 data_only=False, keep_links=True, rich_text=False):
+                 data_only=False, keep_links=True, rich_text=False, workers=None,
+                 lazy_strings=False, columnar_cells=False, validate=True):
+        self.filename = fn
         self.archive = _validate_archive(fn)
         self.valid_files = self.archive.namelist()
         self.read_only = read_only
@@ -127,6 +166,13 @@ class ExcelReader:
         self.data_only = data_only
         self.keep_links = keep_links
         self.rich_text = rich_text
+        self.workers = workers
+        self.lazy_strings = lazy_strings
+        if lazy_strings and not read_only:
+            warnings.warn("Shared strings are only decoded lazily in read-only mode")
+        self.columnar_cells = columnar_cells
+        self.validate = validate
+        self.pool = None
         self.shared_strings = []
 
 
@@ -144,7 +190,10 @@ class ExcelReader:
         if ct is not None:
             strings_path = ct.PartName[1:]
             with self.archive.open(strings_path,) as src:
-                self.shared_strings = reader(src)
+                if self.read_only and self.lazy_strings:
+                    self.shared_strings = LazyStringTable(src, self.rich_text)
+                else:
+                    self.shared_strings = reader(src)
 
 
     def read_workbook(self):
@@ -155,6 +204,7 @@ class ExcelReader:
         wb._sheets = []
         wb._data_only = self.data_only
         wb._read_only = self.read_only
+        wb.columnar_cells = self.columnar_cells
         wb.template = wb_part.ContentType in (XLTX, XLTM)
 
         # If are going to preserve the vba then attach a copy of the archive to the
@@ -166,6 +216,8 @@ class ExcelReader:
 
         if self.read_only:
             wb._archive = self.archive
+            if isinstance(self.shared_strings, LazyStringTable):
+                wb._shared_strings = self.shared_strings
 
         self.wb = wb
 
@@ -209,8 +261,58 @@ class ExcelReader:
                 cs.add_chart(c)
 
 
+    def parse_worksheets(self):
+        """
+        Parse the worksheets in a pool of worker processes. The shared strings
+        and styles stay in this process: cells refer to them by index.
+        Returns futures for the parsed worksheets by path.
+        """
+        paths = [rel.target for sheet, rel in self.parser.find_sheets()
+                 if rel.target in self.valid_files and "chartsheet" not in rel.Type]
+        if self.read_only or not self.workers or self.workers < 2 or len(paths) < 2:
+            return {}
+
+        filename = self.filename
+        if not isinstance(filename, (str, os.PathLike)):
+            filename = None # workers cannot reopen the file so are sent the xml
+        options = dict(
+            data_only=self.data_only,
+            epoch=self.wb.epoch,
+            date_formats=self.wb._date_formats,
+            timedelta_formats=self.wb._timedelta_formats,
+            rich_text=self.rich_text,
+        )
+        self.pool = ProcessPoolExecutor(min(self.workers, len(paths)),
+                                        initializer=_init_worker,
+                                        initargs=(filename,))
+        parsed = {}
+        for path in paths:
+            xml = None
+            if filename is None:
+                xml = self.archive.read(path)
+            parsed[path] = self.pool.submit(_parse_worksheet, path, xml, options,
+                                            self.validate)
+        return parsed
+
+
+    def close_pool(self, futures=()):
+        if self.pool is not None:
+            for future in futures:
+                future.cancel()
+            self.pool.shutdown()
+            self.pool = None
+
+
     def read_worksheets(self):
         comment_warning = """Cell '{0}':{1} is part of a merged range but has a comment which will be removed because merged cells cannot contain any data."""
+        parsed = self.parse_worksheets()
+        try:
+            self.bind_worksheets(parsed, comment_warning)
+        finally:
+            self.close_pool(parsed.values())
+
+
+    def bind_worksheets(self, parsed, comment_warning):
         for sheet, rel in self.parser.find_sheets():
             if rel.target not in self.valid_files:
                 continue
@@ -229,6 +331,15 @@ class ExcelReader:
                 ws.sheet_state = sheet.state
                 self.wb._sheets.append(ws)
                 continue
+            elif rel.target in parsed:
+                ws = self.wb.create_sheet(sheet.name)
+                ws._rels = rels
+                (parser, cells), caught = parsed[rel.target].result()
+                for msg, category in caught:
+                    warnings.warn(msg, category)
+                ws_parser = WorksheetReader(ws, None, self.shared_strings, self.data_only, self.rich_text)
+                ws_parser.parser = parser
+                ws_parser.bind_all(cells, self.shared_strings)
             else:
                 fh = self.archive.open(rel.target)
                 ws = self.wb.create_sheet(sheet.name)
@@ -284,6 +395,11 @@ class ExcelReader:
 
 
     def read(self):
+        with _validation(self.validate):
+            self._read()
+
+
+    def _read(self):
         action = "read manifest"
         try:
             self.read_manifest()
@@ -314,7 +430,8 @@ class ExcelReader:
 
 
 def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
-                  data_only=False, keep_links=True, rich_text=False):
+                  data_only=False, keep_links=True, rich_text=False, workers=None,
+                  lazy_strings=False, columnar_cells=False, validate=True):
     """Open the given filename and return the workbook
 
     :param filename: the path to open or a file-like object
@@ -335,6 +452,18 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
     :param rich_text: if set to True openpyxl will preserve any rich text formatting in cells. The default is False
     :type rich_text: bool
 
+    :param workers: number of processes to use to parse worksheets in parallel. The default is to parse them in this process. Not used in read-only mode
+    :type workers: int
+
+    :param lazy_strings: in read-only mode, only decode shared strings when they are needed instead of keeping them all in memory. Ignored, with a warning, unless read_only is set
+    :type lazy_strings: bool
+
+    :param columnar_cells: keep the values and styles of cells by column instead of keeping cells, which uses much less memory. Not used in read-only mode
+    :type columnar_cells: bool
+
+    :param validate: check that the values read are valid. Only disable this for files from trusted sources, such as those written by openpyxl
+    :type validate: bool
+
     :rtype: :class:`openpyxl.workbook.Workbook`
 
     .. note::
@@ -344,6 +473,7 @@ def load_workbook(filename, read_only=False, keep_vba=KEEP_VBA,
 
     """
     reader = ExcelReader(filename, read_only, keep_vba,
-                         data_only, keep_links, rich_text)
+                         data_only, keep_links, rich_text, workers, lazy_strings,
+                         columnar_cells, validate)
     reader.read()
     return reader.wb
@@ -1,22 +1,41 @@
 # Copyright (c) 2010-2024 openpyxl
 
-from openpyxl.cell.text import Text
+from array import array
+from functools import lru_cache
+import mmap
+import re
+from tempfile import TemporaryFile
 
-from openpyxl.xml.functions import iterparse
+from openpyxl.xml.functions import iterparse, fromstring
+from openpyxl.worksheet._reader import parse_text_content
 from openpyxl.xml.constants import SHEET_MAIN_NS
 from openpyxl.cell.rich_text import CellRichText
 
+STRING_TAG = '{%s}si' % SHEET_MAIN_NS
+
+
+def _plain_text(node):
+    text = parse_text_content(node)
+    return text.replace('x005F_', '')
+
+
+def _rich_text(node):
+    text = CellRichText.from_tree(node)
+    if len(text) == 0:
+        text = ''
+    elif len(text) == 1 and isinstance(text[0], str):
+        text = text[0]
+    return text
+
 
 def read_string_table(xml_source):
     """Read in all shared strings in the table"""
 
     strings = []
-    STRING_TAG = '{%s}si' % SHEET_MAIN_NS
 
-    for _, node in iterparse(xml_source):
+    for _, node in iterparse(xml_source, tag=STRING_TAG):
         if node.tag == STRING_TAG:
-            text = Text.from_tree(node).content
-            text = text.replace('x005F_', '')
+            text = _plain_text(node)
             node.clear()
 
             strings.append(text)
@@ -28,17 +47,125 @@ def read_rich_text(xml_source):
     """Read in all shared strings in the table"""
 
     strings = []
-    STRING_TAG = '{%s}si' % SHEET_MAIN_NS
 
-    for _, node in iterparse(xml_source):
+    for _, node in iterparse(xml_source, tag=STRING_TAG):
         if node.tag == STRING_TAG:
-            text = CellRichText.from_tree(node)
-            if len(text) == 0:
-                text = ''
-            elif len(text) == 1 and isinstance(text[0], str):
-                text = text[0]
+            text = _rich_text(node)
             node.clear()
 
             strings.append(text)
 
     return strings
+
+
+SST_RE = re.compile(rb"<([A-Za-z_][\w.-]*:)?sst(?:[\s/][^>]*)?>")
+
+
+class LazyStringTable:
+
+    """
+    Shared strings table that only decodes strings when they are looked up.
+
+    The source is copied to a temporary file and only the offsets of the
+    strings are kept in memory. Recently used strings are cached.
+
+    The offsets are found by scanning the source for the start of string
+    elements. Comments and CDATA sections could contain text which looks like
+    these, so if there are any the whole table is read into memory instead.
+    """
+
+    chunk_size = 1 << 20
+
+    def __init__(self, xml_source, rich_text=False, cache_size=1 << 16):
+        self._decode = _plain_text
+        if rich_text:
+            self._decode = _rich_text
+        self.offsets = array("q")
+        self._file = TemporaryFile()
+        self._header = b""
+        self._footer = b""
+        self._data = b""
+        self._strings = None
+        if not self._index(xml_source):
+            self.offsets = array("q")
+            self._file.seek(0)
+            reader = read_rich_text if rich_text else read_string_table
+            self._strings = reader(self._file)
+        elif self.offsets:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            # the last string ends where the table does
+            self.offsets.append(self._data.rfind(self._footer))
+        self._get = lru_cache(maxsize=cache_size)(self._get)
+
+
+    def _index(self, xml_source):
+        """
+        Copy the source recording where each string starts. Returns False if
+        the offsets cannot be relied upon.
+        """
+        string_re = None
+        indexed = True
+        tail = b""
+        pos = 0 # offset of the tail in the file
+
+        for chunk in iter(lambda: xml_source.read(self.chunk_size), b""):
+            self._file.write(chunk)
+            if not indexed:
+                continue
+            buf = tail + chunk
+            if b"<!" in buf:
+                indexed = False
+                continue
+            start = 0
+            if string_re is None:
+                match = SST_RE.search(buf)
+                if match is None:
+                    tail = buf
+                    continue
+                prefix = match.group(1) or b""
+                self._header = buf[:match.end()]
+                self._footer = b"</" + prefix + b"sst>"
+                string_re = re.compile(b"<" + re.escape(prefix) + rb"si(?=[\s/>])")
+                start = match.end()
+
+            # leave any incomplete tag for the next chunk
+            limit = buf.rfind(b"<", start)
+            if limit == -1 or buf.find(b">", limit) != -1:
+                limit = len(buf)
+            self.offsets.extend(pos + m.start() for m in string_re.finditer(buf, start, limit))
+            tail = buf[limit:]
+            pos += limit
+
+        self._file.flush()
+        return indexed
+
+
+    def __len__(self):
+        if self._strings is not None:
+            return len(self._strings)
+        return max(len(self.offsets) - 1, 0)
+
+
+    def __getitem__(self, idx):
+        if not 0 <= idx < len(self):
+            raise IndexError("string index out of range")
+        return self._get(idx)
+
+
+    def _get(self, idx):
+        if self._strings is not None:
+            return self._strings[idx]
+        fragment = self._data[self.offsets[idx]:self.offsets[idx+1]]
+        tree = fromstring(self._header + fragment + self._footer)
+        return self._decode(tree.find(STRING_TAG))
+
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+
+    def close(self):
+        if not isinstance(self._data, bytes):
+            self._data.close()
+        self._file.close()
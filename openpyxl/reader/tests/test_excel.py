@@ -118,6 +118,36 @@ def test_close_read(datadir, load_workbook, ro):
         assert wb._archive.fp is None
 
 
+def test_lazy_strings(datadir, load_workbook):
+    datadir.chdir()
+    expected = load_workbook("sample.xlsx", read_only=True)
+    wb = load_workbook("sample.xlsx", read_only=True, lazy_strings=True)
+    assert type(wb._shared_strings).__name__ == "LazyStringTable"
+
+    assert list(wb.active.values) == list(expected.active.values)
+    wb.close()
+    expected.close()
+    assert wb._shared_strings._file.closed
+
+
+def test_lazy_strings_not_read_only(datadir, load_workbook):
+    datadir.chdir()
+    with pytest.warns(UserWarning, match="read-only"):
+        wb = load_workbook("sample.xlsx", lazy_strings=True)
+    assert wb.active["A1"].value is not None
+
+
+def test_load_workbook_unvalidated(datadir, load_workbook):
+    from openpyxl.descriptors.base import _validation
+    datadir.chdir()
+    expected = load_workbook("contains_chartsheets.xlsx")
+    wb = load_workbook("contains_chartsheets.xlsx", validate=False)
+    assert _validation.enabled
+    assert wb._fonts == expected._fonts
+    assert wb._cell_styles == expected._cell_styles
+    assert wb.chartsheets[0]._charts[0].series == expected.chartsheets[0]._charts[0].series
+
+
 @pytest.mark.parametrize("wo", [False, True])
 def test_close_write(wo):
     from openpyxl.workbook import Workbook
@@ -164,6 +194,25 @@ def test_file_closes(datadir, load_workbook):
     os.remove(filename)
 
 
+@pytest.mark.parametrize("fileobj", [False, True])
+def test_load_workbook_in_parallel(datadir, load_workbook, fileobj):
+    datadir.chdir()
+    filename = "contains_chartsheets.xlsx"
+    expected = load_workbook(filename)
+
+    if fileobj:
+        with open(filename, "rb") as f:
+            filename = BytesIO(f.read())
+    wb = load_workbook(filename, workers=2)
+
+    assert wb.sheetnames == expected.sheetnames
+    for ws, exp in zip(wb.worksheets, expected.worksheets):
+        if not hasattr(exp, "iter_rows"):
+            continue # chartsheet
+        cells = [(c.coordinate, c.value, c.data_type, c.style_id) for row in ws for c in row]
+        assert cells == [(c.coordinate, c.value, c.data_type, c.style_id) for row in exp for c in row]
+
+
 from ..excel import ExcelReader
 
 
@@ -1,9 +1,14 @@
 # Copyright (c) 2010-2024 openpyxl
 
+from array import array
+from io import BytesIO
+
+import pytest
 
 # package imports
 from openpyxl.reader.strings import read_string_table
 from openpyxl.reader.strings import read_rich_text
+from openpyxl.reader.strings import LazyStringTable
 from openpyxl.cell.rich_text import TextBlock, CellRichText
 from openpyxl.cell.text import InlineFont
 from openpyxl.styles.colors import Color
@@ -35,3 +40,68 @@ def test_formatted_string_table(datadir):
             TextBlock(font=InlineFont(rFont='Calibri', sz="11", family="2", scheme="minor", color=Color(theme=1), b=True, u='single'), text=u'town')]),
             u"     let's play "
         ])
+
+
+class TestLazyStringTable:
+
+    @pytest.mark.parametrize("src",
+                             ["sharedStrings.xml", "sharedStrings-emptystring.xml"]
+                             )
+    def test_strings(self, datadir, monkeypatch, src):
+        monkeypatch.setattr(LazyStringTable, "chunk_size", 16)
+        datadir.chdir()
+        with open(src, "rb") as content:
+            expected = read_string_table(content)
+        with open(src, "rb") as content:
+            table = LazyStringTable(content)
+        assert len(table) == len(expected)
+        assert list(table) == expected
+        table.close()
+
+
+    def test_rich_text(self, datadir):
+        datadir.chdir()
+        src = "shared-strings-rich.xml"
+        with open(src, "rb") as content:
+            expected = read_rich_text(content)
+        with open(src, "rb") as content:
+            table = LazyStringTable(content, rich_text=True)
+        assert repr(list(table)) == repr(expected)
+        table.close()
+
+
+    def test_prefix(self):
+        src = BytesIO(b"""<x:sst xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <x:si><x:t>A &amp; B</x:t></x:si><x:si><x:t xml:space="preserve"> C </x:t></x:si>
+        </x:sst>""")
+        table = LazyStringTable(src)
+        assert table[1] == " C "
+        assert table[0] == "A & B"
+        table.close()
+
+
+    def test_out_of_range(self):
+        src = BytesIO(b"""<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" />""")
+        table = LazyStringTable(src)
+        assert len(table) == 0
+        with pytest.raises(IndexError):
+            table[0]
+        table.close()
+
+
+    @pytest.mark.parametrize("markup",
+                             [
+                                 b"<!-- <si><t>no</t></si> -->",
+                                 b"<![CDATA[<si>]]>",
+                             ]
+                             )
+    def test_comments(self, monkeypatch, markup):
+        monkeypatch.setattr(LazyStringTable, "chunk_size", 16)
+        src = b"""<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <si><t>A</t></si><si><t>%s</t></si><si><t>C</t></si>
+        </sst>""" % markup
+        table = LazyStringTable(BytesIO(src))
+        assert table.offsets == array("q")
+        assert list(table) == read_string_table(BytesIO(src))
+        assert len(table) == 3
+        table.close()
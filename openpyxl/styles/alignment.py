@@ -3,7 +3,7 @@
 from openpyxl.compat import safe_string
 
 from openpyxl.descriptors import Bool, MinMax, Min, Alias, NoneSet
-from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.serialisable import Serialisable, Frozen
 
 
 horizontal_alignments = (
@@ -13,7 +13,7 @@ vertical_aligments = (
     "top", "center", "bottom", "justify", "distributed",
 )
 
-class Alignment(Serialisable):
+class Alignment(Frozen, Serialisable):
     """Alignment options for use in styles."""
 
     tagname = "alignment"
@@ -9,7 +9,7 @@ from openpyxl.descriptors import (
     Sequence,
     Integer,
 )
-from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.serialisable import Serialisable, Frozen
 
 from .colors import ColorDescriptor
 
@@ -30,7 +30,7 @@ BORDER_THICK = 'thick'
 BORDER_THIN = 'thin'
 
 
-class Side(Serialisable):
+class Side(Frozen, Serialisable):
 
     """Border options for use in styles.
     Caution: if you do not specify a border_style, other attributes will
@@ -51,7 +51,7 @@ class Side(Serialisable):
         self.color = color
 
 
-class Border(Serialisable):
+class Border(Frozen, Serialisable):
     """Border positioning for use in styles."""
 
     tagname = "border"
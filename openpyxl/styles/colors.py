@@ -9,8 +9,9 @@ from openpyxl.descriptors import (
     Integer,
     Typed,
 )
+from openpyxl.descriptors.base import _validation
 from openpyxl.descriptors.sequence import NestedSequence
-from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.serialisable import Serialisable, Frozen
 
 # Default Color Index as per 18.8.27 of ECMA Part 4
 COLOR_INDEX = (
@@ -56,15 +57,14 @@ class RGB(Typed):
 
     def __set__(self, instance, value):
         if not self.allow_none:
-            m = aRGB_REGEX.match(value)
-            if m is None:
+            if _validation.enabled and aRGB_REGEX.match(value) is None:
                 raise ValueError("Colors must be aRGB hex values")
             if len(value) == 6:
                 value = "00" + value
         super().__set__(instance, value)
 
 
-class Color(Serialisable):
+class Color(Frozen, Serialisable):
     """Named colors for use in styles."""
 
     tagname = "color"
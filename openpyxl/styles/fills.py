@@ -10,7 +10,7 @@ from openpyxl.descriptors import (
     Integer,
     MinMax,
 )
-from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.serialisable import Serialisable, Frozen
 from openpyxl.compat import safe_string
 
 from .colors import ColorDescriptor, Color
@@ -48,7 +48,7 @@ fills = (FILL_SOLID, FILL_PATTERN_DARKDOWN, FILL_PATTERN_DARKGRAY,
          FILL_PATTERN_MEDIUMGRAY)
 
 
-class Fill(Serialisable):
+class Fill(Frozen, Serialisable):
 
     """Base class"""
 
@@ -119,7 +119,7 @@ DEFAULT_EMPTY_FILL = PatternFill()
 DEFAULT_GRAY_FILL = PatternFill(patternType='gray125')
 
 
-class Stop(Serialisable):
+class Stop(Frozen, Serialisable):
 
     tagname = "stop"
 
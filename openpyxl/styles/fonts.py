@@ -6,7 +6,7 @@ from openpyxl.descriptors import (
     Sequence,
     Integer
 )
-from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.serialisable import Serialisable, Frozen
 
 from openpyxl.descriptors.nested import (
     NestedValue,
@@ -29,7 +29,7 @@ def _no_value(tagname, value, namespace=None):
         return Element(tagname, val=safe_string(value))
 
 
-class Font(Serialisable):
+class Font(Frozen, Serialisable):
     """Font options used in styles."""
 
     UNDERLINE_DOUBLE = 'double'
@@ -1,10 +1,10 @@
 # Copyright (c) 2010-2024 openpyxl
 
 from openpyxl.descriptors import Bool
-from openpyxl.descriptors.serialisable import Serialisable
+from openpyxl.descriptors.serialisable import Serialisable, Frozen
 
 
-class Protection(Serialisable):
+class Protection(Frozen, Serialisable):
     """Protection options for use in styles."""
 
     tagname = "protection"
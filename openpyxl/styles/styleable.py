@@ -13,24 +13,64 @@ from .named_styles import NamedStyle
 from .builtins import styles
 
 
+class BoundStyleArray(StyleArray):
+    """
+    Copy of the style of an object. Changes to it are applied to the object.
+    """
+
+    __slots__ = ('obj',)
+
+    def __new__(cls, obj, args):
+        self = StyleArray.__new__(cls, args)
+        self.obj = obj
+        return self
+
+
+    def __setitem__(self, idx, value):
+        super().__setitem__(idx, value)
+        self.obj._style = self
+
+
+def _update_style(instance, key, value):
+    """
+    Styles are shared so a changed copy replaces the original
+    """
+    style = instance._style
+    if style is None:
+        style = StyleArray()
+    else:
+        style = StyleArray(style)
+    setattr(style, key, value)
+    instance._style = style
+
+
+def _style_value(instance, key):
+    style = instance._style
+    if style is None:
+        return 0
+    return getattr(style, key)
+
+
 class StyleDescriptor:
 
     def __init__(self, collection, key):
         self.collection = collection
         self.key = key
 
+    def index(self, wb, value):
+        """
+        Index of the value in the workbook
+        """
+        return getattr(wb, self.collection).add(value)
+
+
     def __set__(self, instance, value):
-        coll = getattr(instance.parent.parent, self.collection)
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        setattr(instance._style, self.key, coll.add(value))
+        _update_style(instance, self.key, self.index(instance.parent.parent, value))
 
 
     def __get__(self, instance, cls):
         coll = getattr(instance.parent.parent, self.collection)
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        idx =  getattr(instance._style, self.key)
+        idx = _style_value(instance, self.key)
         return StyleProxy(coll[idx])
 
 
@@ -39,22 +79,23 @@ class NumberFormatDescriptor:
     key = "numFmtId"
     collection = '_number_formats'
 
-    def __set__(self, instance, value):
-        coll = getattr(instance.parent.parent, self.collection)
+    def index(self, wb, value):
+        """
+        Index of the number format, builtin formats are not added to the
+        workbook
+        """
         if value in BUILTIN_FORMATS_REVERSE:
-            idx = BUILTIN_FORMATS_REVERSE[value]
-        else:
-            idx = coll.add(value) + BUILTIN_FORMATS_MAX_SIZE
+            return BUILTIN_FORMATS_REVERSE[value]
+        coll = getattr(wb, self.collection)
+        return coll.add(value) + BUILTIN_FORMATS_MAX_SIZE
+
 
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        setattr(instance._style, self.key, idx)
+    def __set__(self, instance, value):
+        _update_style(instance, self.key, self.index(instance.parent.parent, value))
 
 
     def __get__(self, instance, cls):
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        idx = getattr(instance._style, self.key)
+        idx = _style_value(instance, self.key)
         if idx < BUILTIN_FORMATS_MAX_SIZE:
             return BUILTIN_FORMATS.get(idx, "General")
         coll = getattr(instance.parent.parent, self.collection)
@@ -68,8 +109,6 @@ class NamedStyleDescriptor:
 
 
     def __set__(self, instance, value):
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
         coll = getattr(instance.parent.parent, self.collection)
         if isinstance(value, NamedStyle):
             style = value
@@ -88,9 +127,7 @@ class NamedStyleDescriptor:
 
 
     def __get__(self, instance, cls):
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        idx = getattr(instance._style, self.key)
+        idx = _style_value(instance, self.key)
         coll = getattr(instance.parent.parent, self.collection)
         return coll.names[idx]
 
@@ -101,20 +138,19 @@ class StyleArrayDescriptor:
         self.key = key
 
     def __set__(self, instance, value):
-        if instance._style is None:
-            instance._style = StyleArray()
-        setattr(instance._style, self.key, value)
+        _update_style(instance, self.key, value)
 
 
     def __get__(self, instance, cls):
-        if instance._style is None:
-            return False
-        return bool(getattr(instance._style, self.key))
+        return bool(_style_value(instance, self.key))
 
 
 class StyleableObject:
     """
     Base class for styleble objects implementing proxy and lookup functions
+
+    Styles are kept in the workbook and objects only keep the index of their
+    style.
     """
 
     font = StyleDescriptor('_fonts', "fontId")
@@ -127,25 +163,69 @@ class StyleableObject:
     quotePrefix = StyleArrayDescriptor('quotePrefix')
     pivotButton = StyleArrayDescriptor('pivotButton')
 
-    __slots__ = ('parent', '_style')
+    __slots__ = ('parent', '_style_id')
 
     def __init__(self, sheet, style_array=None):
         self.parent = sheet
+        self._style_id = None
         if style_array is not None:
-            style_array = StyleArray(style_array)
-        self._style = style_array
+            self._style = style_array
+
+
+    @property
+    def _style(self):
+        if self._style_id is None:
+            return
+        styles = self.parent.parent._cell_styles
+        return BoundStyleArray(self, styles[self._style_id])
+
+
+    @_style.setter
+    def _style(self, style):
+        if style is None:
+            self._style_id = None
+        else:
+            styles = self.parent.parent._cell_styles
+            self._style_id = styles.add(StyleArray(style))
 
 
     @property
     def style_id(self):
-        if self._style is None:
-            self._style = StyleArray()
-        return self.parent.parent._cell_styles.add(self._style)
+        if self._style_id is None:
+            self._style_id = self.parent.parent._cell_styles.add(StyleArray())
+        return self._style_id
 
 
     @property
     def has_style(self):
-        if self._style is None:
+        if self._style_id is None:
             return False
-        return any(self._style)
+        return any(self.parent.parent._cell_styles[self._style_id])
+
 
+def restyler(wb, **styles):
+    """
+    Return a function that gives the index of the style resulting from
+    applying the styles to a style, given by its index. The result for
+    each style is only worked out once.
+    """
+    changes = []
+    for name, value in styles.items():
+        if value is not None:
+            descriptor = vars(StyleableObject)[name]
+            changes.append((descriptor.key, descriptor.index(wb, value)))
+    cell_styles = wb._cell_styles
+    results = {}
+
+    def restyle(style_id):
+        result = results.get(style_id)
+        if result is None:
+            style = StyleArray()
+            if style_id is not None:
+                style = StyleArray(cell_styles[style_id])
+            for key, idx in changes:
+                setattr(style, key, idx)
+            result = results[style_id] = cell_styles.add(style)
+        return result
+
+    return restyle
@@ -221,6 +221,7 @@ def apply_stylesheet(archive, wb):
 
         # need to overwrite openpyxl defaults in case workbook has different ones
         wb._cell_styles = stylesheet.cell_styles
+        wb._kept_cell_styles = len(wb._cell_styles)
         wb._named_styles = stylesheet.named_styles
         wb._date_formats = stylesheet.date_formats
         wb._timedelta_formats = stylesheet.timedelta_formats
@@ -240,6 +241,40 @@ def apply_stylesheet(archive, wb):
         wb._colors = stylesheet.colors.index
 
 
+def compact_cell_styles(wb):
+    """
+    Remove the cell styles added to the workbook which are no longer used by
+    any cells, rows or columns. Changing each attribute of a style adds a new
+    style so most of these are intermediate ones. Styles read from the
+    workbook are kept.
+    """
+    styles = wb._cell_styles
+    kept = wb._kept_cell_styles
+    if len(styles) <= kept:
+        return
+
+    used = set(range(kept))
+    for ws in wb.worksheets:
+        used |= ws._cells.style_ids()
+        for dims in (ws.row_dimensions, ws.column_dimensions):
+            used.update(dim._style_id for dim in dims.values())
+    used.discard(None)
+    if len(used) == len(styles):
+        return
+
+    ids = sorted(used)
+    mapping = [0] * len(styles)
+    for new, old in enumerate(ids):
+        mapping[old] = new
+    for ws in wb.worksheets:
+        ws._cells.map_style_ids(mapping)
+        for dims in (ws.row_dimensions, ws.column_dimensions):
+            for dim in dims.values():
+                if dim._style_id is not None:
+                    dim._style_id = mapping[dim._style_id]
+    wb._cell_styles = IndexedList(styles[idx] for idx in ids)
+
+
 def write_stylesheet(wb):
     stylesheet = Stylesheet()
     stylesheet.fonts = wb._fonts
@@ -3,6 +3,7 @@
 import pytest
 
 from openpyxl.utils.indexed_list import IndexedList
+from ..cell_style import StyleArray
 from ..named_styles import (
     NamedStyleList,
     NamedStyle,
@@ -39,6 +40,7 @@ def Workbook():
         _alignments = IndexedList()
         _number_formats = IndexedList()
         _named_styles = NamedStyleList()
+        _cell_styles = IndexedList([StyleArray()])
 
         def add_named_style(self, style):
             self._named_styles.append(style)
@@ -142,3 +144,23 @@ class TestNamedStyle:
         assert s1.pivotButton is False
         s1.pivotButton = True
         assert s1.pivotButton is True
+
+
+def test_shared_style():
+    from openpyxl import Workbook
+    from ..fonts import Font
+
+    ws = Workbook().active
+    a1 = ws["A1"]
+    b1 = ws["B1"]
+    a1.font = Font(bold=True)
+    b1.font = Font(bold=True)
+    assert a1.style_id == b1.style_id
+
+    b1.font = Font(italic=True)
+    assert a1.font.b is True
+    assert b1.font.b is False
+    assert a1.style_id != b1.style_id
+
+    a1._style.fontId = b1._style.fontId
+    assert a1.style_id == b1.style_id
@@ -328,6 +328,44 @@ def test_write_worksheet(Stylesheet):
     assert diff is None, diff
 
 
+@pytest.mark.parametrize("columnar", [False, True])
+def test_compact_cell_styles(columnar):
+    from ..stylesheet import compact_cell_styles
+    from ..fonts import Font
+    from ..alignment import Alignment
+    wb = Workbook(columnar_cells=columnar)
+    ws = wb.active
+    for row in range(1, 11):
+        cell = ws.cell(row, 1, row)
+        cell.font = Font(size=10 + row % 2)
+        cell.alignment = Alignment(horizontal="center")
+    ws["B1"] = "unstyled"
+    ws.row_dimensions[3].font = Font(bold=True)
+    ws.column_dimensions["C"].alignment = Alignment(vertical="top")
+    assert len(wb._cell_styles) == 7
+
+    compact_cell_styles(wb)
+    assert len(wb._cell_styles) == 5
+    assert [ws.cell(row, 1).font.sz for row in range(1, 5)] == [11, 10, 11, 10]
+    assert ws["A1"].alignment.horizontal == "center"
+    assert ws["B1"].has_style is False
+    assert ws.row_dimensions[3].font.b is True
+    assert ws.column_dimensions["C"].alignment.vertical == "top"
+
+
+def test_compact_loaded_cell_styles():
+    from ..stylesheet import compact_cell_styles
+    from ..fonts import Font
+    wb = Workbook()
+    wb._cell_styles.add(StyleArray([1, 0, 0, 0, 0, 0, 0, 0, 0]))
+    wb._kept_cell_styles = 2 # as if read from a file
+    wb.active["A1"].font = Font(bold=True)
+    wb.active["A1"].font = Font(italic=True)
+    compact_cell_styles(wb)
+    assert len(wb._cell_styles) == 3
+    assert wb.active["A1"].style_id == 2
+
+
 def test_simple_styles(datadir):
     import datetime
     from ..protection import Protection
@@ -0,0 +1,129 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Collect the values of worksheet columns in NumPy arrays
+"""
+
+import datetime
+import numpy
+
+
+INT64 = numpy.dtype("int64")
+FLOAT64 = numpy.dtype("float64")
+OBJECT = numpy.dtype(object)
+
+DTYPES = {
+    int: INT64,
+    float: FLOAT64,
+    datetime.datetime: numpy.dtype("datetime64[us]"),
+    datetime.timedelta: numpy.dtype("timedelta64[us]"),
+}
+
+# values accepted by each kind of array
+ACCEPTS = {
+    "i": (int,),
+    "f": (int, float, type(None)),
+    "M": (datetime.datetime, type(None)),
+    "m": (datetime.timedelta, type(None)),
+}
+
+MISSING = {
+    "f": numpy.nan,
+    "M": numpy.datetime64("NaT"),
+    "m": numpy.timedelta64("NaT"),
+    "O": None,
+}
+
+INT64_MIN = numpy.iinfo(INT64).min
+INT64_MAX = numpy.iinfo(INT64).max
+
+
+class ColumnArray:
+
+    """
+    Growable array for the values of a column.
+
+    Unless a dtype is given, it is inferred from the values: integers become
+    int64 (or float64 if there are any floats or missing values), floats
+    float64, datetimes datetime64 and timedeltas timedelta64. Anything else,
+    including a mixture of types, is kept in an object array. Missing values
+    are NaN, NaT or None, depending upon the dtype. A given dtype that cannot
+    represent missing values, such as an integer dtype, raises a ValueError.
+    """
+
+    def __init__(self, dtype=None, size=1024):
+        self.size = max(size, 1)
+        self.length = 0
+        self.fixed = dtype is not None
+        self.data = None
+        if self.fixed:
+            self.data = numpy.empty(self.size, dtype=dtype)
+
+
+    def append(self, value):
+        if self.data is None:
+            # the dtype is unknown until there is a value
+            if value is None:
+                self.length += 1
+                return
+            self._allocate(DTYPES.get(type(value), OBJECT))
+        elif self.length == len(self.data):
+            self.data.resize(2 * len(self.data), refcheck=False)
+
+        kind = self.data.dtype.kind
+        if not self.fixed and kind != "O" and not self._accepts(kind, value):
+            kind = self._convert(kind, value)
+        if value is None:
+            if kind not in MISSING:
+                raise ValueError(f"Missing values cannot be stored in {self.data.dtype} arrays")
+            value = MISSING[kind]
+        self.data[self.length] = value
+        self.length += 1
+
+
+    def _accepts(self, kind, value):
+        if type(value) not in ACCEPTS[kind]:
+            return False
+        if kind == "i":
+            return INT64_MIN <= value <= INT64_MAX
+        return True
+
+
+    def _allocate(self, dtype):
+        """
+        Create the array once the dtype is known, any values so far are
+        missing
+        """
+        missing = self.length
+        if missing and dtype == INT64:
+            dtype = FLOAT64
+        self.data = numpy.empty(max(self.size, missing + 1), dtype=dtype)
+        if missing:
+            self.data[:missing] = MISSING[self.data.dtype.kind]
+
+
+    def _convert(self, kind, value):
+        """
+        Change the dtype of the array so that it can hold the value
+        """
+        if kind == "i" and (value is None or type(value) is float):
+            dtype = FLOAT64
+        else:
+            dtype = OBJECT
+
+        data = self.data.astype(dtype)
+        if dtype == OBJECT and kind == "f":
+            # use None rather than NaN for missing values
+            data[:self.length][numpy.isnan(self.data[:self.length])] = None
+        self.data = data
+        return data.dtype.kind
+
+
+    def to_array(self):
+        """
+        Return the values trimmed to the number appended
+        """
+        if self.data is None:
+            self._allocate(OBJECT)
+        self.data.resize(self.length, refcheck=False)
+        return self.data
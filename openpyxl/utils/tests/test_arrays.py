@@ -0,0 +1,103 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import datetime
+
+import pytest
+
+
+@pytest.fixture
+def ColumnArray():
+    from ..arrays import ColumnArray
+    return ColumnArray
+
+
+def collect(ColumnArray, values, dtype=None, size=2):
+    array = ColumnArray(dtype, size)
+    for v in values:
+        array.append(v)
+    return array.to_array()
+
+
+@pytest.mark.numpy_required
+class TestColumnArray:
+
+    def test_int(self, ColumnArray):
+        arr = collect(ColumnArray, [1, 2, 3, 4, 5])
+        assert arr.dtype == "int64"
+        assert arr.tolist() == [1, 2, 3, 4, 5]
+
+
+    @pytest.mark.parametrize("values",
+                             [
+                                 [1, None, 3],
+                                 [None, 2, 3],
+                                 [1, 2.5, 3],
+                             ]
+                             )
+    def test_int_to_float(self, ColumnArray, values):
+        import numpy
+        arr = collect(ColumnArray, values)
+        assert arr.dtype == "float64"
+        assert numpy.array_equal(arr, numpy.array(values, dtype=float), equal_nan=True)
+
+
+    def test_float_to_object(self, ColumnArray):
+        arr = collect(ColumnArray, [1.5, None, "a"])
+        assert arr.dtype == object
+        assert arr.tolist() == [1.5, None, "a"]
+
+
+    def test_datetime(self, ColumnArray):
+        import numpy
+        arr = collect(ColumnArray, [None, datetime.datetime(2024, 1, 1, 12)])
+        assert arr.dtype == "datetime64[us]"
+        assert numpy.isnat(arr[0])
+        assert arr[1] == numpy.datetime64("2024-01-01T12:00")
+
+
+    def test_timedelta(self, ColumnArray):
+        arr = collect(ColumnArray, [datetime.timedelta(hours=1)])
+        assert arr.dtype == "timedelta64[us]"
+
+
+    @pytest.mark.parametrize("values",
+                             [
+                                 [True, False],
+                                 [1, True],
+                                 [1, 2**64],
+                                 ["a", 1],
+                                 [datetime.datetime(2024, 1, 1), "a"],
+                             ]
+                             )
+    def test_object(self, ColumnArray, values):
+        arr = collect(ColumnArray, values)
+        assert arr.dtype == object
+        assert arr.tolist() == values
+
+
+    def test_all_missing(self, ColumnArray):
+        arr = collect(ColumnArray, [None, None, None])
+        assert arr.dtype == object
+        assert arr.tolist() == [None, None, None]
+
+
+    def test_empty(self, ColumnArray):
+        arr = collect(ColumnArray, [])
+        assert len(arr) == 0
+
+
+    def test_dtype(self, ColumnArray):
+        arr = collect(ColumnArray, [1, 2, 3], dtype="float32")
+        assert arr.dtype == "float32"
+        assert arr.tolist() == [1.0, 2.0, 3.0]
+
+
+    def test_invalid_value_for_dtype(self, ColumnArray):
+        with pytest.raises(ValueError):
+            collect(ColumnArray, [1, "a"], dtype="int64")
+
+
+    @pytest.mark.parametrize("dtype", ["int64", "uint8", "bool"])
+    def test_missing_value_for_dtype(self, ColumnArray, dtype):
+        with pytest.raises(ValueError):
+            collect(ColumnArray, [1, None], dtype=dtype)
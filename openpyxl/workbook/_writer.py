@@ -162,6 +162,10 @@ class WorkbookWriter:
         theme =  Relationship(type='theme', Target='theme/theme1.xml')
         self.rels.append(theme)
 
+        if self.wb._string_table:
+            strings = Relationship(type='sharedStrings', Target='sharedStrings.xml')
+            self.rels.append(strings)
+
         if self.wb.vba_archive:
             vba =  Relationship(type='', Target='vbaProject.bin')
             vba.Type ='http://schemas.microsoft.com/office/2006/relationships/vbaProject'
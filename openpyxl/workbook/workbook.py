@@ -53,12 +53,16 @@ class Workbook:
 
     _read_only = False
     _data_only = False
+    _string_table = None
     template = False
     path = "/xl/workbook.xml"
 
     def __init__(self,
                  write_only=False,
                  iso_dates=False,
+                 share_strings=True,
+                 columnar_cells=False,
+                 share_formulae=False,
                  ):
         self._sheets = []
         self._pivots = []
@@ -80,6 +84,9 @@ class Workbook:
         self.epoch = WINDOWS_EPOCH
         self.encoding = "utf-8"
         self.iso_dates = iso_dates
+        self.share_strings = share_strings
+        self.columnar_cells = columnar_cells
+        self.share_formulae = share_formulae
 
         if not self.write_only:
             self._sheets.append(Worksheet(self))
@@ -112,6 +119,7 @@ class Workbook:
 
         self._colors = COLOR_INDEX
         self._cell_styles = IndexedList([StyleArray()])
+        self._kept_cell_styles = 1 # written even if nothing uses them
         self._named_styles = NamedStyleList()
         self.add_named_style(NamedStyle(font=copy(DEFAULT_FONT), border=copy(DEFAULT_BORDER), builtinId=0))
         self._table_styles = TableStyleList()
@@ -370,10 +378,13 @@ class Workbook:
         return ct
 
 
-    def save(self, filename):
+    def save(self, filename, workers=None):
         """Save the current workbook under the given `filename`.
         Use this function instead of using an `ExcelWriter`.
 
+        Worksheets can be written in parallel by passing the number of
+        processes to use as `workers`. This is ignored in write-only mode.
+
         .. warning::
             When creating your workbook using `write_only` set to True,
             you will only be able to call this function once. Subsequent attempts to
@@ -383,7 +394,7 @@ class Workbook:
             raise TypeError("""Workbook is read-only""")
         if self.write_only and not self.worksheets:
             self.create_sheet()
-        save_workbook(self, filename)
+        save_workbook(self, filename, workers)
 
 
     @property
@@ -420,6 +431,8 @@ class Workbook:
         """
         if hasattr(self, '_archive'):
             self._archive.close()
+        if hasattr(self, '_shared_strings'):
+            self._shared_strings.close()
 
 
     def _duplicate_name(self, name):
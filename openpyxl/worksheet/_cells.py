@@ -0,0 +1,655 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Storage for the cells of a worksheet
+"""
+
+from array import array
+from collections import defaultdict
+from collections.abc import MutableMapping
+
+from openpyxl.cell import Cell, MergedCell
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.utils import get_column_letter
+
+
+class _CellCounts:
+
+    """
+    Number of cells in each row and column from which the bounds of the
+    cells are found.
+    """
+
+    def _reset_counts(self):
+        self._rows = {}
+        self._cols = {}
+        self._row_bounds = None
+        self._col_bounds = None
+
+
+    def _add_row(self, row):
+        self._rows[row] = 1
+        bounds = self._row_bounds
+        if bounds is not None:
+            self._row_bounds = (min(bounds[0], row), max(bounds[1], row))
+        elif len(self._rows) == 1:
+            self._row_bounds = (row, row)
+
+
+    def _add_col(self, col):
+        self._cols[col] = 1
+        bounds = self._col_bounds
+        if bounds is not None:
+            self._col_bounds = (min(bounds[0], col), max(bounds[1], col))
+        elif len(self._cols) == 1:
+            self._col_bounds = (col, col)
+
+
+    def _add(self, row, col):
+        rows = self._rows
+        if row in rows:
+            rows[row] += 1
+        else:
+            self._add_row(row)
+        cols = self._cols
+        if col in cols:
+            cols[col] += 1
+        else:
+            self._add_col(col)
+
+
+    def _remove(self, row, col):
+        rows = self._rows
+        rows[row] -= 1
+        if not rows[row]:
+            del rows[row]
+            if self._row_bounds is not None and row in self._row_bounds:
+                self._row_bounds = None # recalculate when needed
+
+        cols = self._cols
+        cols[col] -= 1
+        if not cols[col]:
+            del cols[col]
+            if self._col_bounds is not None and col in self._col_bounds:
+                self._col_bounds = None
+
+
+    def _shift_counts(self, shift, removed):
+        """
+        Move the counts of the rows or columns that have been shifted and
+        take the cells that have been deleted from the counts of the other
+        columns or rows
+        """
+        if shift.rows:
+            counts, other = self._rows, self._cols
+        else:
+            counts, other = self._cols, self._rows
+        shifted = {}
+        for idx, count in counts.items():
+            idx = shift.index(idx)
+            if idx is not None:
+                shifted[idx] = count
+        for idx, count in removed.items():
+            other[idx] -= count
+            if not other[idx]:
+                del other[idx]
+        if shift.rows:
+            self._rows = shifted
+        else:
+            self._cols = shifted
+        self._row_bounds = None
+        self._col_bounds = None
+
+
+    def row_count(self, row):
+        """
+        Number of cells in a row
+        """
+        return self._rows.get(row, 0)
+
+
+    @property
+    def row_bounds(self):
+        """
+        Smallest and largest row with cells or None if there are no cells
+        """
+        if self._row_bounds is None and self._rows:
+            self._row_bounds = (min(self._rows), max(self._rows))
+        return self._row_bounds
+
+
+    @property
+    def col_bounds(self):
+        """
+        Smallest and largest column with cells or None if there are no cells
+        """
+        if self._col_bounds is None and self._cols:
+            self._col_bounds = (min(self._cols), max(self._cols))
+        return self._col_bounds
+
+
+class CellStore(_CellCounts, dict):
+
+    """
+    Cells of a worksheet keyed by (row, column).
+
+    The number of cells in each row and column is kept up to date as cells
+    are added and removed so that the bounds of the worksheet can be found
+    without looking at every cell.
+    """
+
+    def __init__(self, cells=()):
+        super().__init__()
+        self._reset_counts()
+        self.update(cells)
+
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+    def __setitem__(self, key, value):
+        if key not in self:
+            row, col = key
+            rows = self._rows
+            if row in rows:
+                rows[row] += 1
+            else:
+                self._add_row(row)
+            cols = self._cols
+            if col in cols:
+                cols[col] += 1
+            else:
+                self._add_col(col)
+        dict.__setitem__(self, key, value)
+
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._remove(*key)
+
+
+    def pop(self, key, *default):
+        if key in self:
+            self._remove(*key)
+        return super().pop(key, *default)
+
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._remove(*key)
+        return key, value
+
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+
+    def update(self, *args, **kw):
+        cells = dict(*args, **kw)
+        rows = self._rows
+        cols = self._cols
+        for row, col in cells:
+            if (row, col) in self:
+                continue
+            if row in rows:
+                rows[row] += 1
+            else:
+                self._add_row(row)
+            if col in cols:
+                cols[col] += 1
+            else:
+                self._add_col(col)
+        dict.update(self, cells)
+
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+
+    def clear(self):
+        super().clear()
+        self._reset_counts()
+
+
+    def copy(self):
+        return self.__class__(self)
+
+
+    def shift(self, shift):
+        """
+        Move all the cells in the rows or columns of a Shift in one go and
+        delete those that are moved over
+        """
+        index = shift.index
+        end = shift.end
+        cells = {}
+        removed = defaultdict(int)
+        for key, cell in dict.items(self):
+            row, col = key
+            if (row if shift.rows else col) < end:
+                cells[key] = cell
+                continue
+            if shift.rows:
+                row = index(row)
+                if row is None:
+                    removed[col] += 1
+                    continue
+                cell.row = row
+            else:
+                col = index(col)
+                if col is None:
+                    removed[row] += 1
+                    continue
+                cell.column = col
+            link = getattr(cell, "_hyperlink", None)
+            if link is not None:
+                link.ref = cell.coordinate
+            cells[row, col] = cell
+        dict.clear(self)
+        dict.update(self, cells)
+        self._shift_counts(shift, removed)
+
+
+    def formulae(self):
+        """
+        Cells with formulae
+        """
+        return [cell for cell in dict.values(self) if cell.data_type == "f"]
+
+
+    def style_ids(self):
+        """
+        Indices of the styles used by cells
+        """
+        return {cell._style_id for cell in dict.values(self)} - {None}
+
+
+    def map_style_ids(self, mapping):
+        """
+        Change the style index of each cell to the one it maps to
+        """
+        for cell in dict.values(self):
+            if cell._style_id is not None:
+                cell._style_id = mapping[cell._style_id]
+
+
+    def by_row(self):
+        """
+        Rows with cells, in order, and their cells ordered by column
+        """
+        rows = defaultdict(list)
+        for (row, col), cell in sorted(self.items()):
+            rows[row].append(cell)
+        return rows.items()
+
+
+class ColumnarCell(Cell):
+
+    """
+    Cell whose value, type and style are kept by a ColumnarCellStore.
+    Cells are created when they are looked up and are only a view of the
+    store.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        # views of the same cell
+        return (type(other) is type(self) and other.parent is self.parent
+                and other.row == self.row and other.column == self.column)
+
+
+    def __hash__(self):
+        return hash((id(self.parent), self.row, self.column))
+
+
+    def _column(self):
+        return self.parent._cells._columns[self.column]
+
+
+    @property
+    def _value(self):
+        return self._column().values[self.row - 1]
+
+    @_value.setter
+    def _value(self, value):
+        self._column().values[self.row - 1] = value
+
+
+    @property
+    def data_type(self):
+        return self.parent._cells._data_types[self._column().types[self.row - 1]]
+
+    @data_type.setter
+    def data_type(self, value):
+        self._column().types[self.row - 1] = self.parent._cells._type_code(value)
+
+
+    @property
+    def _style_id(self):
+        return self._column().styles[self.row - 1]
+
+    @_style_id.setter
+    def _style_id(self, value):
+        self._column().styles[self.row - 1] = self.parent._cells._style_index(value)
+
+
+    @property
+    def _hyperlink(self):
+        return self.parent._cells._hyperlinks.get((self.row, self.column))
+
+    @_hyperlink.setter
+    def _hyperlink(self, value):
+        self.parent._cells._set_extra("_hyperlinks", (self.row, self.column), value)
+
+
+    @property
+    def _comment(self):
+        return self.parent._cells._comments.get((self.row, self.column))
+
+    @_comment.setter
+    def _comment(self, value):
+        self.parent._cells._set_extra("_comments", (self.row, self.column), value)
+
+
+class ColumnarMergedCell(MergedCell):
+
+    """
+    Merged cell kept by a ColumnarCellStore
+    """
+
+    __slots__ = ()
+
+    __eq__ = ColumnarCell.__eq__
+    __hash__ = ColumnarCell.__hash__
+    _column = ColumnarCell._column
+    _style_id = ColumnarCell._style_id
+
+
+class _Column:
+
+    """
+    Values, data types and style ids of the cells in a column, indexed by
+    row. A data type of 0 means that there is no cell.
+    """
+
+    __slots__ = ('values', 'types', 'styles')
+
+    def __init__(self):
+        self.values = []
+        self.types = bytearray()
+        self.styles = array('I')
+
+
+    def extend(self, size):
+        missing = size - len(self.types)
+        if missing > 0:
+            self.values.extend([None] * missing)
+            self.types.extend(bytes(missing))
+            self.styles.extend(bytes(missing))
+
+
+MERGED = 1
+
+
+class ColumnarCellStore(_CellCounts, MutableMapping):
+
+    """
+    Cells of a worksheet keyed by (row, column) but stored by column.
+
+    Only the value, data type and style id of each cell are kept, which uses
+    much less memory than keeping cells. Hyperlinks and comments are kept
+    separately. Cells are stored by copying and looking up a cell returns
+    a ColumnarCell for it.
+    """
+
+    def __init__(self, worksheet):
+        self._reset_counts()
+        self.worksheet = worksheet
+        self._columns = {}
+        self._hyperlinks = {}
+        self._comments = {}
+        self._data_types = [None, None] # no cell, merged cell
+        self._type_codes = {}
+        self._size = 0
+        self._styles = None
+        self._default_style = 0
+
+
+    def _type_code(self, data_type):
+        code = self._type_codes.get(data_type)
+        if code is None:
+            code = self._type_codes[data_type] = len(self._data_types)
+            self._data_types.append(data_type)
+        return code
+
+
+    def _style_index(self, style_id):
+        if style_id is None:
+            styles = self.worksheet.parent._cell_styles
+            # the styles are replaced when workbooks are read
+            if styles is not self._styles:
+                self._styles = styles
+                self._default_style = styles.add(StyleArray())
+            return self._default_style
+        return style_id
+
+
+    def _set_extra(self, name, key, value):
+        extra = getattr(self, name)
+        if value is None:
+            extra.pop(key, None)
+        else:
+            extra[key] = value
+
+
+    def _code(self, row, col):
+        column = self._columns.get(col)
+        if column is None or not 0 < row <= len(column.types):
+            return 0
+        return column.types[row - 1]
+
+
+    def _cell(self, row, col, code):
+        cls = ColumnarCell
+        if code == MERGED:
+            cls = ColumnarMergedCell
+        cell = cls.__new__(cls)
+        cell.parent = self.worksheet
+        cell.row = row
+        cell.column = col
+        return cell
+
+
+    def __getitem__(self, key):
+        row, col = key
+        code = self._code(row, col)
+        if not code:
+            raise KeyError(key)
+        return self._cell(row, col, code)
+
+
+    def __contains__(self, key):
+        return bool(self._code(*key))
+
+
+    def __setitem__(self, key, cell):
+        row, col = key
+        column = self._columns.get(col)
+        if column is None:
+            column = self._columns[col] = _Column()
+        if row > len(column.types):
+            column.extend(row)
+
+        idx = row - 1
+        if isinstance(cell, MergedCell):
+            value = None
+            code = MERGED
+        else:
+            value = cell._value
+            code = self._type_code(cell.data_type)
+        style = self._style_index(cell._style_id)
+        hyperlink = getattr(cell, "_hyperlink", None)
+        comment = cell._comment
+
+        if not column.types[idx]:
+            self._add(row, col)
+            self._size += 1
+        column.values[idx] = value
+        column.types[idx] = code
+        column.styles[idx] = style
+        self._set_extra("_hyperlinks", key, hyperlink)
+        self._set_extra("_comments", key, comment)
+
+
+    def __delitem__(self, key):
+        row, col = key
+        if not self._code(row, col):
+            raise KeyError(key)
+        column = self._columns[col]
+        column.values[row - 1] = None
+        column.types[row - 1] = 0
+        column.styles[row - 1] = 0
+        self._hyperlinks.pop(key, None)
+        self._comments.pop(key, None)
+        self._remove(row, col)
+        self._size -= 1
+
+
+    def _shift_rows(self, shift):
+        removed = {}
+        if shift.offset > 0:
+            idx = shift.start - 1
+            blank = [None] * shift.offset
+            for column in self._columns.values():
+                if idx < len(column.types):
+                    column.values[idx:idx] = blank
+                    column.types[idx:idx] = bytes(shift.offset)
+                    column.styles[idx:idx] = array('I', [0]) * shift.offset
+        else:
+            low, high = shift.end - 1, shift.start - 1
+            for col, column in self._columns.items():
+                types = column.types[low:high]
+                count = len(types) - types.count(0)
+                if count:
+                    removed[col] = count
+                del column.values[low:high]
+                del column.types[low:high]
+                del column.styles[low:high]
+        return removed
+
+
+    def _shift_cols(self, shift):
+        removed = defaultdict(int)
+        columns = {}
+        for col, column in self._columns.items():
+            idx = shift.index(col)
+            if idx is not None:
+                columns[idx] = column
+                continue
+            for row, code in enumerate(column.types, 1):
+                if code:
+                    removed[row] += 1
+        self._columns = columns
+        return removed
+
+
+    def _shift_extra(self, name, shift):
+        extra = {}
+        for (row, col), value in getattr(self, name).items():
+            if shift.rows:
+                row = shift.index(row)
+            else:
+                col = shift.index(col)
+            if row is None or col is None:
+                continue
+            if name == "_hyperlinks":
+                value.ref = f"{get_column_letter(col)}{row}"
+            extra[row, col] = value
+        setattr(self, name, extra)
+
+
+    def shift(self, shift):
+        """
+        Move all the cells in the rows or columns of a Shift in one go and
+        delete those that are moved over
+        """
+        if shift.rows:
+            removed = self._shift_rows(shift)
+        else:
+            removed = self._shift_cols(shift)
+        self._size -= sum(removed.values())
+        self._shift_extra("_hyperlinks", shift)
+        self._shift_extra("_comments", shift)
+        self._shift_counts(shift, removed)
+
+
+    def formulae(self):
+        """
+        Cells with formulae
+        """
+        code = self._type_codes.get("f")
+        if code is None:
+            return
+        for col, column in self._columns.items():
+            types = column.types
+            idx = types.find(code)
+            while idx != -1:
+                yield self._cell(idx + 1, col, code)
+                idx = types.find(code, idx + 1)
+
+
+    def style_ids(self):
+        """
+        Indices of the styles used by cells
+        """
+        ids = set()
+        for column in self._columns.values():
+            ids.update(column.styles)
+        return ids
+
+
+    def map_style_ids(self, mapping):
+        """
+        Change the style index of each cell to the one it maps to
+        """
+        for column in self._columns.values():
+            column.styles = array('I', map(mapping.__getitem__, column.styles))
+        self._styles = None # the default style has to be looked up again
+
+
+    def __iter__(self):
+        for col, column in sorted(self._columns.items()):
+            for idx, code in enumerate(column.types, 1):
+                if code:
+                    yield idx, col
+
+
+    def __len__(self):
+        return self._size
+
+
+    def clear(self):
+        self._reset_counts()
+        self._columns = {}
+        self._hyperlinks = {}
+        self._comments = {}
+        self._size = 0
+
+
+    def by_row(self):
+        """
+        Rows with cells, in order, and their cells ordered by column
+        """
+        columns = sorted(self._columns.items())
+        for row in sorted(self._rows):
+            idx = row - 1
+            cells = []
+            for col, column in columns:
+                if idx < len(column.types) and column.types[idx]:
+                    cells.append(self._cell(row, col, column.types[idx]))
+            yield row, cells
@@ -3,9 +3,14 @@
 """ Read worksheets on-demand
 """
 
+from bisect import bisect_right
+from itertools import islice
+import re
+
 from .worksheet import Worksheet
 from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL
-from openpyxl.utils import get_column_letter
+from openpyxl.compat.numbers import NUMPY
+from openpyxl.utils import get_column_letter, column_index_from_string
 
 from ._reader import WorkSheetParser
 from openpyxl.workbook.defined_name import DefinedNameDict
@@ -16,11 +21,239 @@ def read_dimension(source):
     return parser.parse_dimensions()
 
 
+SHEET_DATA_RE = re.compile(rb"<([A-Za-z_][\w.-]*:)?sheetData(?:[\s/][^>]*)?>")
+ROW_NUMBER_RE = re.compile(rb"""\sr\s*=\s*["']([^"']*)["']""")
+
+
+def _row_re(prefix=b""):
+    """
+    Match the start of row elements, capturing the row number if it is the
+    first attribute
+    """
+    return re.compile(
+        rb"<" + re.escape(prefix) + rb"""row(?=[\s/>])(?:\s+r\s*=\s*["']([^"']*)["'])?"""
+    )
+
+
+class RowIndex:
+
+    """
+    Checkpoints of the offsets at which rows start in the decompressed
+    worksheet source. These allow parsing to resume close to a row instead of
+    from the start of the sheet.
+
+    The index is built from the raw bytes as they are read by the parser so it
+    grows with each scan of the sheet. Rows must be in ascending order, as the
+    specification requires, otherwise the index is abandoned. It is also
+    abandoned if the source contains comments or CDATA sections, which could
+    contain text that looks like rows.
+
+    Cells can share the formula of a master cell in an earlier row, so the
+    masters found before each checkpoint are kept along with the last column
+    they were looked for in. Formulae can only be read from a checkpoint once
+    a parser has passed it.
+    """
+
+    spacing = 1 << 16 # minimum number of bytes between checkpoints
+
+    def __init__(self):
+        self.rows = []
+        self.offsets = []
+        self.formulae = {} # checkpoint row: (max_col, shared formulae)
+        self.header = None # source up to and including <sheetData>
+        self.valid = True
+        self.complete = False
+        self._row_re = None
+        self._fed = 0
+        self._tail = b""
+        self._last_row = 0
+
+
+    def find(self, row, max_col=None, formulae=False):
+        """
+        Return the row number and offset of the closest checkpoint at or
+        before the row. If formulae are wanted only checkpoints for which the
+        shared formulae up to max_col are known are used.
+        """
+        if not self.valid or self.header is None:
+            return
+        idx = bisect_right(self.rows, row) - 1
+        while idx >= 0:
+            checkpoint = self.rows[idx]
+            if not formulae or self._covers(checkpoint, max_col):
+                return checkpoint, self.offsets[idx]
+            idx -= 1
+
+
+    def _covers(self, row, max_col):
+        known = self.formulae.get(row)
+        if known is None:
+            return False
+        return known[0] is None or max_col is not None and known[0] >= max_col
+
+
+    def shared_formulae(self, row):
+        """
+        Return a copy of the shared formulae defined before a checkpoint
+        """
+        return dict(self.formulae[row][1])
+
+
+    def record_formulae(self, rows, parser):
+        """
+        Pass through the rows from a parser, keeping the shared formulae it
+        has found before each checkpoint it reaches
+        """
+        pos = bisect_right(self.rows, parser.row_counter)
+        count = len(parser.shared_formulae)
+        for row in rows:
+            idx = row[0]
+            checkpoints = self.rows
+            while pos < len(checkpoints) and checkpoints[pos] <= idx:
+                checkpoint = checkpoints[pos]
+                if checkpoint == idx and not self._covers(checkpoint, parser.max_col):
+                    masters = islice(parser.shared_formulae.items(), count)
+                    self.formulae[checkpoint] = (parser.max_col, dict(masters))
+                pos += 1
+            count = len(parser.shared_formulae)
+            yield row
+
+
+    def feed(self, start, data):
+        """
+        Scan a chunk of source read from the start offset for row elements
+        """
+        if not self.valid or self.complete:
+            return
+        if not data:
+            self.complete = True
+            self._tail = b""
+            return
+
+        end = start + len(data)
+        if end <= self._fed or start > self._fed:
+            return # already scanned or would leave a gap
+        data = data[self._fed - start:]
+        base = self._fed - len(self._tail)
+        buf = self._tail + data
+        self._fed = end
+
+        if b"<!" in buf:
+            self.valid = False
+            return
+
+        pos = 0
+        if self.header is None:
+            match = SHEET_DATA_RE.search(buf)
+            if match is None:
+                self._tail = buf
+                return
+            self.header = buf[:match.end()]
+            self._row_re = _row_re(match.group(1) or b"")
+            pos = match.end()
+
+        # leave any incomplete tag for the next chunk
+        limit = buf.rfind(b"<", pos)
+        if limit == -1 or buf.find(b">", limit) != -1:
+            limit = len(buf)
+        self._tail = buf[limit:]
+
+        try:
+            self._scan(buf, base, pos, limit)
+        except ValueError:
+            self.valid = False
+
+
+    def _scan(self, buf, base, pos, limit):
+        last_row = self._last_row
+        threshold = 0
+        if self.offsets:
+            threshold = self.offsets[-1] + self.spacing - base
+
+        values = self._row_re.findall(buf, pos, limit)
+        if threshold >= limit and all(values):
+            # no checkpoint due so only the row numbers are needed
+            for value in values:
+                row = int(value)
+                if row <= last_row:
+                    raise ValueError("Rows are not in ascending order")
+                last_row = row
+        else:
+            for match in self._row_re.finditer(buf, pos, limit):
+                value = match.group(1)
+                if value:
+                    row = int(value)
+                else:
+                    row = self._row_number(buf, match.start(), last_row)
+                if row <= last_row:
+                    raise ValueError("Rows are not in ascending order")
+                last_row = row
+                if match.start() >= threshold:
+                    self.rows.append(row)
+                    self.offsets.append(base + match.start())
+                    threshold = match.start() + self.spacing
+
+        self._last_row = last_row
+
+
+    @staticmethod
+    def _row_number(buf, start, previous):
+        tag = buf[start:buf.find(b">", start)]
+        match = ROW_NUMBER_RE.search(tag)
+        if match is None:
+            return previous + 1
+        return int(float(match.group(1)))
+
+
+class IndexedSource:
+
+    """
+    File-like wrapper for a worksheet source that feeds the row index and
+    can restore the sheet header when starting from a checkpoint.
+    """
+
+    def __init__(self, src, index, offset=0, prefix=b""):
+        self.src = src
+        self.index = index
+        self.pos = offset
+        self.prefix = prefix
+
+
+    def read(self, size=-1):
+        if self.prefix:
+            if size is None or size < 0:
+                size = len(self.prefix)
+            data, self.prefix = self.prefix[:size], self.prefix[size:]
+            return data
+        data = self.src.read(size)
+        self.index.feed(self.pos, data)
+        self.pos += len(data)
+        return data
+
+
+    def close(self):
+        self.src.close()
+
+
+    @property
+    def closed(self):
+        return self.src.closed
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
 class ReadOnlyWorksheet:
 
     _min_column = 1
     _min_row = 1
     _max_column = _max_row = None
+    _row_index = None
 
     # from Standard Worksheet
     # Methods from Worksheet
@@ -57,10 +290,35 @@ class ReadOnlyWorksheet:
         return self.parent._archive.open(self._worksheet_path)
 
 
-    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False):
+    def _get_indexed_source(self, min_row=1, max_col=None):
+        """
+        Parse xml source on demand, starting from the closest indexed row
+        before min_row if possible. Returns the source, the row number
+        parsing will start from, or None if from the start of the sheet, and
+        the shared formulae defined before that row.
+        """
+        if self._row_index is None:
+            self._row_index = RowIndex()
+        index = self._row_index
+
+        src = self._get_source()
+        formulae = not self.parent.data_only
+        checkpoint = index.find(min_row, max_col, formulae)
+        if checkpoint is not None and checkpoint[0] > 1 and src.seekable():
+            row, offset = checkpoint
+            src.seek(offset)
+            shared = {}
+            if formulae:
+                shared = index.shared_formulae(row)
+            return IndexedSource(src, index, offset, index.header), row, shared
+        return IndexedSource(src, index), None, {}
+
+
+    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False, create_cells=True):
         """
         The source worksheet file may have columns or rows missing.
-        Missing cells will be created.
+        Missing cells will be returned as `EMPTY_CELL` whether or not
+        `create_cells` is set.
         """
         filler = EMPTY_CELL
         if values_only:
@@ -74,15 +332,26 @@ class ReadOnlyWorksheet:
 
         counter = min_row
         idx = 1
-        with self._get_source() as src:
+        src, start, shared_formulae = self._get_indexed_source(min_row, max_col)
+        with src:
             parser = WorkSheetParser(src,
                                      self._shared_strings,
                                      data_only=self.parent.data_only,
                                      epoch=self.parent.epoch,
                                      date_formats=self.parent._date_formats,
-                                     timedelta_formats=self.parent._timedelta_formats)
-
-            for idx, row in parser.parse():
+                                     timedelta_formats=self.parent._timedelta_formats,
+                                     min_col=min_col,
+                                     max_col=max_col,
+                                     values_only=values_only)
+            if start is not None:
+                parser.row_counter = start - 1
+                parser.shared_formulae = shared_formulae
+
+            rows = parser.parse()
+            if not self.parent.data_only:
+                rows = self._row_index.record_formulae(rows, parser)
+
+            for idx, row in rows:
                 if max_row is not None and idx > max_row:
                     break
 
@@ -93,7 +362,8 @@ class ReadOnlyWorksheet:
 
                 # return cells from a row
                 if counter <= idx:
-                    row = self._get_row(row, min_col, max_col, values_only)
+                    if not values_only:
+                        row = self._get_row(row, min_col, max_col)
                     counter += 1
                     yield row
 
@@ -127,6 +397,68 @@ class ReadOnlyWorksheet:
         return tuple(new_row)
 
 
+    def to_arrays(self, min_row=None, max_row=None, columns=None, dtypes=None):
+        """
+        Read the values of columns into NumPy arrays, one per column.
+
+        Numbers become int64 or float64 arrays, dates and times datetime64 or
+        timedelta64 arrays and everything else object arrays, unless a dtype
+        is given for a column. Missing values are NaN, NaT or None. A
+        ValueError is raised if a value, or a missing value, cannot be stored
+        in the dtype given for a column, for example an empty cell in an
+        integer column.
+
+        :param min_row: smallest row index (1-based index)
+        :type min_row: int
+
+        :param max_row: largest row index (1-based index)
+        :type max_row: int
+
+        :param columns: column indices (1-based) or letters, defaults to all columns
+        :type columns: list
+
+        :param dtypes: NumPy dtypes for some or all of the columns
+        :type dtypes: dict
+
+        :rtype: dict of arrays keyed by column
+        """
+        if not NUMPY:
+            raise ImportError("You must install NumPy to read columns into arrays")
+        from openpyxl.utils.arrays import ColumnArray
+
+        min_row = min_row or 1
+        max_row = max_row or self.max_row
+        if columns is None:
+            if self.max_column is None:
+                raise ValueError("Worksheet is unsized, columns must be given")
+            columns = range(self.min_column, self.max_column + 1)
+        if dtypes is None:
+            dtypes = {}
+
+        columns = list(columns)
+        indices = [column_index_from_string(c) if isinstance(c, str) else c
+                   for c in columns]
+        if not indices:
+            return {}
+        min_col = min(indices)
+        max_col = max(indices)
+
+        size = 1024
+        if max_row is not None:
+            size = max_row + 1 - min_row
+        arrays = [ColumnArray(dtypes.get(c), size) for c in columns]
+        positions = [idx - min_col for idx in indices]
+        rows = self._cells_by_row(min_col, min_row, max_col, max_row, values_only=True)
+        for row_idx, row in enumerate(rows, min_row):
+            for c, pos, array in zip(columns, positions, arrays):
+                try:
+                    array.append(row[pos])
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"Cannot read column {c}, row {row_idx}: {e}") from e
+
+        return {c:array.to_array() for c, array in zip(columns, arrays)}
+
+
     def _get_cell(self, row, column):
         """Cells are returned by a generator which can be empty"""
         for row in self._cells_by_row(column, row, column, row):
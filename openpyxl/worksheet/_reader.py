@@ -21,9 +21,10 @@ from openpyxl.xml.constants import (
     EXT_TYPES,
 )
 from openpyxl.formatting.formatting import ConditionalFormatting
-from openpyxl.formula.translate import Translator
+from openpyxl.formula.translate import SharedFormula
 from openpyxl.utils import (
     get_column_letter,
+    column_index_from_string,
     coordinate_to_tuple,
     )
 from openpyxl.utils.datetime import from_excel, from_ISO8601, WINDOWS_EPOCH
@@ -52,6 +53,7 @@ VALUE_TAG = '{%s}v' % SHEET_MAIN_NS
 FORMULA_TAG = '{%s}f' % SHEET_MAIN_NS
 MERGE_TAG = '{%s}mergeCells' % SHEET_MAIN_NS
 INLINE_STRING = "{%s}is" % SHEET_MAIN_NS
+TEXT_TAG = "{%s}t" % SHEET_MAIN_NS
 COL_TAG = '{%s}col' % SHEET_MAIN_NS
 ROW_TAG = '{%s}row' % SHEET_MAIN_NS
 CF_TAG = '{%s}conditionalFormatting' % SHEET_MAIN_NS
@@ -94,12 +96,30 @@ def parse_richtext_string(element):
     return value
 
 
+def parse_text_content(element):
+    """
+    Text of an inline string. Only strings with formatting need to be
+    deserialised.
+    """
+    if len(element) == 1 and element[0].tag == TEXT_TAG:
+        return element[0].text or ""
+    return Text.from_tree(element).content
+
+
+def _column_index(coordinate):
+    return column_index_from_string(coordinate.rstrip("0123456789"))
+
+
 class WorkSheetParser:
 
     def __init__(self, src, shared_strings, data_only=False,
                  epoch=WINDOWS_EPOCH, date_formats=set(),
-                 timedelta_formats=set(), rich_text=False):
-        self.min_row = self.min_col = None
+                 timedelta_formats=set(), rich_text=False,
+                 min_col=None, max_col=None, values_only=False):
+        self.min_row = None
+        self.min_col = min_col
+        self.max_col = max_col
+        self.values_only = values_only
         self.epoch = epoch
         self.source = src
         self.shared_strings = shared_strings
@@ -151,7 +171,12 @@ class WorkSheetParser:
 
         }
 
-        it = iterparse(self.source) # add a finaliser to close the source when this becomes possible
+        parse_row = self.parse_row
+        if self.values_only:
+            parse_row = self.parse_row_values
+
+        tags = tuple(dispatcher) + tuple(properties) + (ROW_TAG,)
+        it = iterparse(self.source, tag=tags) # add a finaliser to close the source when this becomes possible
 
         for _, element in it:
             tag_name = element.tag
@@ -164,7 +189,7 @@ class WorkSheetParser:
                 setattr(self, prop[0], obj)
                 element.clear()
             elif tag_name == ROW_TAG:
-                row = self.parse_row(element)
+                row = parse_row(element)
                 element.clear()
                 yield row
 
@@ -173,7 +198,7 @@ class WorkSheetParser:
         """
         Get worksheet dimensions if they are provided.
         """
-        it = iterparse(self.source)
+        it = iterparse(self.source, events=("start",), tag=(DIMENSION_TAG, DATA_TAG))
 
         for _event, element in it:
             if element.tag == DIMENSION_TAG:
@@ -183,21 +208,14 @@ class WorkSheetParser:
             elif element.tag == DATA_TAG:
                 # Dimensions missing
                 break
-            element.clear()
 
 
     def parse_cell(self, element):
-        data_type = element.get('t', 'n')
         coordinate = element.get('r')
         style_id = element.get('s', 0)
         if style_id:
             style_id = int(style_id)
 
-        if data_type == "inlineStr":
-            value = None
-        else:
-            value = element.findtext(VALUE_TAG, None) or None
-
         if coordinate:
             row, column = coordinate_to_tuple(coordinate)
             self.col_counter = column
@@ -205,7 +223,34 @@ class WorkSheetParser:
             self.col_counter += 1
             row, column = self.row_counter, self.col_counter
 
-        if not self.data_only and element.find(FORMULA_TAG) is not None:
+        value, data_type = self.parse_value(element, style_id)
+
+        return {'row':row, 'column':column, 'value':value, 'data_type':data_type, 'style_id':style_id}
+
+
+    def parse_value(self, element, style_id=0):
+        """
+        Convert the value of a cell according to its data type and style
+        """
+        data_type = element.get('t', 'n')
+
+        # look at the children once, finding them by path is slow with lxml
+        value = formula = inline = None
+        for child in element:
+            tag = child.tag
+            if tag == VALUE_TAG:
+                value = child.text
+            elif tag == FORMULA_TAG:
+                formula = child
+            elif tag == INLINE_STRING:
+                inline = child
+
+        if data_type == "inlineStr":
+            value = None
+        else:
+            value = value or None
+
+        if not self.data_only and formula is not None:
             data_type = 'f'
             value = self.parse_formula(element)
 
@@ -219,6 +264,7 @@ class WorkSheetParser:
                             value, self.epoch, timedelta=style_id in self.timedelta_formats
                         )
                     except (OverflowError, ValueError):
+                        coordinate = element.get('r')
                         msg = f"""Cell {coordinate} is marked as a date but the serial value {value} is outside the limits for dates. The cell will be treated as an error."""
                         warn(msg)
                         data_type = "e"
@@ -233,15 +279,14 @@ class WorkSheetParser:
                 value = from_ISO8601(value)
 
         elif data_type == 'inlineStr':
-                child = element.find(INLINE_STRING)
-                if child is not None:
+                if inline is not None:
                     data_type = 's'
                     if self.rich_text:
-                        value = parse_richtext_string(child)
+                        value = parse_richtext_string(inline)
                     else:
-                        value = Text.from_tree(child).content
+                        value = parse_text_content(inline)
 
-        return {'row':row, 'column':column, 'value':value, 'data_type':data_type, 'style_id':style_id}
+        return value, data_type
 
 
     def parse_formula(self, element):
@@ -264,7 +309,7 @@ class WorkSheetParser:
                 trans = self.shared_formulae[idx]
                 value = trans.translate_formula(coordinate)
             elif value != "=":
-                self.shared_formulae[idx] = Translator(value, coordinate)
+                self.shared_formulae[idx] = SharedFormula(value, coordinate)
 
         elif formula_type == "dataTable":
             value = DataTableFormula(**formula.attrib)
@@ -279,7 +324,7 @@ class WorkSheetParser:
         self.column_dimensions[column] = attrs
 
 
-    def parse_row(self, row):
+    def parse_row_attributes(self, row):
         attrs = dict(row.attrib)
 
         if "r" in attrs:
@@ -300,10 +345,98 @@ class WorkSheetParser:
             # don't create dimension objects unless they have relevant information
             self.row_dimensions[str(self.row_counter)] = attrs
 
-        cells = [self.parse_cell(el) for el in row]
+
+    def parse_row(self, row):
+        self.parse_row_attributes(row)
+
+        if self.min_col is None and self.max_col is None:
+            cells = [self.parse_cell(el) for el in row]
+        else:
+            cells = self.parse_cells_in_window(row)
         return self.row_counter, cells
 
 
+    def parse_cells_in_window(self, row):
+        """
+        Only convert the values of cells between min_col and max_col.
+        Cells in a row are ordered so parsing stops after max_col.
+        """
+        min_col = self.min_col or 1
+        max_col = self.max_col
+        cells = []
+        for el in row:
+            coordinate = el.get('r')
+            if coordinate:
+                column = _column_index(coordinate)
+            else:
+                column = self.col_counter + 1
+
+            if max_col is not None and column > max_col:
+                break
+            elif column < min_col:
+                self.col_counter = column
+                if not self.data_only:
+                    self.parse_shared_formula(el)
+            else:
+                cells.append(self.parse_cell(el))
+        return cells
+
+
+    def parse_row_values(self, row):
+        """
+        Return only the values of the cells in a row, padded from min_col and,
+        if it is set, up to max_col. No objects are created for the cells.
+        """
+        self.parse_row_attributes(row)
+
+        min_col = self.min_col or 1
+        max_col = self.max_col
+        values = []
+        for el in row:
+            coordinate = el.get('r')
+            if coordinate:
+                column = _column_index(coordinate)
+            else:
+                column = self.col_counter + 1
+            self.col_counter = column
+
+            if max_col is not None and column > max_col:
+                break
+            elif column < min_col:
+                if not self.data_only:
+                    self.parse_shared_formula(el)
+                continue
+
+            style_id = el.get('s', 0)
+            if style_id:
+                style_id = int(style_id)
+            value = self.parse_value(el, style_id)[0]
+
+            idx = column - min_col
+            if idx < len(values):
+                values[idx] = value
+            else:
+                values.extend([None] * (idx - len(values)))
+                values.append(value)
+
+        if max_col is not None:
+            values.extend([None] * (max_col + 1 - min_col - len(values)))
+        return self.row_counter, tuple(values)
+
+
+    def parse_shared_formula(self, element):
+        """
+        Keep track of the master cells of shared formulae even if the cells
+        themselves are not wanted.
+        """
+        formula = element.find(FORMULA_TAG)
+        if (formula is not None
+            and formula.get('t') == "shared"
+            and formula.text is not None
+            and formula.get('si') not in self.shared_formulae):
+            self.parse_formula(element)
+
+
     def parse_formatting(self, element):
         try:
             cf = ConditionalFormatting.from_tree(element)
@@ -351,6 +484,35 @@ class WorkSheetParser:
         self.col_breaks = ColBreak()
 
 
+class SharedStringIndex:
+    """
+    Stand-in for the shared strings table so that cells refer to strings by
+    their index in the table
+    """
+
+    def __getitem__(self, idx):
+        return idx
+
+
+def parse_worksheet(src, data_only=False, epoch=WINDOWS_EPOCH,
+                    date_formats=set(), timedelta_formats=set(), rich_text=False):
+    """
+    Parse a worksheet into a form that can be passed between processes: the
+    parser without its source and a list of (row, column, value, data_type,
+    style_id) tuples for the cells. Shared strings are left as indices into
+    the workbook's table.
+    """
+    parser = WorkSheetParser(src, SharedStringIndex(), data_only, epoch,
+                             date_formats, timedelta_formats, rich_text)
+    cells = [
+        (c['row'], c['column'], c['value'], c['data_type'], c['style_id'])
+        for _, row in parser.parse() for c in row
+    ]
+    parser.source = parser.shared_strings = None
+    parser.shared_formulae = {}
+    return parser, cells
+
+
 class WorksheetReader:
     """
     Create a parser and apply it to a workbook
@@ -366,12 +528,33 @@ class WorksheetReader:
 
     def bind_cells(self):
         for idx, row in self.parser.parse():
+            cells = {}
             for cell in row:
-                style = self.ws.parent._cell_styles[cell['style_id']]
-                c = Cell(self.ws, row=cell['row'], column=cell['column'], style_array=style)
+                c = Cell(self.ws, row=cell['row'], column=cell['column'])
+                c._style_id = cell['style_id']
                 c._value = cell['value']
                 c.data_type = cell['data_type']
-                self.ws._cells[(cell['row'], cell['column'])] = c
+                cells[(cell['row'], cell['column'])] = c
+            self.ws._cells.update(cells)
+
+        if self.ws._cells:
+            self.ws._current_row = self.ws.max_row # use cells not row dimensions
+
+
+    def bind_parsed_cells(self, cells, shared_strings):
+        """
+        Bind cells from parse_worksheet
+        """
+        bound = {}
+        for row, column, value, data_type, style_id in cells:
+            if data_type == 's' and type(value) is int:
+                value = shared_strings[value]
+            c = Cell(self.ws, row=row, column=column)
+            c._style_id = style_id
+            c._value = value
+            c.data_type = data_type
+            bound[(row, column)] = c
+        self.ws._cells.update(bound)
 
         if self.ws._cells:
             self.ws._current_row = self.ws.max_row # use cells not row dimensions
@@ -461,8 +644,15 @@ class WorksheetReader:
                 setattr(self.ws, k, v)
 
 
-    def bind_all(self):
-        self.bind_cells()
+    def bind_all(self, cells=None, shared_strings=None):
+        """
+        Bind everything from the parser, cells from parse_worksheet can be
+        passed in along with the shared strings table
+        """
+        if cells is None:
+            self.bind_cells()
+        else:
+            self.bind_parsed_cells(cells, shared_strings)
         self.bind_merged_cells()
         self.bind_hyperlinks()
         self.bind_formatting()
@@ -0,0 +1,395 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Keep the references of a worksheet up to date when rows or columns are
+inserted or deleted
+"""
+
+import re
+from collections import OrderedDict
+
+from openpyxl.cell import MergedCell
+from openpyxl.formula.references import rewrite_references, split_sheet
+from openpyxl.utils import (
+    column_index_from_string,
+    get_column_letter,
+    range_boundaries,
+)
+
+from .formula import ArrayFormula
+from .table import TableColumn
+
+REF_RE = re.compile(r"^(\$?)([A-Za-z]{1,3})?(\$?)([1-9][0-9]{0,6})?$")
+
+
+def _parse_reference(ref):
+    """
+    Split a reference such as A1, $A$1:B2, A:C or 1:3 into a list of
+    [$, column, $, row] for each end. Returns None for anything else.
+    """
+    parts = []
+    for part in ref.split(":"):
+        m = REF_RE.match(part)
+        if m is None or not part:
+            return
+        parts.append(list(m.groups()))
+    if len(parts) <= 2:
+        return parts
+
+
+def _join_reference(parts):
+    return ":".join("".join(p or "" for p in part) for part in parts)
+
+
+class Shift:
+
+    """
+    Rows or columns from `start` onwards moving by `offset`. When they move
+    back, the rows or columns they move over are deleted.
+    """
+
+    def __init__(self, start, offset, rows=True):
+        self.start = start
+        self.offset = offset
+        self.rows = rows
+        # first row or column deleted
+        self.end = start + offset if offset < 0 else start
+        self._references = {}
+
+
+    def index(self, idx):
+        """
+        New index of a row or column or None if it is deleted
+        """
+        if idx >= self.start:
+            return idx + self.offset
+        elif idx >= self.end:
+            return
+        return idx
+
+
+    def bounds(self, low, high):
+        """
+        New bounds of a range of rows or columns or None if they are all
+        deleted. Ranges grow when rows or columns are inserted within them.
+        """
+        start = self.start
+        offset = self.offset
+        end = self.end
+        if low >= start:
+            low += offset
+        elif low >= end:
+            low = end
+        if high >= start:
+            high += offset
+        elif high >= end:
+            high = end - 1
+        if low <= high:
+            return low, high
+
+
+    def cell_range(self, cr):
+        """
+        Shift a CellRange in place. Returns False if all its cells are
+        deleted.
+        """
+        if self.rows:
+            bounds = self.bounds(cr.min_row, cr.max_row)
+            if bounds is not None:
+                cr.min_row, cr.max_row = bounds
+        else:
+            bounds = self.bounds(cr.min_col, cr.max_col)
+            if bounds is not None:
+                cr.min_col, cr.max_col = bounds
+        return bounds is not None
+
+
+    def multi_cell_range(self, mcr):
+        """
+        Shift the ranges of a MultiCellRange in place, removing those whose
+        cells are all deleted. Returns False if no ranges are left.
+        """
+        ranges = set()
+        for cr in mcr.ranges:
+            if self.cell_range(cr):
+                ranges.add(cr)
+        mcr.ranges = ranges
+        return bool(ranges)
+
+
+    def reference(self, ref):
+        """
+        Shift a reference such as A1, $A$1:B2, A:C or 1:3. Returns None if all
+        its cells are deleted. Anything else, such as a name, is returned
+        unchanged.
+        """
+        # the same references are often found in many formulae
+        try:
+            return self._references[ref]
+        except KeyError:
+            new = self._references[ref] = self._reference(ref)
+            return new
+
+
+    def _reference(self, ref):
+        parts = _parse_reference(ref)
+        if parts is None:
+            return ref
+
+        pos = 3 if self.rows else 1
+        values = [part[pos] for part in parts]
+        if None in values:
+            # whole columns when shifting rows or the other way round
+            return ref
+        if self.rows:
+            indices = [int(v) for v in values]
+        else:
+            indices = [column_index_from_string(v) for v in values]
+        if max(indices) < self.end:
+            return ref
+
+        if len(indices) == 1:
+            idx = self.index(indices[0])
+            if idx is None:
+                return
+            indices = [idx]
+        else:
+            bounds = self.bounds(min(indices), max(indices))
+            if bounds is None:
+                return
+            if indices[0] > indices[1]:
+                bounds = bounds[::-1]
+            indices = bounds
+
+        for part, idx in zip(parts, indices):
+            part[pos] = str(idx) if self.rows else get_column_letter(idx)
+        return _join_reference(parts)
+
+
+class Move:
+
+    """
+    Cells in a range moving by a number of rows and columns. Only references
+    to cells within the range move with them.
+    """
+
+    def __init__(self, cell_range, rows=0, cols=0):
+        self.cell_range = cell_range
+        self.rows = rows
+        self.cols = cols
+
+
+    def reference(self, ref):
+        """
+        Move a reference such as A1 or $A$1:B2 if all its cells are moved.
+        Anything else is returned unchanged.
+        """
+        parts = _parse_reference(ref)
+        if parts is None or any(None in (col, row) for _, col, _, row in parts):
+            return ref
+        cr = self.cell_range
+        for part in parts:
+            col = column_index_from_string(part[1])
+            row = int(part[3])
+            if not (cr.min_col <= col <= cr.max_col and cr.min_row <= row <= cr.max_row):
+                return ref
+            part[1] = get_column_letter(col + self.cols)
+            part[3] = str(row + self.rows)
+        return _join_reference(parts)
+
+
+def shift_formula(formula, title, shift, local=False):
+    """
+    Shift references to the worksheet `title` in a formula, which may omit
+    the leading "=". References without a worksheet are only shifted if the
+    formula is `local` to the worksheet. References whose cells are all
+    deleted become #REF!
+    """
+    prefix = "" if formula.startswith("=") else "="
+
+    def shift_reference(value):
+        sheet, qualifier, ref = split_sheet(value)
+        if sheet == title or (sheet is None and local):
+            new = shift.reference(ref)
+            if new is None:
+                new = "#REF!"
+            return qualifier + new
+        return value
+
+    value = rewrite_references(prefix + formula, shift_reference)
+    return value[len(prefix):]
+
+
+def _merged_cells(ws, shift):
+    ranges = set()
+    for mcr in ws.merged_cells.ranges:
+        size = mcr.size
+        if not shift.cell_range(mcr):
+            continue # the merged cells have been deleted
+        ranges.add(mcr)
+        if mcr.size != size:
+            # the top left cell may have been deleted or rows or columns
+            # inserted within the range
+            top_left = mcr.min_row, mcr.min_col
+            if isinstance(ws._cells.get(top_left), MergedCell):
+                del ws._cells[top_left]
+            mcr.start_cell = ws.cell(*top_left)
+            ws._clean_merge_range(mcr)
+        else:
+            mcr.start_cell = ws.cell(mcr.min_row, mcr.min_col)
+    ws.merged_cells.ranges = ranges
+
+
+def _conditional_formatting(ws, shift):
+    formatting = ws.conditional_formatting
+    rules = OrderedDict()
+    for cf, cf_rules in formatting._cf_rules.items():
+        if shift.multi_cell_range(cf.sqref):
+            rules.setdefault(cf, []).extend(cf_rules)
+    formatting._cf_rules = rules
+
+
+def _data_validations(ws, shift):
+    validations = ws.data_validations
+    validations.dataValidation = [dv for dv in validations.dataValidation
+                                  if shift.multi_cell_range(dv.sqref)]
+
+
+def _table_columns(ws, table, old, new, shift):
+    """
+    Remove the columns of a table that have been deleted and add any that
+    have been inserted
+    """
+    min_col, min_row, max_col, max_row = old
+    columns = {}
+    for col, column in zip(range(min_col, max_col + 1), table.tableColumns):
+        col = shift.index(col)
+        if col is not None:
+            columns[col] = column
+
+    last_id = max((column.id for column in table.tableColumns), default=0)
+    names = set(table.column_names)
+    min_col, min_row, max_col, max_row = new
+    result = []
+    for col in range(min_col, max_col + 1):
+        column = columns.get(col)
+        if column is None:
+            last_id += 1
+            n = len(result) + 1
+            while f"Column{n}" in names:
+                n += 1
+            column = TableColumn(id=last_id, name=f"Column{n}")
+            names.add(column.name)
+            if table.headerRowCount:
+                ws.cell(row=min_row, column=col, value=column.name)
+        result.append(column)
+    table.tableColumns = result
+
+
+def _tables(ws, shift):
+    for name, table in list(dict.items(ws.tables)):
+        ref = shift.reference(table.ref)
+        if ref is None:
+            del ws.tables[name]
+            continue
+        if not shift.rows and table.tableColumns:
+            _table_columns(ws, table, range_boundaries(table.ref),
+                           range_boundaries(ref), shift)
+        table.ref = ref
+        _auto_filter(table.autoFilter, shift)
+
+
+def _auto_filter(auto_filter, shift):
+    if auto_filter is None or not auto_filter.ref:
+        return
+    auto_filter.ref = shift.reference(auto_filter.ref)
+    sort_state = auto_filter.sortState
+    if sort_state is not None and sort_state.ref:
+        sort_state.ref = shift.reference(sort_state.ref)
+
+
+def _print_titles(ws, shift):
+    if shift.rows and ws._print_rows:
+        titles = ws._print_rows
+        bounds = shift.bounds(titles.min_row, titles.max_row)
+        if bounds is None:
+            ws._print_rows = None
+        else:
+            titles.min_row, titles.max_row = bounds
+    elif not shift.rows and ws._print_cols:
+        titles = ws._print_cols
+        bounds = shift.bounds(column_index_from_string(titles.min_col),
+                              column_index_from_string(titles.max_col))
+        if bounds is None:
+            ws._print_cols = None
+        else:
+            titles.min_col, titles.max_col = map(get_column_letter, bounds)
+
+
+def _defined_names(ws, shift):
+    wb = ws.parent
+    names = list(getattr(wb, "defined_names", {}).values())
+    for sheet in getattr(wb, "worksheets", ()):
+        names.extend(sheet.defined_names.values())
+    for defn in names:
+        if defn.value and not defn.is_external:
+            defn.value = shift_formula(defn.value, ws.title, shift)
+
+
+def _formulae(ws, shift):
+    """
+    Shift references to the worksheet in the formulae of all the cells,
+    conditional formats and data validations of the workbook
+    """
+    title = ws.title
+    sheets = getattr(ws.parent, "worksheets", [ws])
+    for sheet in sheets:
+        cells = getattr(sheet, "_cells", None)
+        if cells is None:
+            continue # chartsheets and write-only worksheets
+        local = sheet is ws
+        for cell in cells.formulae():
+            value = cell._value
+            if isinstance(value, str):
+                if local or "!" in value:
+                    cell._value = shift_formula(value, title, shift, local)
+            elif isinstance(value, ArrayFormula):
+                if value.text:
+                    value.text = shift_formula(value.text, title, shift, local)
+                if local:
+                    value.ref = shift.reference(value.ref) or value.ref
+
+        for cf in sheet.conditional_formatting:
+            for rule in cf.rules:
+                rule.formula = [shift_formula(f, title, shift, local)
+                                for f in rule.formula]
+        for dv in sheet.data_validations.dataValidation:
+            if dv.formula1:
+                dv.formula1 = shift_formula(dv.formula1, title, shift, local)
+            if dv.formula2:
+                dv.formula2 = shift_formula(dv.formula2, title, shift, local)
+
+
+def shift_worksheet(ws, shift):
+    """
+    Update everything in a worksheet and its workbook that refers to the
+    cells of the worksheet after they have been shifted
+    """
+    _merged_cells(ws, shift)
+    _conditional_formatting(ws, shift)
+    _data_validations(ws, shift)
+    _tables(ws, shift)
+    _auto_filter(ws.auto_filter, shift)
+    shift.multi_cell_range(ws._print_area)
+    _print_titles(ws, shift)
+    _formulae(ws, shift)
+    _defined_names(ws, shift)
+
+
+def move_references(ws, move):
+    """
+    Update formulae and defined names in the workbook that refer to cells
+    of the worksheet which are about to be moved
+    """
+    _formulae(ws, move)
+    _defined_names(ws, move)
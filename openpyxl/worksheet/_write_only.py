@@ -10,6 +10,7 @@ from openpyxl.workbook.child import _WorkbookChild
 from .worksheet import Worksheet
 from openpyxl.utils.exceptions import WorkbookAlreadySaved
 
+from openpyxl.writer.strings import SharedStringTable
 from ._writer import WorksheetWriter
 
 
@@ -78,6 +79,9 @@ class WriteOnlyWorksheet(_WorkbookChild):
 
 
     def _get_writer(self):
+        wb = self.parent
+        if wb.share_strings and wb._string_table is None:
+            wb._string_table = SharedStringTable()
         if self._writer is None:
             self._writer = WorksheetWriter(self)
             self._writer.write_top()
@@ -1,14 +1,17 @@
 # Copyright (c) 2010-2024 openpyxl
 
 import atexit
-from collections import defaultdict
+from heapq import merge
 from io import BytesIO
+from operator import itemgetter
 import os
 from tempfile import NamedTemporaryFile
 from warnings import warn
 
 from openpyxl.xml.functions import xmlfile
 from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.formula.translate import SharedFormula, TranslatorError
+from openpyxl.utils import get_column_letter
 
 from openpyxl.comments.comment_sheet import CommentRecord
 from openpyxl.packaging.relationship import Relationship, RelationshipList
@@ -20,7 +23,7 @@ from .merge import MergeCell, MergeCells
 from .related import Related
 from .table import TablePartList
 
-from openpyxl.cell._writer import write_cell
+from openpyxl.cell._writer import write_cell, _set_attributes
 
 
 ALL_TEMP_FILES = []
@@ -52,6 +55,7 @@ class WorksheetWriter:
             out = create_temporary_file()
         self.out = out
         self._rels = RelationshipList()
+        self._shared_formulae = {}
         self.xf = self.get_stream()
         next(self.xf) # start generator
 
@@ -105,19 +109,56 @@ class WorksheetWriter:
 
     def rows(self):
         """Return all rows, and any cells that they contain"""
-        # order cells by row
-        rows = defaultdict(list)
-        for (row, col), cell in sorted(self.ws._cells.items()):
-            rows[row].append(cell)
-
+        cells = self.ws._cells
         # add empty rows if styling has been applied
-        for row in self.ws.row_dimensions.keys() - rows.keys():
-            rows[row] = []
+        empty = [(row, []) for row in sorted(self.ws.row_dimensions)
+                 if not cells.row_count(row)]
+        return merge(cells.by_row(), empty, key=itemgetter(0))
 
-        return sorted(rows.items())
+
+    def find_shared_formulae(self):
+        """
+        Find runs of cells in columns whose formulae are the formula of the
+        first cell translated to them. These are written as shared formulae
+        if the workbook shares formulae.
+        """
+        shared = {}
+        if not getattr(self.ws.parent, "share_formulae", False):
+            return shared
+
+        cells = sorted((cell.column, cell.row, cell._value)
+                       for cell in self.ws._cells.formulae()
+                       if isinstance(cell._value, str))
+        runs = []
+        master = master_col = master_row = last_row = None
+        for col, row, value in cells:
+            if master is not None and col == master_col and row == last_row + 1:
+                try:
+                    expected = master.translate_formula(row_delta=row - master_row)
+                except TranslatorError:
+                    expected = None
+                if value == expected:
+                    last_row = row
+                    continue
+            if master is not None and last_row > master_row:
+                runs.append((master_col, master_row, last_row))
+            master_col, master_row, last_row = col, row, row
+            master = SharedFormula(value, f"{get_column_letter(col)}{row}")
+        if master is not None and last_row > master_row:
+            runs.append((master_col, master_row, last_row))
+
+        for si, (col, first, last) in enumerate(runs):
+            letter = get_column_letter(col)
+            shared[first, col] = {"t": "shared", "ref": f"{letter}{first}:{letter}{last}",
+                                  "si": f"{si}"}
+            dependent = {"t": "shared", "si": f"{si}"}
+            for row in range(first + 1, last + 1):
+                shared[row, col] = dependent
+        return shared
 
 
     def write_rows(self):
+        self._shared_formulae = self.find_shared_formulae()
         xf = self.xf.send(True)
 
         with xf.element("sheetData"):
@@ -127,24 +168,76 @@ class WorksheetWriter:
         self.xf.send(None) # return control to generator
 
 
-    def write_row(self, xf, row, row_idx):
+    def row_attributes(self, row_idx):
+        """
+        Attributes of a row. Getting them from the row dimension adds its style
+        to the workbook.
+        """
         attrs = {'r': f"{row_idx}"}
         dims = self.ws.row_dimensions
         attrs.update(dims.get(row_idx, {}))
+        return attrs
+
+
+    def cells(self, row):
+        """
+        The cells in a row that have to be written. The comments of cells are
+        collected.
+        """
+        for cell in row:
+            if cell._comment is not None:
+                comment = CommentRecord.from_cell(cell)
+                self.ws._comments.append(comment)
+            if (
+                cell._value is None
+                and not cell.has_style
+                and not cell._comment
+                ):
+                continue
+            yield cell
+
+
+    def write_row(self, xf, row, row_idx):
+        attrs = self.row_attributes(row_idx)
 
         with xf.element("row", attrs):
 
-            for cell in row:
-                if cell._comment is not None:
-                    comment = CommentRecord.from_cell(cell)
-                    self.ws._comments.append(comment)
-                if (
-                    cell._value is None
-                    and not cell.has_style
-                    and not cell._comment
-                    ):
-                    continue
-                write_cell(xf, self.ws, cell, cell.has_style)
+            for cell in self.cells(row):
+                shared = None
+                if self._shared_formulae:
+                    shared = self._shared_formulae.get((row_idx, cell.column))
+                write_cell(xf, self.ws, cell, cell.has_style, shared)
+
+
+    def prepare(self):
+        """
+        Add the styles and strings used by the worksheet to the workbook in
+        the same order that writing it would and collect its comments and
+        hyperlinks. The worksheet can then be written elsewhere without
+        changing the workbook.
+        """
+        # the styles of columns are added to the workbook when they are
+        # converted to XML
+        cols = self.ws.column_dimensions
+        outline = cols.max_outline
+        cols.to_tree()
+        cols.max_outline = outline # only changed when the worksheet is written
+
+        for row_idx, row in self.rows():
+            self.row_attributes(row_idx)
+            for cell in self.cells(row):
+                # adds the style and string of the cell and its hyperlink
+                _set_attributes(cell, cell.has_style)
+        self.add_differential_styles()
+
+
+    def write_xml(self, obj):
+        """
+        Write an object straight to the stream without creating its elements
+        """
+        xf = self.xf.send(True)
+        obj.write_xml(xf)
+        self.xf.send(None) # return control to generator
 
 
     def write_protection(self):
@@ -177,23 +270,28 @@ class WorksheetWriter:
         merged = self.ws.merged_cells
         if merged:
             cells = [MergeCell(str(ref)) for ref in self.ws.merged_cells]
-            self.xf.send(MergeCells(mergeCell=cells).to_tree())
+            self.write_xml(MergeCells(mergeCell=cells))
 
 
-    def write_formatting(self):
+    def add_differential_styles(self):
         df = DifferentialStyle()
         wb = self.ws.parent
         for cf in self.ws.conditional_formatting:
             for rule in cf.rules:
                 if rule.dxf and rule.dxf != df:
                     rule.dxfId = wb._differential_styles.add(rule.dxf)
-            self.xf.send(cf.to_tree())
+
+
+    def write_formatting(self):
+        self.add_differential_styles()
+        for cf in self.ws.conditional_formatting:
+            self.write_xml(cf)
 
 
     def write_validations(self):
         dv = self.ws.data_validations
         if dv:
-            self.xf.send(dv.to_tree())
+            self.write_xml(dv)
 
 
     def write_hyperlinks(self):
@@ -207,7 +305,7 @@ class WorksheetWriter:
                 link.id = rel.id
 
         if links:
-            self.xf.send(HyperlinkList(links).to_tree())
+            self.write_xml(HyperlinkList(links))
 
 
     def write_print(self):
@@ -200,3 +200,12 @@ class DataValidationList(Serialisable):
         xml = super().to_tree(tagname)
         self.dataValidation = ranges
         return xml
+
+
+    def write_xml(self, xf, tagname=None):
+        ranges = self.dataValidation # copy
+        self.dataValidation = [r for r in self.dataValidation if bool(r.sqref)]
+        try:
+            self._write_xml(xf, tagname)
+        finally:
+            self.dataValidation = ranges
@@ -2,6 +2,7 @@
 
 # Simplified implementation of headers and footers: let worksheets have separate items
 
+from copy import copy
 import re
 from warnings import warn
 
@@ -155,6 +156,11 @@ class HeaderFooterItem(Strict):
         self.right = right
 
 
+    def __copy__(self):
+        return self.__class__(left=copy(self.left), right=copy(self.right),
+                              center=copy(self.center))
+
+
     def __str__(self):
         """
         Pack parts into a single string
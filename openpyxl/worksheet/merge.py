@@ -115,8 +115,8 @@ class MergedCellRange(CellRange):
                 cell = self.ws._cells.get(coord)
                 if cell is None:
                     row, col = coord
-                    cell = MergedCell(self.ws, row=row, column=col)
-                    self.ws._cells[(cell.row, cell.column)] = cell
+                    self.ws._cells[coord] = MergedCell(self.ws, row=row, column=col)
+                    cell = self.ws._cells[coord] # cells may be copied when stored
                 cell.border += border
 
         protected = self.start_cell.protection is not None
@@ -126,8 +126,8 @@ class MergedCellRange(CellRange):
             cell = self.ws._cells.get(coord)
             if cell is None:
                 row, col = coord
-                cell = MergedCell(self.ws, row=row, column=col)
-                self.ws._cells[(cell.row, cell.column)] = cell
+                self.ws._cells[coord] = MergedCell(self.ws, row=row, column=col)
+                cell = self.ws._cells[coord]
 
             if protected:
                 cell.protection = protection
@@ -0,0 +1,198 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pickle
+
+import pytest
+
+
+@pytest.fixture
+def CellStore():
+    from .._cells import CellStore
+    return CellStore
+
+
+class TestCellStore:
+
+    def test_empty(self, CellStore):
+        cells = CellStore()
+        assert cells.row_bounds is None
+        assert cells.col_bounds is None
+
+
+    def test_add(self, CellStore):
+        cells = CellStore()
+        cells[(5, 3)] = "C5"
+        cells[(2, 7)] = "G2"
+        cells[(5, 3)] = "C5 again"
+        assert cells.row_bounds == (2, 5)
+        assert cells.col_bounds == (3, 7)
+        assert cells._rows == {5:1, 2:1}
+
+
+    def test_remove(self, CellStore):
+        cells = CellStore({(1, 1):"A1", (4, 2):"B4", (4, 6):"F4", (9, 2):"B9"})
+        del cells[(9, 2)]
+        assert cells.row_bounds == (1, 4)
+        cells.pop((4, 6))
+        assert cells.col_bounds == (1, 2)
+        assert cells.pop((4, 6), None) is None
+        cells.popitem()
+        cells.clear()
+        assert cells.row_bounds is None
+        cells.setdefault((3, 3), "C3")
+        assert cells.row_bounds == (3, 3)
+
+
+    def test_copy(self, CellStore):
+        cells = CellStore({(1, 1):"A1", (4, 2):"B4"})
+        for copied in (cells.copy(), pickle.loads(pickle.dumps(cells))):
+            assert copied == cells
+            assert copied.row_bounds == (1, 4)
+            assert copied._cols == {1:1, 2:1}
+
+
+    def test_shift(self, CellStore):
+        from openpyxl import Workbook
+        from .._shift import Shift
+        ws = Workbook().active
+        for coord in ("A1", "B2", "A3", "C4"):
+            ws[coord] = coord
+        ws["C4"].hyperlink = "http://example.com"
+        ws._cells.shift(Shift(4, -2)) # delete rows 2 and 3
+        assert {k: c.value for k, c in ws._cells.items()} == {(1, 1): "A1", (2, 3): "C4"}
+        assert ws["C2"].coordinate == "C2"
+        assert ws["C2"].hyperlink.ref == "C2"
+        assert ws._cells._rows == {1: 1, 2: 1}
+        assert ws._cells._cols == {1: 1, 3: 1}
+        assert ws._cells.col_bounds == (1, 3)
+
+
+def test_worksheet_bounds():
+    from openpyxl import Workbook
+
+    ws = Workbook().active
+    ws["C3"] = 1
+    ws["E10"] = 2
+    assert ws.calculate_dimension() == "C3:E10"
+    del ws["E10"]
+    assert ws.calculate_dimension() == "C3:C3"
+    ws.move_range("C3", rows=2, cols=-1)
+    assert (ws.min_row, ws.min_column, ws.max_row, ws.max_column) == (5, 2, 5, 2)
+    del ws["B5"]
+    assert ws.calculate_dimension() == "A1:A1"
+
+
+class TestColumnarCellStore:
+
+    @pytest.fixture
+    def ws(self):
+        from openpyxl import Workbook
+        wb = Workbook(columnar_cells=True)
+        return wb.active
+
+
+    def test_ctor(self, ws):
+        from .._cells import ColumnarCellStore
+        assert isinstance(ws._cells, ColumnarCellStore)
+        assert len(ws._cells) == 0
+
+
+    def test_cell(self, ws):
+        from openpyxl.cell import Cell
+        ws["B3"] = 5
+        cell = ws["B3"]
+        assert cell == ws.cell(3, 2)
+        assert (cell.value, cell.data_type) == (5, "n")
+        cell.value = "=A1"
+        assert ws["B3"].data_type == "f"
+
+        ws._cells[(1, 1)] = Cell(ws, row=1, column=1, value="text")
+        assert list(ws._cells) == [(1, 1), (3, 2)]
+        assert ws.calculate_dimension() == "A1:B3"
+
+
+    def test_style(self, ws):
+        from openpyxl.styles import Font
+        cell = ws["A1"]
+        assert not cell.has_style
+        cell.font = Font(bold=True)
+        cell.number_format = "0.00"
+        assert ws["A1"].font.b is True
+        assert ws["A1"].number_format == "0.00"
+        assert ws["A1"].has_style
+        assert ws["A1"].style_id == ws.parent._cell_styles.index(ws["A1"]._style)
+
+
+    def test_comment_and_hyperlink(self, ws):
+        from openpyxl.comments import Comment
+        ws["A1"].comment = Comment("Note", "Author")
+        ws["A1"].hyperlink = "http://example.com"
+        assert ws["A1"].comment.text == "Note"
+        assert ws["A1"].value == "http://example.com"
+        ws.move_range("A1", rows=1)
+        assert ws["A2"].hyperlink.target == "http://example.com"
+        assert ws._cells._comments.keys() == {(2, 1)}
+
+
+    @pytest.mark.parametrize("method, idx, amount, expected",
+                             [
+                                 ("insert_rows", 2, 2, {"A1":1, "B4":2, "A5":3, "C6":4}),
+                                 ("delete_rows", 2, 2, {"A1":1, "C2":4}),
+                                 ("insert_cols", 2, 1, {"A1":1, "C2":2, "A3":3, "D4":4}),
+                                 ("delete_cols", 1, 2, {"A4":4}),
+                             ]
+                             )
+    def test_shift(self, ws, method, idx, amount, expected):
+        from openpyxl.comments import Comment
+        for coord, value in (("A1", 1), ("B2", 2), ("A3", 3), ("C4", 4)):
+            ws[coord] = value
+        ws["C4"].hyperlink = "#Sheet!A1"
+        ws["C4"].value = 4
+        ws["C4"].comment = Comment("Note", "Author")
+
+        getattr(ws, method)(idx, amount)
+
+        cells = {c.coordinate: c.value for c in ws._cells.values()}
+        assert cells == expected
+        coord = [k for k, v in expected.items() if v == 4][0]
+        assert ws[coord].hyperlink.ref == coord
+        assert ws[coord].comment.text == "Note"
+        assert len(ws._cells._hyperlinks) == len(ws._cells._comments) == 1
+        rows, cols = zip(*ws._cells)
+        assert ws._cells.row_bounds == (min(rows), max(rows))
+        assert ws._cells.col_bounds == (min(cols), max(cols))
+
+
+    def test_delete(self, ws):
+        ws["A1"] = 1
+        ws["C5"] = 2
+        del ws["C5"]
+        assert (5, 3) not in ws._cells
+        assert ws.calculate_dimension() == "A1:A1"
+        with pytest.raises(KeyError):
+            del ws._cells[(5, 3)]
+
+
+    def test_merged_cells(self, ws):
+        from openpyxl.styles import Border, Side
+        ws["A1"].border = Border(bottom=Side(style="thin"))
+        ws.merge_cells("A1:B2")
+        assert type(ws["B2"]).__name__ == "ColumnarMergedCell"
+        assert ws["B2"].border.bottom.style == "thin"
+        ws.unmerge_cells("A1:B2")
+        assert (2, 2) not in ws._cells
+
+
+    def test_round_trip(self, ws):
+        from io import BytesIO
+        from openpyxl import load_workbook
+        from openpyxl.styles import Font
+        ws.append([1, "two", None, 4.5])
+        ws["B2"].font = Font(italic=True)
+        out = BytesIO()
+        ws.parent.save(out)
+
+        wb = load_workbook(out, columnar_cells=True)
+        ws = wb.active
+        assert list(ws.values) == [(1, "two", None, 4.5), (None, None, None, None)]
+        assert ws["B2"].font.i is True
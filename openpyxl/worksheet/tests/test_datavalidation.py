@@ -161,6 +161,20 @@ class TestDataValidationList:
         assert diff is None, diff
 
 
+    def test_write_xml_failed(self, DataValidationList, DataValidation):
+
+        class BrokenFile:
+
+            def write(self, el):
+                raise IOError("Disk full")
+
+        dv = DataValidation()
+        dvs = DataValidationList(dataValidation=[dv])
+        with pytest.raises(IOError):
+            dvs.write_xml(BrokenFile())
+        assert dvs.dataValidation == [dv]
+
+
 COLLAPSE_TEST_DATA = [
     (
         ["A1"], "A1"
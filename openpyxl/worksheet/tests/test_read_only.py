@@ -176,6 +176,33 @@ class TestReadOnlyWorksheet:
         ]
 
 
+    def test_read_column_window(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        rows = ws.iter_rows(min_row=1, max_row=3, min_col=2, max_col=2, values_only=True)
+        assert list(rows) == [("col2",), (2,), (5,)]
+
+
+    @pytest.mark.numpy_required
+    def test_to_arrays(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        arrays = ws.to_arrays(min_row=2, columns=["A", 3], dtypes={3: "float32"})
+        assert list(arrays) == ["A", 3]
+        assert arrays["A"].dtype == "float64"
+        assert arrays["A"][:3].tolist() == [1, 4, 7]
+        assert arrays["A"][-1] == 7
+        assert len(arrays["A"]) == 9
+        assert arrays[3].dtype == "float32"
+
+
+    @pytest.mark.numpy_required
+    def test_to_arrays_missing_int(self, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        arrays = ws.to_arrays(min_row=2, max_row=4, columns=["A"], dtypes={"A": "int64"})
+        assert arrays["A"].tolist() == [1, 4, 7]
+        with pytest.raises(ValueError, match="column A, row 5"):
+            ws.to_arrays(min_row=2, columns=["A"], dtypes={"A": "int64"})
+
+
     def test_calculate_dimension(self, ReadOnlyWorksheet):
         ws = ReadOnlyWorksheet
         assert ws.calculate_dimension(True) == "A1:C10"
@@ -219,6 +246,152 @@ class TestReadOnlyWorksheet:
         assert src.closed
 
 
+class TestRowIndex:
+
+    src = b"""<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+    <sheetData><row r="1"><c r="A1"><v>1</v></c></row><row spans="1:1" r="3"><c r="A3"><v>3</v></c></row><row r="4"/><row r="7"><c r="A7"><v>7</v></c></row></sheetData>
+    </worksheet>"""
+
+
+    @pytest.fixture
+    def RowIndex(self, monkeypatch):
+        from .._read_only import RowIndex
+        monkeypatch.setattr(RowIndex, "spacing", 1)
+        return RowIndex
+
+
+    @pytest.mark.parametrize("chunk", [1, 5, 16, 1024])
+    def test_checkpoints(self, RowIndex, chunk):
+        index = RowIndex()
+        for idx in range(0, len(self.src), chunk):
+            index.feed(idx, self.src[idx:idx+chunk])
+        index.feed(len(self.src), b"")
+        assert index.complete
+        assert index.rows == [1, 3, 4, 7]
+        assert [self.src[o:o+11] for o in index.offsets] == [
+            b'<row r="1">', b'<row spans=', b'<row r="4"/', b'<row r="7">'
+        ]
+        assert index.header.endswith(b"<sheetData>")
+
+
+    def test_find(self, RowIndex):
+        index = RowIndex()
+        index.feed(0, self.src)
+        assert index.find(5) == (4, self.src.index(b'<row r="4"'))
+        assert index.find(1) == (1, self.src.index(b'<row r="1"'))
+
+
+    def test_find_before_sheet_data(self, RowIndex):
+        index = RowIndex()
+        index.feed(0, self.src[:20])
+        assert index.find(5) is None
+
+
+    def test_overlapping_reads(self, RowIndex):
+        index = RowIndex()
+        index.feed(0, self.src[:200])
+        index.feed(100, self.src[100:])
+        assert index.rows == [1, 3, 4, 7]
+
+
+    def test_implicit_row_numbers(self, RowIndex):
+        src = b"""<x:worksheet xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <x:sheetData><x:row><x:c><x:v>1</x:v></x:c></x:row><x:row/><x:row><x:c><x:v>3</x:v></x:c></x:row></x:sheetData>
+        </x:worksheet>"""
+        index = RowIndex()
+        index.feed(0, src)
+        assert index.rows == [1, 2, 3]
+
+
+    def test_rows_out_of_order(self, RowIndex):
+        src = self.src.replace(b'r="7"', b'r="2"')
+        index = RowIndex()
+        index.feed(0, src)
+        assert index.valid is False
+        assert index.find(5) is None
+
+
+    @pytest.mark.parametrize("markup",
+                             [
+                                 b'<!-- <row r="5"> -->',
+                                 b'<![CDATA[<row r="5">]]>',
+                             ]
+                             )
+    @pytest.mark.parametrize("chunk", [1, 1024])
+    def test_comments(self, RowIndex, markup, chunk):
+        src = self.src.replace(b'<row r="4"/>', b'<row r="4">' + markup + b'</row>')
+        index = RowIndex()
+        for idx in range(0, len(src), chunk):
+            index.feed(idx, src[idx:idx+chunk])
+        assert index.valid is False
+        assert index.find(5) is None
+
+
+    def test_resume_from_checkpoint(self, RowIndex, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        rows = list(ws.iter_rows(min_col=1, max_col=3, values_only=True))
+
+        src, start, shared_formulae = ws._get_indexed_source(10, 3)
+        src.close()
+        assert start == 10
+        assert shared_formulae == {}
+        assert list(ws.iter_rows(min_row=3, max_col=3, values_only=True)) == rows[2:]
+        assert list(ws.iter_rows(min_row=10, max_col=3, values_only=True)) == [(7, 8, 9)]
+        assert ws.cell(row=4, column=2).value == 8
+
+
+    def test_partial_scan(self, RowIndex, ReadOnlyWorksheet):
+        ws = ReadOnlyWorksheet
+        assert ws.cell(row=2, column=1).value == 1
+        assert ws.cell(row=10, column=3).value == 9
+        assert ws._row_index.rows == [1, 2, 3, 4, 10]
+
+
+    @pytest.fixture
+    def SharedFormulaWorksheet(self, DummyWorkbook):
+        from .._read_only import ReadOnlyWorksheet
+        rows = ['<row r="1"><c r="A1"><v>1</v></c><c r="B1"><f t="shared" ref="B1:B20" si="0">A1*2</f><v>2</v></c></row>']
+        for idx in range(2, 21):
+            rows.append(f'<row r="{idx}"><c r="A{idx}"><v>{idx}</v></c><c r="B{idx}"><f t="shared" si="0"/><v>{idx*2}</v></c></row>')
+        xml = ('<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+               '<sheetData>' + "".join(rows) + '</sheetData></worksheet>')
+        DummyWorkbook._archive.writestr("sheet1.xml", xml)
+        return ReadOnlyWorksheet(DummyWorkbook, "Sheet", "sheet1.xml", [])
+
+
+    @pytest.mark.parametrize("values_only", [True, False])
+    def test_resume_with_shared_formulae(self, RowIndex, SharedFormulaWorksheet, values_only):
+        ws = SharedFormulaWorksheet
+        list(ws.iter_rows(values_only=values_only))
+
+        src, start, shared_formulae = ws._get_indexed_source(19, 2)
+        src.close()
+        assert start == 19
+        assert list(shared_formulae) == ["0"]
+
+        rows = ws.iter_rows(min_row=19, max_col=2, values_only=values_only)
+        if not values_only:
+            rows = ([c.value for c in row] for row in rows)
+        assert [tuple(row) for row in rows] == [(19, "=A19*2"), (20, "=A20*2")]
+
+
+    def test_resume_without_shared_formulae(self, RowIndex, SharedFormulaWorksheet):
+        ws = SharedFormulaWorksheet
+        # the master is outside the column window so it isn't found
+        list(ws.iter_rows(max_col=1, values_only=True))
+
+        src, start, shared_formulae = ws._get_indexed_source(19, 2)
+        src.close()
+        assert start is None
+        assert list(ws.iter_rows(min_row=19, values_only=True)) == [(19, "=A19*2"), (20, "=A20*2")]
+
+        ws.parent.data_only = True
+        src, start, shared_formulae = ws._get_indexed_source(19, 2)
+        src.close()
+        assert start == 19
+        assert list(ws.iter_rows(min_row=19, values_only=True)) == [(19, 38), (20, 40)]
+
+
 def test_implementation_compatbility(ReadOnlyWorksheet, DummyWorkbook):
     from ..worksheet import Worksheet
     std = Worksheet(DummyWorkbook)
@@ -482,6 +482,21 @@ class TestWorksheetParser:
         assert formula == "=A12*B12"
 
 
+    def test_shared_formula_master(self, WorkSheetParser):
+        parser = WorkSheetParser
+        xmlns = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+        master = fromstring(f"""
+        <c r="C2" xmlns="{xmlns}">
+          <f t="shared" ref="C2:C10" si="1">SUM(A2:B2)*$A$1&amp;Sheet1!name</f>
+        </c>
+        """)
+        dependent = fromstring(f"""
+        <c r="C5" xmlns="{xmlns}"><f t="shared" si="1"/></c>
+        """)
+        assert parser.parse_formula(master) == "=SUM(A2:B2)*$A$1&Sheet1!name"
+        assert parser.parse_formula(dependent) == "=SUM(A5:B5)*$A$1&Sheet1!name"
+
+
     def test_array_formula(self, WorkSheetParser, datadir):
         parser = WorkSheetParser
 
@@ -650,6 +665,105 @@ class TestWorksheetParser:
             assert expected_cell == cell
 
 
+    def test_row_in_column_window(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.min_col = 2
+        parser.max_col = 4
+        src = """
+        <row r="1" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A1" t="s">
+            <v>9</v>
+          </c>
+          <c>
+            <v>2</v>
+          </c>
+          <c r="D1">
+            <v>4</v>
+          </c>
+          <c r="E1" t="d">
+            <v>invalid</v>
+          </c>
+        </row>
+        """
+        element = fromstring(src)
+        _, cells = parser.parse_row(element)
+        assert cells == [
+            {'column': 2, 'row': 1, 'data_type': 'n', 'value': 2, 'style_id': 0},
+            {'column': 4, 'row': 1, 'data_type': 'n', 'value': 4, 'style_id': 0},
+        ]
+
+
+    def test_shared_formula_outside_window(self, WorkSheetParser):
+        parser = WorkSheetParser
+        parser.min_col = 2
+        src = """
+        <row r="1" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="A1">
+            <f t="shared" si="0" ref="A1:B1">C1*2</f>
+          </c>
+          <c r="B1">
+            <f t="shared" si="0"/>
+          </c>
+        </row>
+        """
+        element = fromstring(src)
+        _, cells = parser.parse_row(element)
+        assert cells == [
+            {'column': 2, 'row': 1, 'data_type': 'f', 'value': '=D1*2', 'style_id': 0},
+        ]
+
+
+    def test_row_values(self, WorkSheetParser):
+        parser = WorkSheetParser
+        src = """
+        <row r="3" xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c r="B3" t="s">
+            <v>0</v>
+          </c>
+          <c r="C3" s="1">
+            <v>41172</v>
+          </c>
+          <c r="E3" t="b">
+            <v>1</v>
+          </c>
+        </row>
+        """
+        element = fromstring(src)
+        row, values = parser.parse_row_values(element)
+        assert row == 3
+        assert values == (None, 'a', datetime.datetime(2012, 9, 20), None, True)
+
+
+    @pytest.mark.parametrize("min_col, max_col, expected",
+                             [
+                                 (2, None, (2, None, 4)),
+                                 (None, 2, (1, 2)),
+                                 (3, 5, (None, 4, None)),
+                                 (5, 6, (None, None)),
+                             ]
+                             )
+    def test_row_values_in_window(self, WorkSheetParser, min_col, max_col, expected):
+        parser = WorkSheetParser
+        parser.min_col = min_col
+        parser.max_col = max_col
+        src = """
+        <row xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+          <c>
+            <v>1</v>
+          </c>
+          <c>
+            <v>2</v>
+          </c>
+          <c r="D1">
+            <v>4</v>
+          </c>
+        </row>
+        """
+        element = fromstring(src)
+        _, values = parser.parse_row_values(element)
+        assert values == expected
+
+
     def test_second_row_cell_index_without_coordinates(self, WorkSheetParser):
         parser = WorkSheetParser
         src = """
@@ -0,0 +1,102 @@
+# Copyright (c) 2010-2024 openpyxl
+
+import pytest
+
+
+@pytest.fixture
+def Shift():
+    from .._shift import Shift
+    return Shift
+
+
+class TestShift:
+
+    @pytest.mark.parametrize("start, offset, idx, expected",
+                             [
+                                 (3, 2, 2, 2),
+                                 (3, 2, 3, 5),
+                                 (5, -2, 2, 2),
+                                 (5, -2, 3, None),
+                                 (5, -2, 4, None),
+                                 (5, -2, 5, 3),
+                             ]
+                             )
+    def test_index(self, Shift, start, offset, idx, expected):
+        assert Shift(start, offset).index(idx) == expected
+
+
+    @pytest.mark.parametrize("start, offset, low, high, expected",
+                             [
+                                 (3, 2, 1, 2, (1, 2)),
+                                 (3, 2, 1, 3, (1, 5)),
+                                 (3, 2, 3, 4, (5, 6)),
+                                 (5, -2, 1, 3, (1, 2)),
+                                 (5, -2, 3, 4, None),
+                                 (5, -2, 4, 8, (3, 6)),
+                                 (5, -2, 1, 8, (1, 6)),
+                             ]
+                             )
+    def test_bounds(self, Shift, start, offset, low, high, expected):
+        assert Shift(start, offset).bounds(low, high) == expected
+
+
+    @pytest.mark.parametrize("rows, ref, expected",
+                             [
+                                 (True, "B3", "B5"),
+                                 (True, "$B$3:$C$4", "$B$5:$C$6"),
+                                 (True, "A1:C3", "A1:C5"),
+                                 (True, "2:4", "2:6"),
+                                 (True, "A:C", "A:C"),
+                                 (True, "A1", "A1"),
+                                 (False, "A:C", "A:E"),
+                                 (False, "$C1", "$E1"),
+                                 (False, "1:3", "1:3"),
+                                 (True, "name", "name"),
+                             ]
+                             )
+    def test_reference_insert(self, Shift, rows, ref, expected):
+        assert Shift(3, 2, rows=rows).reference(ref) == expected
+
+
+    @pytest.mark.parametrize("ref, expected",
+                             [
+                                 ("B3", None),
+                                 ("B5", "B3"),
+                                 ("A3:B4", None),
+                                 ("A2:B10", "A2:B8"),
+                                 ("B10:A2", "B8:A2"),
+                             ]
+                             )
+    def test_reference_delete(self, Shift, ref, expected):
+        assert Shift(5, -2).reference(ref) == expected
+
+
+    def test_cell_range(self, Shift):
+        from ..cell_range import CellRange, MultiCellRange
+        cr = CellRange("B2:D4")
+        assert Shift(3, -1, rows=False).cell_range(cr)
+        assert cr.coord == "B2:C4"
+
+        mcr = MultiCellRange("A1 C3:D4 A10")
+        assert Shift(5, -2).multi_cell_range(mcr)
+        assert mcr == MultiCellRange("A1 A8")
+
+
+@pytest.mark.parametrize("formula, expected",
+                         [
+                             ("=SUM(Sheet!A1:A5)+A5", "=SUM(Sheet!A1:A7)+A5"),
+                             ("='Bob''s'!$A$3", "='Bob''s'!$A$5"),
+                             ("Sheet!$A$1", "Sheet!$A$1"),
+                             ("Sheet!$A$4", "Sheet!$A$6"),
+                             ("Other!A4", "Other!A4"),
+                         ]
+                         )
+def test_shift_formula_insert(Shift, formula, expected):
+    from .._shift import shift_formula
+    title = "Bob's" if "Bob" in formula else "Sheet"
+    assert shift_formula(formula, title, Shift(3, 2)) == expected
+
+
+def test_shift_formula_delete(Shift):
+    from .._shift import shift_formula
+    assert shift_formula("Sheet!$A$3,Sheet!A6", "Sheet", Shift(5, -2)) == "Sheet!#REF!,Sheet!A4"
@@ -88,6 +88,25 @@ class TestWorksheet:
             assert tuple(c.coordinate for c in row) == coord
 
 
+    @pytest.mark.parametrize("values_only, create_cells",
+                             [(True, True), (False, False)])
+    def test_iter_sparse(self, Worksheet, values_only, create_cells):
+        from openpyxl.cell.read_only import EMPTY_CELL
+        ws = Worksheet(Workbook())
+        ws["A1"] = 1
+        ws["C3"] = 3
+
+        rows = list(ws.iter_rows(values_only=values_only, create_cells=create_cells))
+        cols = list(ws.iter_cols(values_only=values_only, create_cells=create_cells))
+        assert len(ws._cells) == 2
+        if not values_only:
+            assert rows[1][1] is EMPTY_CELL
+            rows = [[c.value for c in row] for row in rows]
+            cols = [[c.value for c in col] for col in cols]
+        assert [list(row) for row in rows] == [[1, None, None], [None, None, None], [None, None, 3]]
+        assert [list(col) for col in cols] == [[1, None, None], [None, None, None], [None, None, 3]]
+
+
     def test_cell_alternate_coordinates(self, Worksheet):
         ws = Worksheet(Workbook())
         cell = ws.cell(row=8, column=4)
@@ -544,6 +563,50 @@ def test_add_image(Worksheet):
     ws.add_image(im, "D5")
 
 
+@pytest.mark.parametrize("columnar", [False, True])
+def test_apply_style(Worksheet, columnar):
+    from openpyxl.styles import Font, PatternFill
+    wb = Workbook(columnar_cells=columnar)
+    ws = wb.active
+    ws["A1"].font = Font(italic=True)
+    ws["B2"] = 5
+    bold = Font(bold=True)
+    fill = PatternFill(fill_type="solid", fgColor="FF0000")
+
+    ws.apply_style("A1:C3", font=bold, fill=fill, number_format="0.00")
+
+    assert len(ws._cells) == 9
+    assert ws["B2"].value == 5
+    for row in ws["A1:C3"]:
+        for cell in row:
+            assert cell.font == bold
+            assert cell.fill == fill
+            assert cell.number_format == "0.00"
+    assert ws["A1"].style_id == ws["C3"].style_id
+    assert ws["D4"].has_style is False
+
+
+@pytest.mark.parametrize("cell_range, key", [("2:3", "row"), ("B:C", "col")])
+def test_apply_style_whole_range(Worksheet, cell_range, key):
+    from openpyxl.styles import Font
+    ws = Worksheet(Workbook())
+    ws["A1"] = 1
+    ws["C2"].font = Font(italic=True)
+    bold = Font(bold=True)
+
+    ws.apply_style(cell_range, font=bold)
+
+    assert set(ws._cells) == {(1, 1), (2, 3)}
+    assert ws["C2"].font == bold
+    assert ws["A1"].has_style is False
+    if key == "row":
+        dims = [ws.row_dimensions[2], ws.row_dimensions[3]]
+    else:
+        dims = [ws.column_dimensions["B"], ws.column_dimensions["C"]]
+    for dim in dims:
+        assert dim.font == bold
+
+
 @pytest.fixture
 def dummy_worksheet(Worksheet):
     """
@@ -558,6 +621,24 @@ def dummy_worksheet(Worksheet):
     return ws
 
 
+@pytest.fixture
+def styled_worksheet():
+    """
+    Creates a worksheet A1:H6 in a workbook. Cells have their coordinate as
+    their value, a font size of 10 plus their row and are bold in even
+    columns.
+    """
+    from openpyxl.styles import Font
+    ws = Workbook().active
+
+    for row in ws.iter_rows(max_row=6, max_col=8):
+        for cell in row:
+            cell.value = cell.coordinate
+            cell.font = Font(size=10 + cell.row, bold=cell.column % 2 == 0)
+
+    return ws
+
+
 class TestEditableWorksheet:
 
 
@@ -656,22 +737,6 @@ class TestEditableWorksheet:
         assert ws['B3'].value is None
 
 
-    @pytest.mark.parametrize("idx, offset, max_val, remainder",
-                             [
-                                 (1, 3, 6, {4}),
-                                 (2, 3, 6, {4, 5}),
-                                 (3, 3, 6, {4, 5, 6}),
-                                 (4, 3, 6, {4, 5, 6}),
-                                 (5, 3, 6, {5, 6}),
-                                 (6, 3, 6, {6}),
-                                 (6, 1, 6, {6}),
-                             ]
-                             )
-    def test_remainder(self, dummy_worksheet, idx, offset, max_val, remainder):
-        from ..worksheet import _gutter
-        assert set(_gutter(idx, offset, max_val)) == remainder
-
-
     def test_delete_last_col(self, dummy_worksheet):
         ws = dummy_worksheet
         ws.delete_cols(8)
@@ -695,6 +760,106 @@ class TestEditableWorksheet:
         assert ws['A1'].value is None
 
 
+    def test_insert_rows_merged_cells(self, styled_worksheet):
+        ws = styled_worksheet
+        ws.merge_cells("A2:B3")
+        ws.merge_cells("D5:E6")
+        ws.insert_rows(3)
+        assert set(str(r) for r in ws.merged_cells.ranges) == {"A2:B4", "D6:E7"}
+        assert ws["A2"].value == "A2"
+        assert ws["D6"].value == "D5"
+        assert type(ws["A4"]).__name__ == "MergedCell"
+        assert ws["C2"].font.sz == 12
+        assert ws["C3"].has_style is False
+        assert ws["C7"].font.sz == 16
+        assert ws["F7"].value == "F6"
+
+
+    def test_delete_rows_merged_cells(self, styled_worksheet):
+        ws = styled_worksheet
+        ws.merge_cells("A2:B3")
+        ws.merge_cells("D3:E5")
+        ws.delete_rows(2, 2)
+        assert set(str(r) for r in ws.merged_cells.ranges) == {"D2:E3"}
+        assert ws["D2"].value is None
+        assert type(ws["D2"]).__name__ == "Cell"
+        assert type(ws["E3"]).__name__ == "MergedCell"
+        assert ws["A2"].value == "A4"
+        assert ws["A2"].font.sz == 14
+        assert ws["H4"].font.sz == 16
+
+
+    def test_delete_cols_styles(self, styled_worksheet):
+        ws = styled_worksheet
+        ws.delete_cols(2, 2)
+        assert ws["B1"].value == "D1"
+        assert ws["B1"].font.b is True
+        assert ws["C3"].value == "E3"
+        assert ws["C3"].font.b is False
+        assert ws["C3"].font.sz == 13
+        assert ws.max_column == 6
+
+
+    def test_delete_cols_formatting(self, dummy_worksheet):
+        from openpyxl.formatting.rule import CellIsRule
+        from ..datavalidation import DataValidation
+        ws = dummy_worksheet
+        ws.conditional_formatting.add("B1:D6", CellIsRule(operator="equal", formula=["1"]))
+        ws.conditional_formatting.add("C1", CellIsRule(operator="equal", formula=["2"]))
+        dv = DataValidation(type="whole", sqref="A1 C2:E4")
+        ws.add_data_validation(dv)
+        ws.delete_cols(3)
+        assert [str(cf.sqref) for cf in ws.conditional_formatting] == ["B1:C6"]
+        assert str(dv.sqref) == "A1 C2:D4"
+
+
+    def test_insert_cols_table(self, Worksheet):
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["a", "b", "c"])
+        ws.append([1, 2, 3])
+        table = Table(displayName="Table1", ref="A1:C2")
+        table._initialise_columns()
+        ws.add_table(table)
+        ws.auto_filter.ref = "E1:F4"
+        ws.insert_cols(2)
+        assert table.ref == "A1:D2"
+        assert table.autoFilter.ref == "A1:D2"
+        assert [c.name for c in table.tableColumns] == ["Column1", "Column4", "Column2", "Column3"]
+        assert [c.id for c in table.tableColumns] == [1, 4, 2, 3]
+        assert ws["B1"].value == "Column4"
+        assert ws.auto_filter.ref == "F1:G4"
+
+        ws.delete_cols(1, 2)
+        assert table.ref == "A1:B2"
+        assert [c.name for c in table.tableColumns] == ["Column2", "Column3"]
+        ws.delete_cols(1, 2)
+        assert ws.tables == {}
+
+
+    def test_delete_rows_references(self):
+        from openpyxl.workbook.defined_name import DefinedName
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Data Sheet"
+        other = wb.create_sheet("Other")
+        wb.defined_names["total"] = DefinedName("total", attr_text="'Data Sheet'!$B$2:$B$10")
+        other.defined_names["gone"] = DefinedName("gone", attr_text="'Data Sheet'!$A$3")
+        other.defined_names["local"] = DefinedName("local", attr_text="Other!$A$3")
+        ws.print_area = "A1:D10"
+        ws.print_title_rows = "3:4"
+        ws["A5"].hyperlink = "http://example.com"
+
+        ws.delete_rows(2, 2)
+
+        assert wb.defined_names["total"].value == "'Data Sheet'!$B$2:$B$8"
+        assert other.defined_names["gone"].value == "'Data Sheet'!#REF!"
+        assert other.defined_names["local"].value == "Other!$A$3"
+        assert ws.print_area == "'Data Sheet'!$A$1:$D$8"
+        assert ws.print_title_rows == "$2:$2"
+        assert ws["A3"].hyperlink.ref == "A3"
+
+
     @pytest.mark.parametrize("translate, formula, result",
                              [
                                  (False, "=SUM(G1:G3)", "=SUM(G1:G3)"),
@@ -768,3 +933,74 @@ class TestEditableWorksheet:
         ws['G4'] = "=SUM(G1:G3)"
         ws.move_range("G4", 1, 1, True)
         assert ws['H5'].value == "=SUM(H2:H4)"
+
+
+    def test_move_range_update_references(self):
+        from openpyxl.workbook.defined_name import DefinedName
+        wb = Workbook()
+        ws = wb.active
+        other = wb.create_sheet("Other")
+        ws["A1"] = "=SUM(B2:C3)+B2+D4"
+        ws["B2"] = "=$C$3"
+        other["A1"] = "=Sheet!B2:C3+Other!B2"
+        wb.defined_names["name"] = DefinedName("name", attr_text="Sheet!$C$3")
+
+        ws.move_range("B2:C3", rows=1, cols=2, update_references=True)
+
+        assert ws["A1"].value == "=SUM(D3:E4)+D3+D4"
+        assert ws["D3"].value == "=$E$4"
+        assert other["A1"].value == "=Sheet!D3:E4+Other!B2"
+        assert wb.defined_names["name"].value == "Sheet!$E$4"
+
+
+    def test_move_range_translate_and_update(self, dummy_worksheet):
+        with pytest.raises(ValueError):
+            dummy_worksheet.move_range("A1", 1, translate=True, update_references=True)
+
+
+class TestShiftFormulae:
+
+    @pytest.fixture(params=[False, True])
+    def wb(self, request):
+        return Workbook(columnar_cells=request.param)
+
+
+    def test_insert_rows(self, wb):
+        from openpyxl.worksheet.formula import ArrayFormula
+        ws = wb.active
+        other = wb.create_sheet("Other Sheet")
+        ws["A1"] = "=SUM(A2:A5)*$B$4"
+        ws["A6"] = "=A1+'Other Sheet'!A3"
+        ws["C3"] = ArrayFormula("C3:C4", "=A2:A3*2")
+        other["A1"] = "=Sheet!A3+A3"
+        other["A2"] = 3
+
+        ws.insert_rows(3, 2)
+
+        assert ws["A1"].value == "=SUM(A2:A7)*$B$6"
+        assert ws["A8"].value == "=A1+'Other Sheet'!A3"
+        assert ws["C5"].value.text == "=A2:A5*2"
+        assert ws["C5"].value.ref == "C5:C6"
+        assert other["A1"].value == "=Sheet!A5+A3"
+
+
+    def test_delete_cols(self, wb):
+        ws = wb.active
+        ws["A1"] = "=B1+C1+SUM(B1:D1)"
+        ws.delete_cols(2)
+        assert ws["A1"].value == "=#REF!+B1+SUM(B1:C1)"
+
+
+    def test_formatting(self, wb):
+        from openpyxl.formatting.rule import FormulaRule
+        from ..datavalidation import DataValidation
+        ws = wb.active
+        ws.conditional_formatting.add("A1:A10", FormulaRule(formula=["$B1>$C$5"]))
+        dv = DataValidation(type="list", formula1="$D$4:$D$8", sqref="A1:A10")
+        ws.add_data_validation(dv)
+
+        ws.insert_rows(2)
+
+        cf = list(ws.conditional_formatting)[0]
+        assert cf.rules[0].formula == ["$B1>$C$6"]
+        assert dv.formula1 == "$D$5:$D$9"
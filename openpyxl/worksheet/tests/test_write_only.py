@@ -24,6 +24,8 @@ class DummyWorkbook:
         self.epoch = CALENDAR_WINDOWS_1900
         self.sheetnames = []
         self.iso_dates = False
+        self.share_strings = False
+        self._string_table = None
 
 
 @pytest.fixture
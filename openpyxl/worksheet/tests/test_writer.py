@@ -478,7 +478,7 @@ class TestWorksheetWriter:
         writer.ws.row_dimensions[10] = None
         writer.ws.row_dimensions[2] = None
 
-        assert writer.rows() == [
+        assert list(writer.rows()) == [
             (2, []),
             (10, [writer.ws['A10']])
         ]
@@ -489,7 +489,7 @@ class TestWorksheetWriter:
         for c in ['F1', 'B1', 'A1', 'D1', 'E1', 'C1']:
             ws[c] = 1
 
-        assert writer.rows() == [
+        assert list(writer.rows()) == [
             (1, [ws['A1'], ws['B1'], ws['C1'], ws['D1'], ws['E1'], ws['F1']]),
         ]
 
@@ -526,6 +526,60 @@ class TestWorksheetWriter:
         assert len(writer.ws._comments) == 1
 
 
+    def test_find_shared_formulae(self, writer):
+        ws = writer.ws
+        ws.parent.share_formulae = True
+        for row in range(1, 5):
+            ws.cell(row, 2, f"=A{row}*$A$1")
+        ws["B3"] = "=A3*2"
+        for row in range(5, 8):
+            ws.cell(row, 3, f"=SUM(A{row}:B{row})")
+        ws["D1"] = "=NOW()"
+
+        shared = writer.find_shared_formulae()
+        assert shared == {
+            (1, 2): {"t": "shared", "ref": "B1:B2", "si": "0"},
+            (2, 2): {"t": "shared", "si": "0"},
+            (5, 3): {"t": "shared", "ref": "C5:C7", "si": "1"},
+            (6, 3): {"t": "shared", "si": "1"},
+            (7, 3): {"t": "shared", "si": "1"},
+        }
+
+
+    def test_find_shared_formulae_disabled(self, writer):
+        ws = writer.ws
+        ws["A1"] = "=B1"
+        ws["A2"] = "=B2"
+        assert writer.find_shared_formulae() == {}
+
+
+    def test_write_shared_formulae(self, writer):
+        ws = writer.ws
+        ws.parent.share_formulae = True
+        for row in range(1, 4):
+            ws.cell(row, 1, f"=B{row}+1")
+
+        writer.write_rows()
+        xml = writer.read()
+        expected = """
+        <worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+        <sheetData>
+          <row r="1">
+            <c r="A1"><f t="shared" ref="A1:A3" si="0">B1+1</f><v/></c>
+          </row>
+          <row r="2">
+            <c r="A2"><f t="shared" si="0"/><v/></c>
+          </row>
+          <row r="3">
+            <c r="A3"><f t="shared" si="0"/><v/></c>
+          </row>
+        </sheetData>
+        </worksheet>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
+
+
     def test_write_row(self, writer):
 
         writer.ws['A10'] = 15
@@ -5,7 +5,6 @@
 
 # Python stdlib imports
 from itertools import chain
-from operator import itemgetter
 from inspect import isgenerator
 from warnings import warn
 
@@ -22,15 +21,19 @@ from openpyxl.utils import (
     coordinate_to_tuple,
 )
 from openpyxl.cell import Cell, MergedCell
+from openpyxl.cell.read_only import EMPTY_CELL
 from openpyxl.formatting.formatting import ConditionalFormattingList
+from openpyxl.styles.styleable import restyler
 from openpyxl.packaging.relationship import RelationshipList
 from openpyxl.workbook.child import _WorkbookChild
 from openpyxl.workbook.defined_name import (
     DefinedNameDict,
 )
 
-from openpyxl.formula.translate import Translator
+from openpyxl.formula.translate import translate_formula
 
+from ._cells import CellStore, ColumnarCellStore
+from ._shift import Shift, Move, shift_worksheet, move_references
 from .datavalidation import DataValidationList
 from .page import (
     PrintPageSetup,
@@ -113,7 +116,10 @@ class Worksheet(_WorkbookChild):
                                                  default_factory=self._add_column)
         self.row_breaks = RowBreak()
         self.col_breaks = ColBreak()
-        self._cells = {}
+        if getattr(self.parent, "columnar_cells", False):
+            self._cells = ColumnarCellStore(self)
+        else:
+            self._cells = CellStore()
         self._charts = []
         self._images = []
         self._rels = RelationshipList()
@@ -262,6 +268,14 @@ class Worksheet(_WorkbookChild):
         return self._cells[coordinate]
 
 
+    def _get_cell_or_empty(self, row, column):
+        """
+        Internal method for getting a cell from a worksheet without creating
+        it if it doesn't already exist.
+        """
+        return self._cells.get((row, column), EMPTY_CELL)
+
+
     def _add_cell(self, cell):
         """
         Internal method for adding cell objects.
@@ -335,7 +349,7 @@ class Worksheet(_WorkbookChild):
         """
         min_row = 1
         if self._cells:
-            min_row = min(self._cells)[0]
+            min_row = self._cells.row_bounds[0]
         return min_row
 
 
@@ -347,7 +361,7 @@ class Worksheet(_WorkbookChild):
         """
         max_row = 1
         if self._cells:
-            max_row = max(self._cells)[0]
+            max_row = self._cells.row_bounds[1]
         return max_row
 
 
@@ -359,7 +373,7 @@ class Worksheet(_WorkbookChild):
         """
         min_col = 1
         if self._cells:
-            min_col = min(c[1] for c in self._cells)
+            min_col = self._cells.col_bounds[0]
         return min_col
 
 
@@ -371,7 +385,7 @@ class Worksheet(_WorkbookChild):
         """
         max_col = 1
         if self._cells:
-            max_col = max(c[1] for c in self._cells)
+            max_col = self._cells.col_bounds[1]
         return max_col
 
 
@@ -381,15 +395,8 @@ class Worksheet(_WorkbookChild):
         :rtype: string
         """
         if self._cells:
-            rows = set()
-            cols = set()
-            for row, col in self._cells:
-                rows.add(row)
-                cols.add(col)
-            max_row = max(rows)
-            max_col = max(cols)
-            min_col = min(cols)
-            min_row = min(rows)
+            min_row, max_row = self._cells.row_bounds
+            min_col, max_col = self._cells.col_bounds
         else:
             return "A1:A1"
 
@@ -402,7 +409,7 @@ class Worksheet(_WorkbookChild):
         return self.calculate_dimension()
 
 
-    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False):
+    def iter_rows(self, min_row=None, max_row=None, min_col=None, max_col=None, values_only=False, create_cells=True):
         """
         Produces cells from the worksheet, by row. Specify the iteration range
         using indices of rows and columns.
@@ -426,6 +433,9 @@ class Worksheet(_WorkbookChild):
         :param values_only: whether only cell values should be returned
         :type values_only: bool
 
+        :param create_cells: whether missing cells should be created. If not, they are returned as `EMPTY_CELL`. Cells are never created when only values are returned.
+        :type create_cells: bool
+
         :rtype: generator
         """
 
@@ -438,12 +448,16 @@ class Worksheet(_WorkbookChild):
         max_col = max_col or self.max_column
         max_row = max_row or self.max_row
 
-        return self._cells_by_row(min_col, min_row, max_col, max_row, values_only)
+        return self._cells_by_row(min_col, min_row, max_col, max_row, values_only, create_cells)
+
 
+    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False, create_cells=True):
+        get_cell = self._get_cell_or_empty
+        if create_cells and not values_only:
+            get_cell = self.cell
 
-    def _cells_by_row(self, min_col, min_row, max_col, max_row, values_only=False):
         for row in range(min_row, max_row + 1):
-            cells = (self.cell(row=row, column=column) for column in range(min_col, max_col + 1))
+            cells = (get_cell(row=row, column=column) for column in range(min_col, max_col + 1))
             if values_only:
                 yield tuple(cell.value for cell in cells)
             else:
@@ -469,7 +483,7 @@ class Worksheet(_WorkbookChild):
             yield row
 
 
-    def iter_cols(self, min_col=None, max_col=None, min_row=None, max_row=None, values_only=False):
+    def iter_cols(self, min_col=None, max_col=None, min_row=None, max_row=None, values_only=False, create_cells=True):
         """
         Produces cells from the worksheet, by column. Specify the iteration range
         using indices of rows and columns.
@@ -493,6 +507,9 @@ class Worksheet(_WorkbookChild):
         :param values_only: whether only cell values should be returned
         :type values_only: bool
 
+        :param create_cells: whether missing cells should be created. If not, they are returned as `EMPTY_CELL`. Cells are never created when only values are returned.
+        :type create_cells: bool
+
         :rtype: generator
         """
 
@@ -504,15 +521,19 @@ class Worksheet(_WorkbookChild):
         max_col = max_col or self.max_column
         max_row = max_row or self.max_row
 
-        return self._cells_by_col(min_col, min_row, max_col, max_row, values_only)
+        return self._cells_by_col(min_col, min_row, max_col, max_row, values_only, create_cells)
 
 
-    def _cells_by_col(self, min_col, min_row, max_col, max_row, values_only=False):
+    def _cells_by_col(self, min_col, min_row, max_col, max_row, values_only=False, create_cells=True):
         """
         Get cells by column
         """
+        get_cell = self._get_cell_or_empty
+        if create_cells and not values_only:
+            get_cell = self.cell
+
         for column in range(min_col, max_col+1):
-            cells = (self.cell(row=row, column=column)
+            cells = (get_cell(row=row, column=column)
                         for row in range(min_row, max_row+1))
             if values_only:
                 yield tuple(cell.value for cell in cells)
@@ -638,6 +659,50 @@ class Worksheet(_WorkbookChild):
             del self._cells[(row, col)]
 
 
+    def apply_style(self, cell_range, font=None, fill=None, border=None,
+                    alignment=None, protection=None, number_format=None):
+        """
+        Apply styles to all the cells in a range. Styles not given are left
+        unchanged.
+
+        The resulting style is only worked out once for each distinct style
+        in the range. Whole rows or columns, such as "2:5" or "A:C", are
+        styled using their dimensions so that no cells need to be created
+        for them; only existing cells are restyled.
+        """
+        restyle = restyler(self.parent, font=font, fill=fill, border=border,
+                           alignment=alignment, protection=protection,
+                           number_format=number_format)
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+
+        if min_row is None or min_col is None:
+            if min_row is None:
+                for col in range(min_col, max_col + 1):
+                    dim = self.column_dimensions[get_column_letter(col)]
+                    dim._style_id = restyle(dim._style_id)
+                key, low, high = 1, min_col, max_col
+            else:
+                for row in range(min_row, max_row + 1):
+                    dim = self.row_dimensions[row]
+                    dim._style_id = restyle(dim._style_id)
+                key, low, high = 0, min_row, max_row
+            cells = [c for c in self._cells if low <= c[key] <= high]
+        else:
+            if not 0 < min_row <= max_row < 1048577:
+                raise ValueError(f"Row numbers must be between 1 and 1048576. Range supplied was {cell_range}")
+            cells = ((row, col) for row in range(min_row, max_row + 1)
+                     for col in range(min_col, max_col + 1))
+
+        for row, col in cells:
+            cell = self._cells.get((row, col))
+            if cell is None:
+                cell = Cell(self, row=row, column=col)
+                cell._style_id = restyle(None)
+                self._add_cell(cell)
+            else:
+                cell._style_id = restyle(cell._style_id)
+
+
     def append(self, iterable):
         """Appends a group of values at the bottom of the current sheet.
 
@@ -657,6 +722,7 @@ class Worksheet(_WorkbookChild):
 
         """
         row_idx = self._current_row + 1
+        cells = {}
 
         if (isinstance(iterable, (list, tuple, range))
             or isgenerator(iterable)):
@@ -671,54 +737,41 @@ class Worksheet(_WorkbookChild):
                     cell.row = row_idx
                 else:
                     cell = Cell(self, row=row_idx, column=col_idx, value=content)
-                self._cells[(row_idx, col_idx)] = cell
+                cells[(row_idx, col_idx)] = cell
 
         elif isinstance(iterable, dict):
             for col_idx, content in iterable.items():
                 if isinstance(col_idx, str):
                     col_idx = column_index_from_string(col_idx)
                 cell = Cell(self, row=row_idx, column=col_idx, value=content)
-                self._cells[(row_idx, col_idx)] = cell
+                cells[(row_idx, col_idx)] = cell
 
         else:
             self._invalid_row(iterable)
 
+        self._cells.update(cells)
         self._current_row = row_idx
 
 
     def _move_cells(self, min_row=None, min_col=None, offset=0, row_or_col="row"):
         """
-        Move either rows or columns around by the offset
+        Move either rows or columns around by the offset. Rows or columns
+        which are moved over are deleted.
         """
-        reverse = offset > 0 # start at the end if inserting
-        row_offset = 0
-        col_offset = 0
-
-        # need to make affected ranges contiguous
-        if row_or_col == 'row':
-            cells = self.iter_rows(min_row=min_row)
-            row_offset = offset
-            key = 0
+        if row_or_col == "row":
+            shift = Shift(min_row, offset, rows=True)
         else:
-            cells = self.iter_cols(min_col=min_col)
-            col_offset = offset
-            key = 1
-        cells = list(cells)
-
-        for row, column in sorted(self._cells, key=itemgetter(key), reverse=reverse):
-            if min_row and row < min_row:
-                continue
-            elif min_col and column < min_col:
-                continue
-
-            self._move_cell(row, column, row_offset, col_offset)
+            shift = Shift(min_col, offset, rows=False)
+        self._cells.shift(shift)
+        return shift
 
 
     def insert_rows(self, idx, amount=1):
         """
         Insert row or rows before row==idx
         """
-        self._move_cells(min_row=idx, offset=amount, row_or_col="row")
+        shift = self._move_cells(min_row=idx, offset=amount, row_or_col="row")
+        shift_worksheet(self, shift)
         self._current_row = self.max_row
 
 
@@ -726,25 +779,16 @@ class Worksheet(_WorkbookChild):
         """
         Insert column or columns before col==idx
         """
-        self._move_cells(min_col=idx, offset=amount, row_or_col="column")
+        shift = self._move_cells(min_col=idx, offset=amount, row_or_col="column")
+        shift_worksheet(self, shift)
 
 
     def delete_rows(self, idx, amount=1):
         """
         Delete row or rows from row==idx
         """
-
-        remainder = _gutter(idx, amount, self.max_row)
-
-        self._move_cells(min_row=idx+amount, offset=-amount, row_or_col="row")
-
-        # calculating min and max col is an expensive operation, do it only once
-        min_col = self.min_column
-        max_col = self.max_column + 1
-        for row in remainder:
-            for col in range(min_col, max_col):
-                if (row, col) in self._cells:
-                    del self._cells[row, col]
+        shift = self._move_cells(min_row=idx+amount, offset=-amount, row_or_col="row")
+        shift_worksheet(self, shift)
         self._current_row = self.max_row
         if not self._cells:
             self._current_row = 0
@@ -754,35 +798,34 @@ class Worksheet(_WorkbookChild):
         """
         Delete column or columns from col==idx
         """
+        shift = self._move_cells(min_col=idx+amount, offset=-amount, row_or_col="column")
+        shift_worksheet(self, shift)
 
-        remainder = _gutter(idx, amount, self.max_column)
 
-        self._move_cells(min_col=idx+amount, offset=-amount, row_or_col="column")
-
-        # calculating min and max row is an expensive operation, do it only once
-        min_row = self.min_row
-        max_row = self.max_row + 1
-        for col in remainder:
-            for row in range(min_row, max_row):
-                if (row, col) in self._cells:
-                    del self._cells[row, col]
-
-
-    def move_range(self, cell_range, rows=0, cols=0, translate=False):
+    def move_range(self, cell_range, rows=0, cols=0, translate=False,
+                   update_references=False):
         """
         Move a cell range by the number of rows and/or columns:
         down if rows > 0 and up if rows < 0
         right if cols > 0 and left if cols < 0
         Existing cells will be overwritten.
-        Formulae and references will not be updated.
+        Formulae and references will not be updated unless
+        `update_references` is set, in which case formulae and defined names
+        throughout the workbook that refer to cells in the range are updated
+        to refer to where the cells have moved.
         """
         if isinstance(cell_range, str):
             cell_range = CellRange(cell_range)
         if not isinstance(cell_range, CellRange):
             raise ValueError("Only CellRange objects can be moved")
+        if translate and update_references:
+            raise ValueError("Formulae can either be translated or have their references updated")
         if not rows and not cols:
             return
 
+        if update_references:
+            move_references(self, Move(cell_range, rows, cols))
+
         down = rows > 0
         right = cols > 0
 
@@ -811,9 +854,8 @@ class Worksheet(_WorkbookChild):
         del self._cells[(cell.row, cell.column)]
         cell.row = new_row
         cell.column = new_col
-        if translate and cell.data_type == "f":
-            t = Translator(cell.value, cell.coordinate)
-            cell.value = t.translate_formula(row_delta=row_offset, col_delta=col_offset)
+        if translate and cell.data_type == "f" and isinstance(cell.value, str):
+            cell.value = translate_formula(cell.value, row_delta=row_offset, col_delta=col_offset)
 
 
     def _invalid_row(self, iterable):
@@ -895,13 +937,3 @@ class Worksheet(_WorkbookChild):
             self._print_area = PrintArea.from_string(value)
         elif hasattr(value, "__iter__"):
             self._print_area = PrintArea.from_string(",".join(value))
-
-
-def _gutter(idx, offset, max_val):
-    """
-    When deleting rows and columns are deleted we rely on overwriting.
-    This may not be the case for a large offset on small set of cells:
-    range(cells_to_delete) > range(cell_to_be_moved)
-    """
-    gutter = range(max(max_val+1-offset, idx), min(idx+offset, max_val)+1)
-    return gutter
@@ -2,8 +2,16 @@
 
 
 # Python stdlib imports
+from concurrent.futures import ProcessPoolExecutor
+import copyreg
 import datetime
+from io import BytesIO
+import multiprocessing
+import os
+import pickle
 import re
+from shutil import copyfileobj
+import warnings
 from zipfile import ZipFile, ZIP_DEFLATED
 
 # package imports
@@ -20,7 +28,7 @@ from openpyxl.xml.constants import (
     ARC_WORKBOOK,
     )
 from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
-from openpyxl.xml.functions import tostring, fromstring
+from openpyxl.xml.functions import tostring, fromstring, xmlfile
 from openpyxl.packaging.manifest import Manifest
 from openpyxl.packaging.relationship import (
     get_rels_path,
@@ -28,18 +36,71 @@ from openpyxl.packaging.relationship import (
     Relationship,
 )
 from openpyxl.comments.comment_sheet import CommentSheet
-from openpyxl.styles.stylesheet import write_stylesheet
-from openpyxl.worksheet._writer import WorksheetWriter
+from openpyxl.styles.stylesheet import compact_cell_styles, write_stylesheet
+from openpyxl.worksheet._writer import WorksheetWriter, ALL_TEMP_FILES
 from openpyxl.workbook._writer import WorkbookWriter
+from .strings import SharedStringTable
 from .theme import theme_xml
 
 
+_worker_workbook = None
+
+
+def _init_worker(workbook):
+    global _worker_workbook
+    if isinstance(workbook, bytes):
+        workbook = pickle.loads(workbook)
+    _worker_workbook = workbook
+
+
+def _no_archive():
+    return None
+
+
+def _pickle_workbook(workbook):
+    """
+    Pickle a workbook for worker processes which are not forked. Archives,
+    such as the VBA parts of a workbook loaded with keep_vba, cannot be
+    pickled and aren't needed to write worksheets so they are left out.
+    """
+    out = BytesIO()
+    pickler = pickle.Pickler(out, pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    pickler.dispatch_table[ZipFile] = lambda archive: (_no_archive, ())
+    pickler.dump(workbook)
+    return out.getvalue()
+
+
+def _write_worksheet(idx):
+    """
+    Write a worksheet in a worker process. Everything the worksheet uses must
+    already have been added to the workbook. Returns the file it was written
+    to and what writing changed in the worksheet.
+    """
+    ws = _worker_workbook.worksheets[idx]
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        writer = WorksheetWriter(ws)
+        writer.write()
+    ALL_TEMP_FILES.remove(writer.out) # removed by the main process
+    links = [link.id for link in ws._hyperlinks]
+    tables = [(table._rel_id, table.tableColumns, table.autoFilter)
+              for table in ws.tables.values()]
+    outline = ws.column_dimensions.max_outline
+    warned = [(str(w.message), w.category) for w in caught]
+    return writer.out, writer._rels, links, tables, outline, warned
+
+
 class ExcelWriter:
     """Write a workbook object to an Excel file."""
 
-    def __init__(self, workbook, archive):
+    mp_context = None # multiprocessing context for parallel writing
+
+    def __init__(self, workbook, archive, workers=None):
         self._archive = archive
         self.workbook = workbook
+        self.workers = workers
+        self.pool = None
         self.manifest = Manifest()
         self.vba_modified = set()
         self._tables = []
@@ -74,20 +135,31 @@ class ExcelWriter:
             custom_override = CustomOverride()
             self.manifest.append(custom_override)
 
-        self._write_worksheets()
-        self._write_chartsheets()
-        self._write_images()
-        self._write_charts()
-
-        self._write_external_links()
-
-        stylesheet = write_stylesheet(self.workbook)
-        archive.writestr(ARC_STYLE, tostring(stylesheet))
-
-        writer = WorkbookWriter(self.workbook)
-        archive.writestr(ARC_ROOT_RELS, writer.write_root_rels())
-        archive.writestr(ARC_WORKBOOK, writer.write())
-        archive.writestr(ARC_WORKBOOK_RELS, writer.write_rels())
+        wb = self.workbook
+        if not wb.write_only:
+            compact_cell_styles(wb)
+        if wb.share_strings and wb._string_table is None:
+            wb._string_table = SharedStringTable()
+        try:
+            self._write_worksheets()
+            self._write_shared_strings()
+            self._write_chartsheets()
+            self._write_images()
+            self._write_charts()
+
+            self._write_external_links()
+
+            stylesheet = write_stylesheet(self.workbook)
+            archive.writestr(ARC_STYLE, tostring(stylesheet))
+
+            writer = WorkbookWriter(self.workbook)
+            archive.writestr(ARC_ROOT_RELS, writer.write_root_rels())
+            archive.writestr(ARC_WORKBOOK, writer.write())
+            archive.writestr(ARC_WORKBOOK_RELS, writer.write_rels())
+        finally:
+            if wb._string_table is not None:
+                wb._string_table.close()
+                wb._string_table = None
 
         self._merge_vba()
 
@@ -169,7 +241,9 @@ class ExcelWriter:
         cs = CommentSheet.from_comments(ws._comments)
         self._comments.append(cs)
         cs._id = len(self._comments)
-        self._archive.writestr(cs.path[1:], tostring(cs.to_tree()))
+        with self._archive.open(cs.path[1:], "w", force_zip64=True) as out:
+            with xmlfile(out) as xf:
+                cs.write_xml(xf)
         self.manifest.append(cs)
 
         if ws.legacy_drawing is None or self.workbook.vba_archive is None:
@@ -187,71 +261,159 @@ class ExcelWriter:
         ws._rels.append(comment_rel)
 
 
-    def write_worksheet(self, ws):
+    def write_worksheets_in_parallel(self):
+        """
+        Write worksheets in a pool of worker processes. The styles and
+        strings are added to the workbook beforehand so that the results are
+        the same as when the worksheets are written one after another.
+        Returns futures for the written worksheets, or none if the workbook
+        cannot be sent to the workers.
+        """
+        worksheets = self.workbook.worksheets
+        if (self.workbook.write_only or not self.workers or self.workers < 2
+            or len(worksheets) < 2):
+            return {}
+
+        for ws in worksheets:
+            writer = WorksheetWriter(ws, BytesIO())
+            writer.prepare()
+            writer.close()
+
+        context = self.mp_context or multiprocessing.get_context()
+        workbook = self.workbook
+        if context.get_start_method() != "fork":
+            try:
+                workbook = _pickle_workbook(workbook)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                warnings.warn(f"Worksheets will be written one after another because the workbook cannot be sent to worker processes: {e}")
+                return {}
+
+        self.pool = ProcessPoolExecutor(min(self.workers, len(worksheets)),
+                                        mp_context=context,
+                                        initializer=_init_worker,
+                                        initargs=(workbook,))
+        return {ws:self.pool.submit(_write_worksheet, idx) for idx, ws in enumerate(worksheets)}
+
+
+    def bind_worksheet(self, ws, future):
+        """
+        Add a worksheet written by a worker process
+        """
+        path, rels, links, tables, outline, warned = future.result()
+        for msg, category in warned:
+            warnings.warn(msg, category)
+        ws.sheet_format.outlineLevelCol = ws.column_dimensions.max_outline
+        ws.column_dimensions.max_outline = outline
+        for link, rel_id in zip(ws._hyperlinks, links):
+            link.id = rel_id
+        for table, (rel_id, columns, auto_filter) in zip(ws.tables.values(), tables):
+            table._rel_id = rel_id
+            table.tableColumns = columns
+            table.autoFilter = auto_filter
+        ws._rels = rels
+        # write the member the same way as worksheets written in this process
+        with open(path, "rb") as src:
+            with self._archive.open(ws.path[1:], "w", force_zip64=True) as out:
+                copyfileobj(src, out)
+        self.manifest.append(ws)
+        os.remove(path)
+
+
+    def close_pool(self, futures=()):
+        if self.pool is not None:
+            for future in futures:
+                future.cancel()
+            self.pool.shutdown()
+            self.pool = None
+
+
+    def write_worksheet(self, ws, future=None):
         ws._drawing = SpreadsheetDrawing()
         ws._drawing.charts = ws._charts
         ws._drawing.images = ws._images
+        if future is not None:
+            self.bind_worksheet(ws, future)
+            return
         if self.workbook.write_only:
+            # rows have already been written to a temporary file
             if not ws.closed:
                 ws.close()
             writer = ws._writer
+            self._archive.write(writer.out, ws.path[1:])
+            writer.cleanup()
         else:
-            writer = WorksheetWriter(ws)
-            writer.write()
+            # the size isn't known in advance
+            with self._archive.open(ws.path[1:], "w", force_zip64=True) as out:
+                writer = WorksheetWriter(ws, out)
+                writer.write()
 
         ws._rels = writer._rels
-        self._archive.write(writer.out, ws.path[1:])
         self.manifest.append(ws)
-        writer.cleanup()
 
 
     def _write_worksheets(self):
 
         pivot_caches = set()
+        written = self.write_worksheets_in_parallel()
+        try:
+            for idx, ws in enumerate(self.workbook.worksheets, 1):
+                ws._id = idx
+                self._write_worksheet_parts(ws, written.get(ws), pivot_caches)
+        finally:
+            self.close_pool(written.values())
+
+
+    def _write_worksheet_parts(self, ws, future, pivot_caches):
+        """
+        Write a worksheet and everything related to it
+        """
+        self.write_worksheet(ws, future)
 
-        for idx, ws in enumerate(self.workbook.worksheets, 1):
+        if ws._drawing:
+            self._write_drawing(ws._drawing)
 
-            ws._id = idx
-            self.write_worksheet(ws)
+            for r in ws._rels:
+                if "drawing" in r.Type:
+                    r.Target = ws._drawing.path
 
-            if ws._drawing:
-                self._write_drawing(ws._drawing)
+        if ws._comments:
+            self._write_comment(ws)
 
-                for r in ws._rels:
-                    if "drawing" in r.Type:
-                        r.Target = ws._drawing.path
+        if ws.legacy_drawing is not None:
+            shape_rel = Relationship(type="vmlDrawing", Id="anysvml",
+                                     Target="/" + ws.legacy_drawing)
+            ws._rels.append(shape_rel)
 
-            if ws._comments:
-                self._write_comment(ws)
+        for t in ws._tables.values():
+            self._tables.append(t)
+            t.id = len(self._tables)
+            t._write(self._archive)
+            self.manifest.append(t)
+            ws._rels.get(t._rel_id).Target = t.path
 
-            if ws.legacy_drawing is not None:
-                shape_rel = Relationship(type="vmlDrawing", Id="anysvml",
-                                         Target="/" + ws.legacy_drawing)
-                ws._rels.append(shape_rel)
+        for p in ws._pivots:
+            if p.cache not in pivot_caches:
+                pivot_caches.add(p.cache)
+                p.cache._id = len(pivot_caches)
 
-            for t in ws._tables.values():
-                self._tables.append(t)
-                t.id = len(self._tables)
-                t._write(self._archive)
-                self.manifest.append(t)
-                ws._rels.get(t._rel_id).Target = t.path
+            self._pivots.append(p)
+            p._id = len(self._pivots)
+            p._write(self._archive, self.manifest)
+            self.workbook._pivots.append(p)
+            r = Relationship(Type=p.rel_type, Target=p.path)
+            ws._rels.append(r)
 
-            for p in ws._pivots:
-                if p.cache not in pivot_caches:
-                    pivot_caches.add(p.cache)
-                    p.cache._id = len(pivot_caches)
+        if ws._rels:
+            tree = ws._rels.to_tree()
+            rels_path = get_rels_path(ws.path)[1:]
+            self._archive.writestr(rels_path, tostring(tree))
 
-                self._pivots.append(p)
-                p._id = len(self._pivots)
-                p._write(self._archive, self.manifest)
-                self.workbook._pivots.append(p)
-                r = Relationship(Type=p.rel_type, Target=p.path)
-                ws._rels.append(r)
 
-            if ws._rels:
-                tree = ws._rels.to_tree()
-                rels_path = get_rels_path(ws.path)[1:]
-                self._archive.writestr(rels_path, tostring(tree))
+    def _write_shared_strings(self):
+        strings = self.workbook._string_table
+        if strings:
+            strings.write(self._archive)
+            self.manifest.append(strings)
 
 
     def _write_external_links(self):
@@ -276,7 +438,7 @@ class ExcelWriter:
         self._archive.close()
 
 
-def save_workbook(workbook, filename):
+def save_workbook(workbook, filename, workers=None):
     """Save the given workbook on the filesystem under the name filename.
 
     :param workbook: the workbook to save
@@ -285,11 +447,14 @@ def save_workbook(workbook, filename):
     :param filename: the path to which save the workbook
     :type filename: string
 
+    :param workers: number of processes to use to write worksheets in parallel
+    :type workers: int
+
     :rtype: bool
 
     """
     archive = ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
     workbook.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(tzinfo=None)
-    writer = ExcelWriter(workbook, archive)
+    writer = ExcelWriter(workbook, archive, workers)
     writer.save()
     return True
@@ -0,0 +1,87 @@
+# Copyright (c) 2010-2024 openpyxl
+
+"""
+Shared strings table for workbooks being written
+"""
+
+from tempfile import SpooledTemporaryFile
+from xml.sax.saxutils import escape
+from zipfile import ZIP64_LIMIT
+
+from openpyxl.xml.constants import ARC_SHARED_STRINGS, SHARED_STRINGS, SHEET_MAIN_NS
+
+
+def _serialise(value):
+    text = escape(value).replace("\r", "&#13;")
+    if value != value.strip():
+        return f'<si><t xml:space="preserve">{text}</t></si>'.encode("utf-8")
+    return f"<si><t>{text}</t></si>".encode("utf-8")
+
+
+class SharedStringTable:
+
+    """
+    Interning table for the strings of a workbook.
+
+    Strings are serialised as they are added and spooled to disk once the
+    table gets large. After max_size unique strings have been added, new
+    strings are no longer shared so that memory use is bounded.
+    """
+
+    path = "/" + ARC_SHARED_STRINGS
+    mime_type = SHARED_STRINGS
+
+    def __init__(self, max_size=1 << 20, spool_size=1 << 22):
+        self.max_size = max_size
+        self.count = 0
+        self._ids = {}
+        self._out = SpooledTemporaryFile(max_size=spool_size)
+
+
+    def __len__(self):
+        return len(self._ids)
+
+
+    def add(self, value):
+        """
+        Return the index of the string in the table or None if it is not
+        shared.
+        """
+        idx = self._ids.get(value)
+        if idx is None:
+            if len(self._ids) >= self.max_size or "x005F_" in value:
+                # escaped characters would be changed when the table is read
+                return
+            idx = self._ids[value] = len(self._ids)
+            self._out.write(_serialise(value))
+        self.count += 1
+        return idx
+
+
+    def write(self, archive):
+        """
+        Write the table to the archive
+        """
+        size = self._out.tell()
+        self._out.seek(0)
+        header = f"""<sst xmlns="{SHEET_MAIN_NS}" count="{self.count}" uniqueCount="{len(self)}">"""
+        with archive.open(self.path[1:], "w", force_zip64=size > ZIP64_LIMIT) as dest:
+            dest.write(header.encode("utf-8"))
+            while True:
+                chunk = self._out.read(1 << 20)
+                if not chunk:
+                    break
+                dest.write(chunk)
+            dest.write(b"</sst>")
+
+
+    def __getstate__(self):
+        # other processes only need the ids
+        state = self.__dict__.copy()
+        state["_out"] = None
+        return state
+
+
+    def close(self):
+        if self._out is not None:
+            self._out.close()
@@ -39,6 +39,23 @@ def test_worksheet(ExcelWriter, archive):
     assert ws.path in writer.manifest.filenames
 
 
+def test_worksheet_streamed(ExcelWriter, archive, monkeypatch):
+    from openpyxl.worksheet import _writer
+
+    def fail(suffix=''):
+        raise AssertionError("Temporary file created")
+    monkeypatch.setattr(_writer, "create_temporary_file", fail)
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append([1, 2, 3])
+    writer = ExcelWriter(wb, archive)
+    writer._write_worksheets()
+
+    xml = archive.read(ws.path[1:])
+    assert b"<sheetData><row" in xml
+
+
 def test_tables(ExcelWriter, archive):
     wb = Workbook()
     ws = wb.active
@@ -194,3 +211,115 @@ def test_modified(tmpdir):
     dest_filename = 'empty_book.xlsx'
     save_workbook(wb, dest_filename)
     assert wb.properties.modified > modified
+
+
+@pytest.mark.parametrize("write_only", [False, True])
+@pytest.mark.parametrize("share_strings", [False, True])
+def test_shared_strings(write_only, share_strings):
+    from openpyxl import load_workbook
+    from openpyxl.xml.constants import ARC_SHARED_STRINGS
+
+    wb = Workbook(write_only=write_only, share_strings=share_strings)
+    ws = wb.create_sheet() if write_only else wb.active
+    values = [["United States", " padded ", "a & b"], ["United States", "", "x005F_"]]
+    for row in values:
+        ws.append(row)
+
+    out = BytesIO()
+    wb.save(out)
+
+    assert (ARC_SHARED_STRINGS in ZipFile(out).namelist()) is share_strings
+    assert wb._string_table is None
+    wb = load_workbook(out)
+    expected = [["United States", " padded ", "a & b"], ["United States", None, "x005F_"]]
+    assert [list(row) for row in wb.active.values] == expected
+
+
+def test_save_in_parallel(monkeypatch):
+    import datetime
+    import time
+    import types
+    import zipfile
+    from openpyxl.styles import Font
+
+    # fix the modification times of the workbook and the archive members
+    class FixedDatetime(datetime.datetime):
+
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2024, 1, 1, tzinfo=tz)
+
+    monkeypatch.setattr("openpyxl.writer.excel.datetime",
+                        types.SimpleNamespace(datetime=FixedDatetime, timezone=datetime.timezone))
+    monkeypatch.setattr(zipfile, "time",
+                        types.SimpleNamespace(time=lambda: 1704067200, localtime=time.gmtime))
+
+    def save(workers):
+        wb = Workbook()
+        for idx in range(3):
+            ws = wb.active if idx == 0 else wb.create_sheet()
+            for row in range(1, 20):
+                ws.append([row, f"Sheet {idx} row {row}", "shared"])
+            ws["A1"].font = Font(bold=True, size=10 + idx)
+            ws["B2"].comment = Comment(f"Comment {idx}", "Author")
+            ws["C3"].hyperlink = f"http://example.com/{idx}"
+            ws.add_table(Table(displayName=f"Table{idx}", ref="A1:C5"))
+        out = BytesIO()
+        wb.save(out, workers=workers)
+        return out.getvalue()
+
+    assert save(2) == save(None)
+
+
+def test_save_in_parallel_with_spawn(monkeypatch, datadir):
+    import multiprocessing
+    from openpyxl import load_workbook
+    from openpyxl.writer.excel import ExcelWriter
+
+    monkeypatch.setattr(ExcelWriter, "mp_context", multiprocessing.get_context("spawn"))
+    datadir.chdir()
+    wb = load_workbook("vba+comments.xlsm", keep_vba=True)
+    wb.create_sheet()["A1"] = "new"
+    expected = [[list(row) for row in ws.values] for ws in wb]
+
+    out = BytesIO()
+    wb.save(out, workers=2)
+    wb = load_workbook(out, keep_vba=True)
+    assert [[list(row) for row in ws.values] for ws in wb] == expected
+    assert "xl/vbaProject.bin" in wb.vba_archive.namelist()
+
+
+def test_save_in_parallel_unpicklable(monkeypatch):
+    import multiprocessing
+    import threading
+    from openpyxl.writer.excel import ExcelWriter
+
+    monkeypatch.setattr(ExcelWriter, "mp_context", multiprocessing.get_context("spawn"))
+    wb = Workbook()
+    wb.create_sheet()
+    wb.active["A1"] = 1
+    wb.lock = threading.Lock()
+
+    out = BytesIO()
+    with pytest.warns(UserWarning, match="one after another"):
+        wb.save(out, workers=2)
+    assert ZipFile(out).read("xl/worksheets/sheet1.xml")
+
+
+def test_shared_formulae():
+    from openpyxl import load_workbook
+
+    wb = Workbook(share_formulae=True)
+    ws = wb.active
+    for row in range(1, 6):
+        ws.append([row, f"=A{row}*2", f"=SUM($A$1:A{row})", "=NOW()"])
+    ws["C4"] = "=A4"
+
+    out = BytesIO()
+    wb.save(out)
+
+    xml = ZipFile(out).read("xl/worksheets/sheet1.xml")
+    assert xml.count(b'ref="B1:B5"') == 1
+    expected = [list(row) for row in ws.values]
+    wb = load_workbook(out)
+    assert [list(row) for row in wb.active.values] == expected
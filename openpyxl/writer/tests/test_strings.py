@@ -0,0 +1,58 @@
+# Copyright (c) 2010-2024 openpyxl
+
+from io import BytesIO
+from zipfile import ZipFile
+
+import pytest
+
+from openpyxl.tests.helper import compare_xml
+
+
+@pytest.fixture
+def SharedStringTable():
+    from ..strings import SharedStringTable
+    return SharedStringTable
+
+
+class TestSharedStringTable:
+
+    def test_add(self, SharedStringTable):
+        table = SharedStringTable()
+        assert table.add("a") == 0
+        assert table.add("b") == 1
+        assert table.add("a") == 0
+        assert len(table) == 2
+        assert table.count == 3
+
+
+    def test_escaped(self, SharedStringTable):
+        table = SharedStringTable()
+        assert table.add("_x005F_x0041_") is None
+        assert len(table) == 0
+
+
+    def test_max_size(self, SharedStringTable):
+        table = SharedStringTable(max_size=1)
+        assert table.add("a") == 0
+        assert table.add("b") is None
+        assert table.add("a") == 0
+
+
+    def test_write(self, SharedStringTable):
+        table = SharedStringTable(spool_size=10)
+        for value in ["a < b", " padded ", "a < b"]:
+            table.add(value)
+        out = BytesIO()
+        with ZipFile(out, "w") as archive:
+            table.write(archive)
+        table.close()
+
+        xml = ZipFile(out).read("xl/sharedStrings.xml")
+        expected = """
+        <sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="3" uniqueCount="2">
+          <si><t>a &lt; b</t></si>
+          <si><t xml:space="preserve"> padded </t></si>
+        </sst>
+        """
+        diff = compare_xml(xml, expected)
+        assert diff is None, diff
@@ -26,6 +26,13 @@ def lxml_env_set():
 LXML = lxml_available() and lxml_env_set()
 
 
+def lxml_iterparse_env_set():
+    return os.environ.get("OPENPYXL_LXML_ITERPARSE", "False") == "True"
+
+
+LXML_ITERPARSE = LXML and lxml_iterparse_env_set()
+
+
 def defusedxml_available():
     try:
         import defusedxml # noqa
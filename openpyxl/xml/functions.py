@@ -7,8 +7,10 @@ XML compatibility functions
 # Python stdlib imports
 import re
 from functools import partial
+from itertools import chain
 
 from openpyxl import DEFUSEDXML, LXML
+from openpyxl.xml import LXML_ITERPARSE
 
 if LXML is True:
     from lxml.etree import (
@@ -37,9 +39,41 @@ else:
     if DEFUSEDXML is True:
         from defusedxml.ElementTree import fromstring
 
-from xml.etree.ElementTree import iterparse
-if DEFUSEDXML is True:
-    from defusedxml.ElementTree import iterparse
+if LXML_ITERPARSE is True:
+    from lxml.etree import iterparse as _iterparse
+
+    def iterparse(source, events=("end",), tag=None):
+        """
+        Incrementally parse a document with lxml. Entities are not resolved,
+        there is no network access and documents with a DTD are rejected.
+        Tag can be a tag or a sequence of tags of the elements to return.
+        """
+        it = _iterparse(source, events=events, tag=tag,
+                        resolve_entities=False, no_network=True, load_dtd=False,
+                        huge_tree=False)
+        for event, element in it:
+            if element.getroottree().docinfo.internalDTD is not None:
+                raise ValueError("Documents with a DTD are not supported")
+            return chain([(event, element)], it)
+        return iter(())
+
+else:
+    from xml.etree.ElementTree import iterparse as _iterparse
+    if DEFUSEDXML is True:
+        from defusedxml.ElementTree import iterparse as _iterparse
+
+    def iterparse(source, events=("end",), tag=None):
+        """
+        Incrementally parse a document.
+        Tag can be a tag or a sequence of tags of the elements to return.
+        """
+        it = _iterparse(source, events=events)
+        if tag is None:
+            return it
+        if isinstance(tag, str):
+            tag = (tag,)
+        tags = set(tag)
+        return ((event, element) for event, element in it if element.tag in tags)
 
 from openpyxl.xml.constants import (
     CHART_NS,
@@ -72,6 +72,27 @@ def test_iterparse(xml_input):
         fromstring(f)
 
 
+@pytest.mark.lxml_iterparse_required
+@pytest.mark.parametrize("xml_input", vulnerable_xml_strings)
+def test_lxml_iterparse(xml_input):
+    f = BytesIO(xml_input)
+    with pytest.raises((ValueError, SyntaxError)):
+        list(iterparse(f))
+
+
+@pytest.mark.parametrize("tag, expected",
+                         [
+                             (None, ["{ns}c", "{ns}c", "{ns}b", "{ns}c", "{ns}a"]),
+                             ("{ns}b", ["{ns}b"]),
+                             (("{ns}b", "{ns}a"), ["{ns}b", "{ns}a"]),
+                         ]
+                         )
+def test_iterparse_tag(tag, expected):
+    f = BytesIO(b"<a xmlns='ns'><b><c/><c/></b><c/></a>")
+    tags = [el.tag for _, el in iterparse(f, tag=tag)]
+    assert tags == expected
+
+
 from ..functions import Element, whitespace, XML_NS
 
 